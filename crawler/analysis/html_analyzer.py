@@ -1,38 +1,138 @@
 """
 웹사이트 HTML 구조 분석 모듈
+브라우저(Selenium)로 렌더링한 페이지 또는 저장/정적 요청한 HTML(lxml, 브라우저 없음)을 같은 방식으로 분석합니다.
 """
 import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import sys
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin
+
+import lxml.html
+from w3lib.encoding import html_body_declared_encoding, http_content_type_encoding, read_bom
+
+# 스크립트로 직접 실행하는 경우에도 공통 모듈을 찾을 수 있도록 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from common.waits import wait_for_network_idle
+from common.webdriver_factory import create_chrome_driver
+
+# get_attribute()가 절대 URL로 반환하는 속성 (WebElement와 같게)
+URL_ATTRIBUTES = {'href', 'src', 'action'}
+
+
+class StaticElement:
+    """
+    lxml 요소를 WebElement처럼 사용하는 어댑터 (_analyze_* 메소드에서 쓰는 기능만 제공)
+    """
+    def __init__(self, element, base_url=None):
+        self.element = element
+        self.base_url = base_url
+    
+    @property
+    def tag_name(self):
+        return self.element.tag
+    
+    @property
+    def text(self):
+        # 브라우저의 표시 텍스트와 비슷하게 공백 정리
+        return ' '.join(self.element.text_content().split())
+    
+    def get_attribute(self, name):
+        value = self.element.get(name)
+        if value is None:
+            # class/id는 WebElement처럼 빈 문자열 반환
+            return '' if name in ('class', 'id') else None
+        if name in URL_ATTRIBUTES and self.base_url:
+            return urljoin(self.base_url, value)
+        return value
+    
+    def find_elements(self, by, value):
+        if by == By.CSS_SELECTOR:
+            elements = self.element.cssselect(value)
+        elif by == By.XPATH:
+            elements = self.element.xpath(value)
+        elif by == By.TAG_NAME:
+            elements = self.element.iterdescendants(value)
+        else:
+            raise ValueError(f"지원하지 않는 검색 방식: {by}")
+        # WebElement처럼 하위 요소만 반환 (cssselect는 자기 자신도 포함)
+        return [
+            StaticElement(element, self.base_url) for element in elements
+            if isinstance(element.tag, str) and element is not self.element
+        ]
+
+
+def detect_encoding(body, content_type=None):
+    """HTML 바이트의 인코딩 (BOM, Content-Type, meta 선언 순, 없으면 UTF-8)"""
+    bom_encoding, _ = read_bom(body)
+    return (
+        bom_encoding
+        or http_content_type_encoding(content_type)
+        or html_body_declared_encoding(body)
+        or 'utf-8'
+    )
+
+
+class StaticPage(StaticElement):
+    """저장되거나 정적으로 요청한 HTML 문서 (WebDriver의 title/find_elements 대신 사용)"""
+    def __init__(self, html, base_url=None, content_type=None):
+        # 바이트는 선언된 인코딩으로 해석 (선언이 없으면 lxml 기본값 latin-1 대신 UTF-8)
+        parser = None
+        if isinstance(html, bytes):
+            parser = lxml.html.HTMLParser(encoding=detect_encoding(html, content_type))
+        document = lxml.html.fromstring(html, parser=parser)
+        super().__init__(document.getroottree().getroot(), base_url)
+    
+    @property
+    def title(self):
+        return ' '.join((self.element.findtext('.//title') or '').split())
+
+
+def load_static_page(source, base_url=None, user_agent=None, timeout=10):
+    """
+    파일 경로 또는 URL에서 HTML을 읽어 StaticPage 생성
+    
+    Returns:
+        tuple: (StaticPage, 기준 URL)
+    """
+    if str(source).startswith(('http://', 'https://')):
+        response = requests.get(source, timeout=timeout, headers={'User-Agent': user_agent} if user_agent else None)
+        response.raise_for_status()
+        base_url = base_url or response.url
+        return StaticPage(response.content, base_url, response.headers.get('Content-Type')), base_url
+    
+    path = Path(source)
+    base_url = base_url or path.resolve().as_uri()
+    return StaticPage(path.read_bytes(), base_url), base_url
+
 
 class HTMLAnalyzer:
     """
     웹사이트 HTML 구조를 분석하는 클래스
     """
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, offline=False):
         """
         HTMLAnalyzer 초기화
         
         Args:
             headless (bool): 헤드리스 모드 사용 여부
+            offline (bool): 브라우저 없이 정적 HTML을 lxml로 분석 (JavaScript로 그리는 요소는 제외)
         """
-        # 셀레니움 설정
-        self.chrome_options = Options()
-        if headless:
-            self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--window-size=1920,1080")
-        self.chrome_options.add_argument("--disable-popup-blocking")
-        self.chrome_options.add_argument("--disable-notifications")
-        self.chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3")
+        self.offline = offline
+        # 셀레니움 설정 (공통 드라이버 팩토리 사용, CSS는 유지하여 실제 레이아웃 기준으로 분석)
+        self.headless = headless
+        self.driver_arguments = [
+            "--disable-popup-blocking",
+            "--disable-notifications",
+        ]
+        self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
         
         # 결과 저장 경로
         self.results_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'analysis', 'results', 'html')
@@ -44,63 +144,31 @@ class HTMLAnalyzer:
         
         Args:
             url (str): 분석할 웹사이트 URL
-            wait_time (int): 페이지 로딩 대기 시간(초)
+            wait_time (int): 페이지 로딩 최대 대기 시간(초)
             
         Returns:
             dict: 분석 결과
         """
         print(f"URL 분석: {url}")
         
+        if self.offline:
+            return self.analyze_static(url)
+        
         # 드라이버 초기화
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=self.chrome_options)
+        driver = create_chrome_driver(
+            headless=self.headless,
+            block_profile='layout',
+            user_agent=self.user_agent,
+            extra_arguments=self.driver_arguments,
+            use_webdriver_manager=True
+        )
         
         try:
             # 페이지 로딩
             driver.get(url)
-            time.sleep(wait_time)  # 페이지 로딩 대기
-            
-            # HTML 구조 분석 결과
-            result = {
-                "url": url,
-                "title": driver.title,
-                "timestamp": datetime.now().isoformat(),
-                "elements": {}
-            }
-            
-            # 테이블 확인
-            tables = driver.find_elements(By.CSS_SELECTOR, "table")
-            result["elements"]["tables"] = {
-                "count": len(tables),
-                "details": self._analyze_tables(tables)
-            }
-            
-            # 폼 확인
-            forms = driver.find_elements(By.CSS_SELECTOR, "form")
-            result["elements"]["forms"] = {
-                "count": len(forms),
-                "details": self._analyze_forms(forms)
-            }
+            wait_for_network_idle(driver, wait_time)  # 페이지 로딩 대기 (네트워크 유휴까지)
             
-            # 리스트 확인
-            lists = driver.find_elements(By.CSS_SELECTOR, "ul, ol")
-            result["elements"]["lists"] = {
-                "count": len(lists),
-                "details": self._analyze_lists(lists)
-            }
-            
-            # iframe 확인
-            iframes = driver.find_elements(By.CSS_SELECTOR, "iframe")
-            result["elements"]["iframes"] = {
-                "count": len(iframes),
-                "details": self._analyze_iframes(iframes)
-            }
-            
-            # 페이지네이션 확인
-            paginations = driver.find_elements(By.CSS_SELECTOR, ".pagination, .paging, nav ul li a")
-            result["elements"]["pagination"] = {
-                "count": len(paginations),
-                "details": self._analyze_pagination(paginations)
-            }
+            result = self._analyze_page(driver, url)
             
             # 결과 저장
             self._save_result(result, url)
@@ -110,6 +178,76 @@ class HTMLAnalyzer:
         finally:
             driver.quit()
     
+    def analyze_static(self, source, base_url=None, save=True):
+        """
+        저장된 HTML 파일 또는 URL(정적 요청)을 브라우저 없이 분석
+        
+        Args:
+            source (str): HTML 파일 경로 또는 URL
+            base_url (str): 상대 링크 기준 URL (파일 분석 시 원래 페이지 URL)
+            save (bool): 결과 파일 저장 여부
+            
+        Returns:
+            dict: 분석 결과 (브라우저 분석과 같은 형식, mode: 'static')
+        """
+        page, base_url = load_static_page(source, base_url, self.user_agent)
+        result = self._analyze_page(page, base_url)
+        result["mode"] = "static"
+        result["source"] = str(source)
+        
+        if save:
+            self._save_result(result, base_url)
+        return result
+    
+    def _analyze_page(self, page, url):
+        """
+        페이지 구조 분석 (page: WebDriver 또는 StaticPage)
+        """
+        # HTML 구조 분석 결과
+        result = {
+            "url": url,
+            "title": page.title,
+            "timestamp": datetime.now().isoformat(),
+            "elements": {}
+        }
+        
+        # 테이블 확인
+        tables = page.find_elements(By.CSS_SELECTOR, "table")
+        result["elements"]["tables"] = {
+            "count": len(tables),
+            "details": self._analyze_tables(tables)
+        }
+        
+        # 폼 확인
+        forms = page.find_elements(By.CSS_SELECTOR, "form")
+        result["elements"]["forms"] = {
+            "count": len(forms),
+            "details": self._analyze_forms(forms)
+        }
+        
+        # 리스트 확인
+        lists = page.find_elements(By.CSS_SELECTOR, "ul, ol")
+        result["elements"]["lists"] = {
+            "count": len(lists),
+            "details": self._analyze_lists(lists)
+        }
+        
+        # iframe 확인
+        iframes = page.find_elements(By.CSS_SELECTOR, "iframe")
+        result["elements"]["iframes"] = {
+            "count": len(iframes),
+            "details": self._analyze_iframes(iframes)
+        }
+        
+        # 페이지네이션 확인
+        paginations = page.find_elements(By.CSS_SELECTOR, ".pagination, .paging, nav ul li a")
+        result["elements"]["pagination"] = {
+            "count": len(paginations),
+            "details": self._analyze_pagination(paginations)
+        }
+        
+        return result
+    
     def _analyze_tables(self, tables):
         """테이블 분석"""
         table_details = []
@@ -204,11 +342,11 @@ class HTMLAnalyzer:
     
     def _save_result(self, result, url):
         """분석 결과 저장"""
-        # URL에서 파일명 생성
+        # URL에서 파일명 생성 (파일 분석은 파일 이름, 일괄 분석 시 같은 초에 저장해도 겹치지 않게 마이크로초 포함)
         from urllib.parse import urlparse
         parsed_url = urlparse(url)
-        domain = parsed_url.netloc.replace(".", "_")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        domain = (parsed_url.netloc or Path(parsed_url.path).stem).replace(".", "_")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"{domain}_{timestamp}.json"
         
         # 결과 저장
@@ -219,19 +357,75 @@ class HTMLAnalyzer:
         print(f"분석 결과가 {filepath}에 저장되었습니다.")
 
 
+def analyze_static_source(source, save=True):
+    """
+    일괄 분석 작업 (프로세스 풀에서 실행, 실패해도 다른 페이지 분석은 계속)
+    
+    Returns:
+        dict: 요약 {'source', 'title', 요소 유형별 개수, 'error'}
+    """
+    try:
+        result = HTMLAnalyzer(offline=True).analyze_static(source, save=save)
+    except Exception as e:
+        return {"source": source, "error": str(e)}
+    
+    summary = {"source": source, "title": result["title"]}
+    for name, element in result["elements"].items():
+        summary[name] = element["count"]
+    return summary
+
+
+def analyze_static_batch(sources, workers=None, save=True):
+    """
+    여러 HTML 파일/URL을 프로세스 풀에서 브라우저 없이 분석
+    
+    Returns:
+        list: 입력 순서대로 analyze_static_source 요약
+    """
+    sources = list(sources)
+    if workers == 1 or len(sources) <= 1:
+        return [analyze_static_source(source, save) for source in sources]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze_static_source, sources, [save] * len(sources), chunksize=8))
+
+
 def main():
     """메인 함수"""
     import argparse
     
     parser = argparse.ArgumentParser(description='웹사이트 HTML 구조 분석')
-    parser.add_argument('url', help='분석할 웹사이트 URL')
+    parser.add_argument('sources', nargs='*', help='분석할 웹사이트 URL (--offline이면 HTML 파일 경로도 가능)')
     parser.add_argument('--headless', action='store_true', help='헤드리스 모드 사용')
-    parser.add_argument('--wait', type=int, default=5, help='페이지 로딩 대기 시간(초)')
+    parser.add_argument('--wait', type=int, default=5, help='페이지 로딩 최대 대기 시간(초)')
+    parser.add_argument('--offline', action='store_true', help='브라우저 없이 저장/정적 HTML을 lxml로 분석')
+    parser.add_argument('--input-list', help='분석할 URL/파일 목록 파일 (한 줄에 하나, --offline)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='일괄 분석 프로세스 수 (--offline)')
+    parser.add_argument('--no-save', action='store_true', help='페이지별 결과 파일 저장 안 함 (요약만 출력)')
     
     args = parser.parse_args()
     
-    analyzer = HTMLAnalyzer(headless=args.headless)
-    analyzer.analyze(args.url, wait_time=args.wait)
+    sources = list(args.sources)
+    if args.input_list:
+        with open(args.input_list, 'r', encoding='utf-8') as f:
+            sources += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    if not sources:
+        parser.error('분석할 URL 또는 파일을 지정하세요')
+    
+    if not args.offline:
+        analyzer = HTMLAnalyzer(headless=args.headless)
+        for source in sources:
+            analyzer.analyze(source, wait_time=args.wait)
+        return
+    
+    started = datetime.now()
+    summaries = analyze_static_batch(sources, workers=args.workers, save=not args.no_save)
+    elapsed = (datetime.now() - started).total_seconds()
+    
+    for summary in summaries:
+        print(json.dumps(summary, ensure_ascii=False))
+    failed = sum(1 for summary in summaries if 'error' in summary)
+    print(f"정적 분석 완료: {len(summaries)}개 ({failed}개 실패), {elapsed:.2f}초")
 
 
 if __name__ == "__main__":
@@ -2,20 +2,169 @@
 KNREC 웹사이트 구조 분석 모듈
 """
 import os
+import sys
 import json
 import time
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# 스크립트로 직접 실행하는 경우에도 공통 모듈을 찾을 수 있도록 프로젝트 루트 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from common.waits import wait_for_network_idle, wait_for_selector
+from common.webdriver_factory import create_chrome_driver
+from common.analysis_index import AnalysisIndex
+from common.structure_fingerprint import fetch_structural_fingerprint
+
+# 선택자(CSS 또는 '/'로 시작하는 XPath)로 요소 목록을 찾는 공통 함수
+QUERY_ALL_JS = """
+const queryAll = (selector, root = document) => {
+    if (selector.startsWith('/') || selector.startsWith('(')) {
+        const snapshot = document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+    }
+    return Array.from(root.querySelectorAll(selector));
+};
+const textOf = (el) => (el.innerText || el.textContent || '').trim();
+"""
+
+# 후보 선택자 전체를 WebDriver 호출 한 번으로 확인하는 스크립트
+# arguments[0]: 선택자 목록, arguments[1]: 미리보기 길이, arguments[2]: 선택자별 샘플 요소 수
+# 선택자마다 {selector, count, text_length, preview, class, samples[{text, class}], error} 반환
+PROBE_SELECTORS_SCRIPT = QUERY_ALL_JS + """
+const [selectors, previewLength, sampleCount] = arguments;
+return selectors.map((selector) => {
+    try {
+        const elements = queryAll(selector);
+        const first = elements.length ? textOf(elements[0]) : '';
+        return {
+            selector: selector,
+            count: elements.length,
+            text_length: first.length,
+            preview: first.slice(0, previewLength),
+            class: elements.length ? elements[0].getAttribute('class') : null,
+            samples: elements.slice(0, sampleCount).map((el) => ({text: textOf(el), class: el.getAttribute('class')})),
+        };
+    } catch (e) {
+        return {selector: selector, count: 0, text_length: 0, preview: '', class: null, samples: [], error: String(e)};
+    }
+});
+"""
+
+# 목록 항목들의 텍스트/링크/제목/내용을 한 번에 수집하는 스크립트
+# arguments[0]: 항목 선택자, arguments[1]: 최대 항목 수, arguments[2]: 제목 선택자, arguments[3]: 내용 선택자
+ITEM_DETAILS_SCRIPT = QUERY_ALL_JS + """
+const [selector, limit, titleSelector, contentSelector] = arguments;
+return queryAll(selector).slice(0, limit).map((item, index) => {
+    const info = {index: index, text: textOf(item), class: item.getAttribute('class')};
+    const link = item.querySelector('a');
+    if (link) info.link = link.href;
+    const title = item.querySelector(titleSelector);
+    if (title) info.title = textOf(title);
+    const content = item.querySelector(contentSelector);
+    if (content) info.content = textOf(content);
+    return info;
+});
+"""
+
+# FAQ 목록 후보 선택자 (앞에서부터 우선, 마지막은 XPath)
+FAQ_ITEM_SELECTORS = [
+    ".board_faq_list li",
+    ".board_faq_list > li",
+    ".board_list_faq li",
+    ".board_list_faq > li",
+    ".faq_list li",
+    ".faq_list > li",
+    "ul.board_faq_list > li",
+    "ul.board_list_faq > li",
+    ".board_wrap li",
+    ".board_wrap .faq_list li",
+    ".board_list_wrap li",
+    ".board_list_wrap .faq_list li",
+    ".board_faq li",
+    ".faq_board li",
+    ".faq_wrap li",
+    "ul li.question",
+    "ul li.faq_item",
+    "ul.result_list li",  # 추가된 선택자
+    ".result_list li",    # 추가된 선택자
+    ".faq_area li",
+    ".qna_list li",
+    "dl.faq_list dt",
+    ".accordion li",
+    "table.board_list tbody tr",
+    "//ul[contains(@class, 'faq') or contains(@class, 'result_list')]/li",
+]
+
+# 상세 페이지 내용 후보 선택자 (앞에서부터 우선)
+CONTENT_SELECTORS = [
+    ".album_view_txt .p_txt",
+    ".album_view_txt",
+    ".content_area",
+    ".faq_content",
+    ".view_content",
+    ".board_view",
+    ".board_content",
+    ".view_txt",
+    ".content_txt",
+    ".question_content",
+    ".answer_content",
+    ".faq_answer",
+    ".board_view_content",
+    ".view_area .content",
+    ".main_content",
+    "#content .content",
+    ".inner_content",
+    ".view_cont",
+    ".bbs_view",
+    ".board_detail",
+    ".board_view_txt",
+    ".detail_content",
+    ".view_body",
+    ".answer",
+    "#contents .view",
+    "article",
+]
+
+# 상세 페이지 제목 후보 선택자
+TITLE_SELECTORS = [
+    ".album_view_tit",
+    ".view_title",
+    ".board_title",
+    ".faq_title",
+    ".question_title",
+    "h1", "h2", "h3",
+    ".title",
+    ".subject",
+    ".view_tit",
+    ".board_view_tit",
+    ".bbs_title",
+    "h4",
+]
+
+# 페이지네이션 링크 정보를 한 번에 수집하는 스크립트 (arguments[0]: 페이지네이션 영역 선택자, 첫 번째 영역만)
+PAGINATION_LINKS_SCRIPT = """
+const container = document.querySelector(arguments[0]);
+return container ? Array.from(container.querySelectorAll('a'), (link, index) => ({
+    index: index,
+    text: (link.innerText || link.textContent || '').trim(),
+    href: link.href,
+    class: link.getAttribute('class'),
+})) : [];
+"""
 
 class KnrecAnalyzer:
     """
     KNREC 웹사이트 구조를 분석하는 클래스
+    
+    목록 페이지, 상세 페이지, 11페이지 페이지네이션을 각각 다른 브라우저로 동시에 분석합니다.
     """
     def __init__(self, headless=False):
         """
@@ -24,15 +173,12 @@ class KnrecAnalyzer:
         Args:
             headless (bool): 헤드리스 모드 사용 여부
         """
-        # 셀레니움 설정
-        self.chrome_options = Options()
-        if headless:
-            self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--window-size=1920,1080")
-        self.chrome_options.add_argument("--disable-popup-blocking")  # 팝업 차단 비활성화
-        self.chrome_options.add_argument("--disable-notifications")  # 알림 비활성화
+        # 셀레니움 설정 (공통 드라이버 팩토리 사용, CSS는 유지하여 실제 레이아웃 기준으로 분석)
+        self.headless = headless
+        self.driver_arguments = [
+            "--disable-popup-blocking",  # 팝업 차단 비활성화
+            "--disable-notifications",  # 알림 비활성화
+        ]
         
         # 결과 저장 경로
         self.results_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'output', 'analysis', 'knrec')
@@ -44,111 +190,210 @@ class KnrecAnalyzer:
         
         Args:
             url (str): 분석할 FAQ 페이지 URL
-            wait_time (int): 페이지 로딩 대기 시간(초)
+            wait_time (int): 페이지 로딩 최대 대기 시간(초)
             
         Returns:
             dict: 분석 결과
         """
         print(f"페이지 접속: {url}")
         
-        # 웹드라이버 초기화
-        driver = webdriver.Chrome(options=self.chrome_options)
-        
+        loop = asyncio.get_running_loop()
+        # 브라우저 작업은 모두 블로킹이므로 전용 스레드 풀에서 실행 (이벤트 루프는 대기만 함)
+        # (브라우저 3개 + 구조 지문 요청)
+        executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='knrec_analyzer')
+        
+        # 목록 / 상세 / 11페이지 분석용 브라우저를 동시에 시작 (브라우저마다 쿠키/탭 상태가 분리됨)
+        drivers = [loop.run_in_executor(executor, self.create_driver) for _ in range(3)]
+        list_driver, detail_driver, page11_driver = drivers
+        detail_url = loop.create_future()
+        
+        # 분석 결과 초기화
+        result = {
+            "url": url,
+            "title": None,
+            "timestamp": datetime.now().isoformat(),
+            "iframe_count": 0,
+            "tab_menu": [],
+            "faq_items": [],
+            "pagination_count": 0,
+            "page_structure": {},
+            "element_counts": {},
+            "page11_pagination": [],
+            "fingerprint": None
+        }
+        
+        def faq_items_found(faq_items):
+            # 목록 분석 스레드에서 호출 - 첫 FAQ 링크가 나오면 상세 페이지 분석 시작
+            link = faq_items[0].get("link") if faq_items else None
+            loop.call_soon_threadsafe(lambda: detail_url.done() or detail_url.set_result(link))
+        
+        tasks = []
         try:
-            # 페이지 접속
-            driver.get(url)
-            
-            # 페이지 로딩 대기
-            print("초기 페이지 로딩 대기 중...")
-            time.sleep(wait_time)
-            
-            # 페이지 제목 확인
-            title = driver.title
-            print(f"페이지 제목: {title}")
-            
-            # 분석 결과 초기화
-            result = {
-                "url": url,
-                "title": title,
-                "timestamp": datetime.now().isoformat(),
-                "iframe_count": 0,
-                "tab_menu": [],
-                "faq_items": [],
-                "pagination_count": 0,
-                "page_structure": {},
-                "element_counts": {},
-                "page11_pagination": []
-            }
-            
-            # iframe 확인
-            self._check_iframes(driver, result)
+            # 정적 HTML 구조 지문 (다음 분석 시 같으면 브라우저 분석 없이 이 결과를 계속 사용)
+            fingerprint_task = loop.run_in_executor(executor, fetch_structural_fingerprint, url)
+            page11_task = asyncio.ensure_future(self._run_in_browser(
+                executor, page11_driver, self._analyze_page11_pagination, f"{url.split('?')[0]}?page=11&"
+            ))
+            detail_task = asyncio.ensure_future(self._analyze_detail_when_ready(executor, detail_driver, detail_url))
+            tasks = [fingerprint_task, page11_task, detail_task]
             
-            # 탭 메뉴 확인
-            self._check_tab_menu(driver, result)
-            
-            # 간편검색 탭 클릭 시도
-            self._try_click_simple_search_tab(driver, result)
-            
-            # 페이지 로딩 추가 대기
-            print("페이지 로딩 추가 대기 중...")
-            time.sleep(wait_time)
-            
-            # FAQ 항목 검색
-            self._find_faq_items(driver, result)
-            
-            # 페이지 구조 분석
-            self._analyze_page_structure(driver, result)
-            
-            # 페이지네이션 확인
-            self._check_pagination(driver, result)
+            try:
+                await self._run_in_browser(
+                    executor, list_driver, self._analyze_list_page, url, wait_time, result, faq_items_found
+                )
+            finally:
+                if not detail_url.done():
+                    detail_url.set_result(None)  # 목록 분석 실패 시 상세 분석 건너뜀
             
-            # 추가 분석 - 모든 요소 검색
-            self._analyze_all_elements(driver, result)
+            result["fingerprint"] = await fingerprint_task
+            result.update(await detail_task)
+            result["page11_pagination"] = await page11_task
             
-            # 페이지 소스 분석
-            self._analyze_page_source(driver, result)
+            # 결과 저장
+            self._save_result(result)
             
-            # 상세 페이지 분석
-            self._analyze_detail_page(driver, result)
+            return result
             
-            # 11페이지로 이동해서 페이지네이션 구조 확인
-            print("11페이지로 이동해서 페이지네이션 분석 중...")
-            driver.get("https://www.knrec.or.kr/biz/faq/faq_list01.do?page=11&")
-            await asyncio.sleep(3)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # 생성된 브라우저 모두 종료 (시작에 실패한 브라우저는 건너뜀)
+            for driver in await asyncio.gather(*drivers, return_exceptions=True):
+                if not isinstance(driver, BaseException):
+                    await loop.run_in_executor(executor, driver.quit)
+            await loop.run_in_executor(None, executor.shutdown)
+    
+    async def _run_in_browser(self, executor, driver_future, func, *args):
+        """브라우저가 준비되면 func(driver, *args)를 분석 스레드에서 실행"""
+        driver = await driver_future
+        return await asyncio.get_running_loop().run_in_executor(executor, func, driver, *args)
+    
+    async def _analyze_detail_when_ready(self, executor, driver_future, detail_url):
+        """목록 분석에서 첫 FAQ 링크를 찾으면 별도 브라우저로 상세 페이지 분석"""
+        link = await detail_url
+        detail_result = {"faq_items": [{"link": link}] if link else []}
+        try:
+            await self._run_in_browser(executor, driver_future, self._analyze_detail_page, detail_result)
+        except Exception as e:
+            print(f"  상세 페이지 분석 중 오류: {str(e)}")
+            detail_result["detail_page_analysis"] = {"error": str(e)}
+        detail_result.pop("faq_items")
+        return detail_result
+    
+    def _analyze_list_page(self, driver, url, wait_time, result, on_faq_items=None):
+        """목록 페이지 분석 (iframe, 탭, FAQ 항목, 구조, 페이지네이션, 요소, 소스)"""
+        # 페이지 접속
+        driver.get(url)
+        
+        # 페이지 로딩 대기 (네트워크 유휴까지, 최대 wait_time초)
+        print("초기 페이지 로딩 대기 중...")
+        wait_for_network_idle(driver, wait_time)
+        
+        # 페이지 제목 확인
+        result["title"] = driver.title
+        print(f"페이지 제목: {result['title']}")
+        
+        # iframe 확인
+        self._check_iframes(driver, result)
+        
+        # 탭 메뉴 확인
+        self._check_tab_menu(driver, result)
+        
+        # 간편검색 탭 클릭 시도
+        self._try_click_simple_search_tab(driver, result)
+        
+        # 탭 클릭 후 목록 갱신 대기
+        print("페이지 로딩 추가 대기 중...")
+        wait_for_network_idle(driver, wait_time)
+        
+        # FAQ 항목 검색
+        self._find_faq_items(driver, result)
+        if on_faq_items:
+            on_faq_items(result["faq_items"])
+        
+        # 페이지 구조 분석
+        self._analyze_page_structure(driver, result)
+        
+        # 페이지네이션 확인
+        self._check_pagination(driver, result)
+        
+        # 추가 분석 - 모든 요소 검색
+        self._analyze_all_elements(driver, result)
+        
+        # 페이지 소스 분석
+        self._analyze_page_source(driver, result)
+    
+    def _analyze_page11_pagination(self, driver, page11_url):
+        """11페이지로 이동해서 페이지네이션 구조 확인"""
+        print("11페이지로 이동해서 페이지네이션 분석 중...")
+        page11_pagination = []
+        try:
+            driver.get(page11_url)
+            wait_for_network_idle(driver, 3)
             
             # 간편검색 탭 클릭
             simple_search_tab = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '간편검색')]"))
             )
             driver.execute_script("arguments[0].click();", simple_search_tab)
-            await asyncio.sleep(2)
+            wait_for_network_idle(driver, 2)
+            wait_for_selector(driver, ".paging", 2)
             
-            # 11페이지 페이지네이션 분석
-            page11_pagination = []
+            # 11페이지 페이지네이션 링크 (한 번의 스크립트로 수집)
+            page11_pagination = driver.execute_script(PAGINATION_LINKS_SCRIPT, ".paging") or []
+        except Exception as e:
+            print(f"11페이지 페이지네이션 분석 오류: {e}")
+        
+        print(f"11페이지 페이지네이션 항목 수: {len(page11_pagination)}")
+        return page11_pagination
+    
+    def create_driver(self):
+        """분석용 Chrome 드라이버 생성 (이미지/폰트/외부 스크립트 차단)"""
+        return create_chrome_driver(
+            headless=self.headless,
+            block_profile='layout',
+            user_agent=None,
+            extra_arguments=self.driver_arguments
+        )
+    
+    def _probe_selectors(self, driver, selectors, preview_length=200, sample_count=0):
+        """
+        후보 선택자들을 한 번의 execute_script로 확인 (스크립트 실행이 실패하면 선택자별 조회)
+        
+        Returns:
+            list: 선택자 순서대로 {selector, count, text_length, preview, class, samples} 딕셔너리
+        """
+        try:
+            probes = driver.execute_script(PROBE_SELECTORS_SCRIPT, list(selectors), preview_length, sample_count)
+            if probes is not None:
+                return probes
+        except Exception as e:
+            print(f"  선택자 일괄 확인 실패, 개별 확인으로 진행: {str(e)}")
+        
+        probes = []
+        for selector in selectors:
+            by = By.XPATH if selector.startswith(('/', '(')) else By.CSS_SELECTOR
             try:
-                pagination_elem = driver.find_element(By.CSS_SELECTOR, ".paging")
-                links = pagination_elem.find_elements(By.TAG_NAME, "a")
-                
-                for i, link in enumerate(links):
-                    page11_pagination.append({
-                        "index": i,
-                        "text": link.text.strip(),
-                        "href": link.get_attribute("href"),
-                        "class": link.get_attribute("class")
-                    })
+                elements = driver.find_elements(by, selector)
+                first = elements[0].text.strip() if elements else ''
+                probes.append({
+                    "selector": selector,
+                    "count": len(elements),
+                    "text_length": len(first),
+                    "preview": first[:preview_length],
+                    "class": elements[0].get_attribute("class") if elements else None,
+                    "samples": [
+                        {"text": el.text.strip(), "class": el.get_attribute("class")}
+                        for el in elements[:sample_count]
+                    ]
+                })
             except Exception as e:
-                print(f"11페이지 페이지네이션 분석 오류: {e}")
-            
-            result["page11_pagination"] = page11_pagination
-            print(f"11페이지 페이지네이션 항목 수: {len(page11_pagination)}")
-            
-            # 결과 저장
-            self._save_result(result)
-            
-            return result
-            
-        finally:
-            driver.quit()
+                probes.append({"selector": selector, "count": 0, "text_length": 0, "preview": "",
+                               "class": None, "samples": [], "error": str(e)})
+        return probes
     
     def _check_iframes(self, driver, result):
         """iframe 확인"""
@@ -184,11 +429,10 @@ class KnrecAnalyzer:
         ]
         
         tab_menu = None
-        for selector in tab_selectors:
-            tabs = driver.find_elements(By.CSS_SELECTOR, selector)
-            if tabs:
-                tab_menu = tabs[0]
-                print(f"  탭 메뉴 발견: {selector}")
+        for probe in self._probe_selectors(driver, tab_selectors, preview_length=0):
+            if probe["count"]:
+                tab_menu = driver.find_element(By.CSS_SELECTOR, probe["selector"])
+                print(f"  탭 메뉴 발견: {probe['selector']}")
                 break
         
         if not tab_menu:
@@ -257,86 +501,34 @@ class KnrecAnalyzer:
         """FAQ 항목 검색"""
         print("\n다양한 CSS 선택자로 FAQ 항목 검색:")
         
-        # 다양한 CSS 선택자로 FAQ 항목 찾기
-        selectors = [
-            ".board_faq_list li",
-            ".board_faq_list > li",
-            ".board_list_faq li",
-            ".board_list_faq > li",
-            ".faq_list li",
-            ".faq_list > li",
-            "ul.board_faq_list > li",
-            "ul.board_list_faq > li",
-            ".board_wrap li",
-            ".board_wrap .faq_list li",
-            ".board_list_wrap li",
-            ".board_list_wrap .faq_list li",
-            ".board_faq li",
-            ".faq_board li",
-            ".faq_wrap li",
-            "ul li.question",
-            "ul li.faq_item",
-            "ul.result_list li",  # 추가된 선택자
-            ".result_list li",    # 추가된 선택자
-        ]
-        
-        faq_items = []
+        # 후보 선택자 전체를 한 번에 확인 (앞에서부터 우선, 마지막은 XPath)
+        faq_count = 0
         selector_used = None
         
-        for selector in selectors:
-            items = driver.find_elements(By.CSS_SELECTOR, selector)
-            print(f"  - {selector}: {len(items)}개 항목 발견")
-            
-            if items and len(items) > 0:
-                faq_items = items
-                selector_used = selector
-                break
+        for probe in self._probe_selectors(driver, FAQ_ITEM_SELECTORS, preview_length=0):
+            print(f"  - {probe['selector']}: {probe['count']}개 항목 발견")
+            if probe["count"] and selector_used is None:
+                faq_count = probe["count"]
+                selector_used = probe["selector"]
         
-        # XPath로도 시도
-        if not faq_items:
-            try:
-                xpath_items = driver.find_elements(By.XPATH, "//ul[contains(@class, 'faq') or contains(@class, 'result_list')]/li")
-                print(f"  - XPath로 검색: {len(xpath_items)}개 항목 발견")
-                if xpath_items and len(xpath_items) > 0:
-                    faq_items = xpath_items
-                    selector_used = "XPath: //ul[contains(@class, 'faq') or contains(@class, 'result_list')]/li"
-            except:
-                pass
-        
-        print(f"\nFAQ 항목 수: {len(faq_items)}")
+        print(f"\nFAQ 항목 수: {faq_count}")
         
-        # FAQ 항목 정보 수집
+        # FAQ 항목 정보 수집 (최대 10개, 한 번의 스크립트로 텍스트/링크/제목/내용 수집)
         faq_details = []
-        for i, item in enumerate(faq_items[:10]):  # 최대 10개만 분석
+        if selector_used:
             try:
-                item_info = {
-                    "index": i,
-                    "text": item.text.strip(),
-                    "class": item.get_attribute("class")
-                }
-                
-                # 링크 찾기
-                links = item.find_elements(By.TAG_NAME, "a")
-                if links:
-                    item_info["link"] = links[0].get_attribute("href")
-                
-                # 제목 찾기
-                title_elements = item.find_elements(By.CSS_SELECTOR, ".tit, .title, .subject, .question, h3, h4, strong, .result_tit")
-                if title_elements:
-                    item_info["title"] = title_elements[0].text.strip()
-                
-                # 내용 찾기
-                content_elements = item.find_elements(By.CSS_SELECTOR, ".cont, .content, .answer, .desc, p, .result_txt")
-                if content_elements:
-                    item_info["content"] = content_elements[0].text.strip()
-                
-                faq_details.append(item_info)
-                
+                faq_details = driver.execute_script(
+                    ITEM_DETAILS_SCRIPT, selector_used, 10,
+                    ".tit, .title, .subject, .question, h3, h4, strong, .result_tit",
+                    ".cont, .content, .answer, .desc, p, .result_txt"
+                ) or []
             except Exception as e:
-                print(f"  - 항목 {i+1} 분석 중 오류: {str(e)}")
+                print(f"  - 항목 분석 중 오류: {str(e)}")
+            if selector_used.startswith('/'):
+                selector_used = f"XPath: {selector_used}"
         
         result["faq_items"] = faq_details
-        result["faq_count"] = len(faq_items)
+        result["faq_count"] = faq_count
         result["faq_selector_used"] = selector_used
     
     def _analyze_page_structure(self, driver, result):
@@ -351,14 +543,13 @@ class KnrecAnalyzer:
         ]
         
         structure = {}
-        for element in main_elements:
-            items = driver.find_elements(By.CSS_SELECTOR, element)
-            print(f"  - {element}: {len(items)}개 발견")
+        for probe in self._probe_selectors(driver, main_elements, preview_length=0):
+            print(f"  - {probe['selector']}: {probe['count']}개 발견")
             
-            if items:
-                structure[element] = {
-                    "count": len(items),
-                    "class": items[0].get_attribute("class") if len(items) > 0 else ""
+            if probe["count"]:
+                structure[probe["selector"]] = {
+                    "count": probe["count"],
+                    "class": probe["class"]
                 }
         
         result["page_structure"] = structure
@@ -387,40 +578,40 @@ class KnrecAnalyzer:
     def _analyze_all_elements(self, driver, result):
         """추가 분석 - 모든 요소 검색"""
         print("\n모든 li 요소 검색:")
-        all_li = driver.find_elements(By.TAG_NAME, "li")
-        print(f"  - 총 li 요소 수: {len(all_li)}")
-        result["element_counts"]["li"] = len(all_li)
-        
-        # 텍스트를 포함한 li 요소 검색
+        # li 전체 수와 키워드별 XPath 검색을 한 번에 확인 (키워드별 최대 3개 샘플)
         faq_keywords = ["FAQ", "faq", "질문", "답변", "간편검색"]
-        print("\n키워드를 포함한 li 요소 검색:")
+        keyword_xpaths = [
+            f"//li[contains(text(), '{keyword}') or .//a[contains(text(), '{keyword}')]]"
+            for keyword in faq_keywords
+        ]
+        probes = self._probe_selectors(driver, ["li"] + keyword_xpaths, preview_length=0, sample_count=3)
+        
+        print(f"  - 총 li 요소 수: {probes[0]['count']}")
+        result["element_counts"]["li"] = probes[0]["count"]
         
+        print("\n키워드를 포함한 li 요소 검색:")
         keyword_results = {}
-        for keyword in faq_keywords:
-            try:
-                elements = driver.find_elements(By.XPATH, f"//li[contains(text(), '{keyword}') or .//a[contains(text(), '{keyword}')]]")
-                print(f"  - '{keyword}' 키워드 포함 요소: {len(elements)}개")
-                
-                element_details = []
-                for i, elem in enumerate(elements[:3]):  # 최대 3개만 상세 분석
-                    try:
-                        element_info = {
-                            "index": i,
-                            "text": elem.text[:50] + "..." if len(elem.text) > 50 else elem.text,
-                            "class": elem.get_attribute("class")
-                        }
-                        element_details.append(element_info)
-                        print(f"    * 요소 {i+1}: {element_info['text']}")
-                    except:
-                        print(f"    * 요소 {i+1}: 텍스트 추출 실패")
-                
-                keyword_results[keyword] = {
-                    "count": len(elements),
-                    "details": element_details
+        for keyword, probe in zip(faq_keywords, probes[1:]):
+            if probe.get("error"):
+                print(f"  - '{keyword}' 검색 오류: {probe['error']}")
+                continue
+            print(f"  - '{keyword}' 키워드 포함 요소: {probe['count']}개")
+            
+            element_details = []
+            for i, sample in enumerate(probe["samples"]):
+                text = sample["text"]
+                element_info = {
+                    "index": i,
+                    "text": text[:50] + "..." if len(text) > 50 else text,
+                    "class": sample["class"]
                 }
-                
-            except Exception as e:
-                print(f"  - '{keyword}' 검색 오류: {str(e)}")
+                element_details.append(element_info)
+                print(f"    * 요소 {i+1}: {element_info['text']}")
+            
+            keyword_results[keyword] = {
+                "count": probe["count"],
+                "details": element_details
+            }
         
         result["keyword_elements"] = keyword_results
     
@@ -464,7 +655,7 @@ class KnrecAnalyzer:
         try:
             # 상세 페이지로 이동
             driver.get(detail_url)
-            time.sleep(3)  # 페이지 로딩 대기
+            wait_for_network_idle(driver, 3)  # 페이지 로딩 대기
             
             print(f"  상세 페이지 제목: {driver.title}")
             
@@ -477,85 +668,52 @@ class KnrecAnalyzer:
                 "main_content": ""
             }
             
-            # 다양한 내용 선택자 시도
-            content_selectors = [
-                ".album_view_txt .p_txt",
-                ".album_view_txt",
-                ".content_area",
-                ".faq_content",
-                ".view_content", 
-                ".board_view",
-                ".board_content",
-                ".view_txt",
-                ".content_txt",
-                ".question_content",
-                ".answer_content",
-                ".faq_answer",
-                ".board_view_content",
-                ".view_area .content",
-                ".main_content",
-                "#content .content",
-                ".inner_content"
-            ]
+            # 내용/제목 후보 선택자를 한 번에 확인
+            probes = self._probe_selectors(driver, CONTENT_SELECTORS + TITLE_SELECTORS, preview_length=500)
+            content_probes = probes[:len(CONTENT_SELECTORS)]
+            title_probes = probes[len(CONTENT_SELECTORS):]
             
             print("  내용 선택자 테스트:")
-            for selector in content_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        content = elements[0].text.strip()
-                        if content and len(content) > 50:  # 충분한 내용이 있는 경우
-                            selector_info = {
-                                "selector": selector,
-                                "element_count": len(elements),
-                                "content_length": len(content),
-                                "content_preview": content[:200] + "..." if len(content) > 200 else content
-                            }
-                            detail_analysis["content_selectors"].append(selector_info)
-                            print(f"    ✓ {selector}: {len(elements)}개 요소, {len(content)}자")
-                            
-                            # 첫 번째 성공한 선택자의 내용을 메인 내용으로 저장
-                            if not detail_analysis["main_content"]:
-                                detail_analysis["main_content"] = content[:500] + "..." if len(content) > 500 else content
-                        else:
-                            print(f"    - {selector}: {len(elements)}개 요소, 내용 부족")
-                    else:
-                        print(f"    - {selector}: 요소 없음")
-                except Exception as e:
-                    print(f"    ✗ {selector}: 오류 - {str(e)}")
-            
-            # 제목 선택자 테스트
-            title_selectors = [
-                ".album_view_tit",
-                ".view_title", 
-                ".board_title",
-                ".faq_title",
-                ".question_title",
-                "h1", "h2", "h3",
-                ".title",
-                ".subject"
-            ]
+            for probe in content_probes:
+                selector = probe["selector"]
+                if probe.get("error"):
+                    print(f"    ✗ {selector}: 오류 - {probe['error']}")
+                elif not probe["count"]:
+                    print(f"    - {selector}: 요소 없음")
+                elif probe["text_length"] > 50:  # 충분한 내용이 있는 경우
+                    content = probe["preview"]
+                    selector_info = {
+                        "selector": selector,
+                        "element_count": probe["count"],
+                        "content_length": probe["text_length"],
+                        "content_preview": content[:200] + "..." if probe["text_length"] > 200 else content
+                    }
+                    detail_analysis["content_selectors"].append(selector_info)
+                    print(f"    ✓ {selector}: {probe['count']}개 요소, {probe['text_length']}자")
+                    
+                    # 첫 번째 성공한 선택자의 내용을 메인 내용으로 저장
+                    if not detail_analysis["main_content"]:
+                        detail_analysis["main_content"] = content + "..." if probe["text_length"] > 500 else content
+                else:
+                    print(f"    - {selector}: {probe['count']}개 요소, 내용 부족")
             
             print("  제목 선택자 테스트:")
-            for selector in title_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        title_text = elements[0].text.strip()
-                        if title_text and len(title_text) > 5:  # 충분한 제목 텍스트
-                            selector_info = {
-                                "selector": selector,
-                                "element_count": len(elements),
-                                "title_text": title_text
-                            }
-                            detail_analysis["title_selectors"].append(selector_info)
-                            print(f"    ✓ {selector}: {title_text[:100]}")
-                        else:
-                            print(f"    - {selector}: {len(elements)}개 요소, 제목 텍스트 부족")
-                    else:
-                        print(f"    - {selector}: 요소 없음")
-                except Exception as e:
-                    print(f"    ✗ {selector}: 오류 - {str(e)}")
+            for probe in title_probes:
+                selector = probe["selector"]
+                if probe.get("error"):
+                    print(f"    ✗ {selector}: 오류 - {probe['error']}")
+                elif not probe["count"]:
+                    print(f"    - {selector}: 요소 없음")
+                elif probe["text_length"] > 5:  # 충분한 제목 텍스트
+                    selector_info = {
+                        "selector": selector,
+                        "element_count": probe["count"],
+                        "title_text": probe["preview"]
+                    }
+                    detail_analysis["title_selectors"].append(selector_info)
+                    print(f"    ✓ {selector}: {probe['preview'][:100]}")
+                else:
+                    print(f"    - {selector}: {probe['count']}개 요소, 제목 텍스트 부족")
             
             # 페이지 소스 저장 (상세 페이지)
             try:
@@ -597,6 +755,8 @@ class KnrecAnalyzer:
         filepath = os.path.join(self.results_dir, filename)
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(result, f, ensure_ascii=False, indent=2)
+        # 스파이더가 디렉토리를 훑지 않고 최신 분석을 찾도록 인덱스 갱신
+        AnalysisIndex.for_directory(self.results_dir, 'knrec').record('knrec_faq', filepath, result)
         
         print(f"\n결과가 {filepath} 파일에 저장되었습니다.")
 
@@ -608,7 +768,7 @@ def main():
     parser = argparse.ArgumentParser(description='KNREC 웹사이트 구조 분석')
     parser.add_argument('--url', default="https://www.knrec.or.kr/biz/faq/faq_list01.do", help='분석할 URL')
     parser.add_argument('--headless', action='store_true', help='헤드리스 모드 사용')
-    parser.add_argument('--wait', type=int, default=5, help='페이지 로딩 대기 시간(초)')
+    parser.add_argument('--wait', type=int, default=5, help='페이지 로딩 최대 대기 시간(초)')
     
     args = parser.parse_args()
     
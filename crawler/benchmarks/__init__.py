@@ -0,0 +1,3 @@
+"""
+로컬 fixture 서버 기반 크롤링 성능 측정 패키지
+"""
@@ -0,0 +1,282 @@
+"""
+KNREC FAQ fixture 서버
+저장된 상세 페이지 샘플과 크롤링 결과로 목록/상세 페이지를 재구성하여 로컬 HTTP 서버로 제공합니다.
+페이지 수와 응답 지연을 조절해 실제 사이트 없이 크롤러 성능을 반복 측정할 수 있습니다.
+등록한 첨부 파일(/files/<이름>)은 ETag/Range를 지원하여 다운로드 이어받기를 재현할 수 있습니다.
+
+사용법:
+    python -m benchmarks.fixture_server --pages 1000 --per-page 10 --latency 0.05
+"""
+import argparse
+import hashlib
+import html
+import multiprocessing
+import re
+import socket
+import sys
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from common.utils import iter_output_items
+
+DETAIL_SAMPLE = PROJECT_ROOT / 'output' / 'analysis' / 'knrec' / 'detail_page_sample.html'
+DATA_DIR = PROJECT_ROOT / 'output' / 'data'
+
+LIST_PATH = '/biz/faq/faq_list01.do'
+DETAIL_PATH = '/biz/faq/faq_view.do'
+FILES_PATH = '/files/'
+
+# 상세 페이지 샘플에서 본문 영역과 목록으로 바꿀 영역
+CONTENT_PATTERN = re.compile(r'(<p class="p_txt">).*?(</p>)', re.S)
+VIEW_START = '<div class="qna_album_view">'
+VIEW_END = '<div class="btn_right fix">'
+
+
+def load_records(data_file=None):
+    """크롤링 결과(JSON/JSONL)에서 (제목, 본문) 목록 로드 (미지정 시 output/data의 최신 knrec_faq 결과)"""
+    if data_file is None:
+        files = sorted(DATA_DIR.glob('knrec_faq_*.json*'), key=lambda x: x.stat().st_mtime)
+        if not files:
+            raise FileNotFoundError(f"fixture 데이터 없음: {DATA_DIR}/knrec_faq_*.json*")
+        data_file = files[-1]
+
+    records = [
+        (item['title'], item.get('content') or '')
+        for item in iter_output_items(data_file) if item.get('title')
+    ]
+    if not records:
+        raise ValueError(f"fixture 데이터에 FAQ 없음: {data_file}")
+    return records
+
+
+class FixtureSite:
+    """페이지 수/페이지당 FAQ 수에 맞춰 KNREC 형식의 목록/상세 HTML 생성"""
+
+    def __init__(self, records, total_pages=35, per_page=10, template_path=DETAIL_SAMPLE):
+        self.records = records
+        self.total_pages = total_pages
+        self.per_page = per_page
+
+        with open(template_path, 'r', encoding='utf-8') as f:
+            self.detail_template = f.read()
+
+        start = self.detail_template.index(VIEW_START)
+        end = self.detail_template.index(VIEW_END)
+        self.list_head = self.detail_template[:start]
+        self.list_tail = self.detail_template[end:]
+
+        # 첨부 파일 (이름 -> (내용, 수정 시각)), 다운로드 이어받기 측정/테스트용
+        self.files = {}
+        self.range_requests = True  # False면 Range 헤더를 무시하고 항상 전체 파일 응답
+        self.abort_after = None  # 바이트 수를 지정하면 그만큼 보낸 뒤 연결을 끊음 (중단된 다운로드 재현)
+
+    @property
+    def total_faqs(self):
+        return self.total_pages * self.per_page
+
+    def record_for(self, no):
+        """FAQ 번호에 해당하는 기록 (기록 수보다 많으면 순환)"""
+        return self.records[(no - 1) % len(self.records)]
+
+    def detail_url(self, no):
+        return f"{DETAIL_PATH}?no={no}&depth_1=A010000&depth_2=A011000"
+
+    def list_page(self, page):
+        """목록 페이지 HTML (범위를 벗어난 페이지는 빈 목록)"""
+        items = []
+        if 1 <= page <= self.total_pages:
+            first = (page - 1) * self.per_page + 1
+            for no in range(first, first + self.per_page):
+                title, content = self.record_for(no)
+                items.append(
+                    f'<li><a href="{html.escape(self.detail_url(no))}" title="{html.escape(title)}">'
+                    f'<strong class="result_tit">{html.escape(title)}</strong>'
+                    f'<p>{html.escape(content[:60])} ....</p></a></li>'
+                )
+
+        # 실제 사이트처럼 10페이지 단위 번호와 마지막 페이지 링크 제공
+        window_start = ((max(page, 1) - 1) // 10) * 10 + 1
+        links = []
+        for number in range(window_start, min(window_start + 10, self.total_pages + 1)):
+            if number == page:
+                links.append(f'<a href="javascript:void(0);" class="on">{number}</a>')
+            else:
+                links.append(f'<a href="{LIST_PATH}?page={number}&amp;">{number}</a>')
+        links.append(f'<a href="{LIST_PATH}?page={self.total_pages}&amp;" class="last" title="마지막 페이지"></a>')
+
+        body = (
+            '<div class="faq_list">'
+            f'<ul class="result_list">{"".join(items)}</ul>'
+            f'<div class="paging">{"".join(links)}</div>'
+            '</div>'
+        )
+        return self.list_head + body + self.list_tail
+
+    def add_file(self, name, data):
+        """첨부 파일 등록 (같은 이름이면 내용 교체 - 원격 파일 변경 재현)"""
+        self.files[name] = (data, time.time())
+        return f"{FILES_PATH}{name}"
+
+    def detail_page(self, no):
+        """상세 페이지 HTML (없는 번호는 None)"""
+        if not 1 <= no <= self.total_faqs:
+            return None
+
+        _, content = self.record_for(no)
+        body = '<br>'.join(html.escape(line) for line in content.split('\n'))
+        return CONTENT_PATTERN.sub(lambda m: m.group(1) + body + m.group(2), self.detail_template, count=1)
+
+
+def make_handler(site, latency=0.0):
+    """fixture 사이트를 제공하는 요청 핸들러 클래스 생성"""
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+
+            parsed = urlparse(self.path)
+            params = parse_qs(parsed.query)
+            page_html = None
+
+            if parsed.path.startswith(FILES_PATH):
+                self.send_file(site.files.get(parsed.path[len(FILES_PATH):]))
+                return
+
+            try:
+                if parsed.path == LIST_PATH:
+                    page_html = site.list_page(int(params.get('page', ['1'])[0]))
+                elif parsed.path == DETAIL_PATH:
+                    page_html = site.detail_page(int(params.get('no', ['0'])[0]))
+            except ValueError:
+                page_html = None
+
+            if page_html is None:
+                self.send_error(404)
+                return
+
+            body = page_html.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_file(self, entry):
+            """첨부 파일 응답 (ETag/Last-Modified, Range와 If-Range 지원)"""
+            if entry is None:
+                self.send_error(404)
+                return
+
+            data, modified = entry
+            etag = f'"{hashlib.sha1(data).hexdigest()}"'
+            last_modified = formatdate(modified, usegmt=True)
+            status, start = 200, 0
+
+            range_header = self.headers.get('Range') if site.range_requests else None
+            if_range = self.headers.get('If-Range')
+            match = re.match(r'bytes=(\d+)-$', range_header or '')
+            if match and (if_range is None or if_range in (etag, last_modified)):
+                start = int(match.group(1))
+                if start >= len(data):
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{len(data)}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                status = 206
+
+            body = data[start:]
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+            if site.range_requests:
+                self.send_header('Accept-Ranges', 'bytes')
+            if status == 206:
+                self.send_header('Content-Range', f'bytes {start}-{len(data) - 1}/{len(data)}')
+            self.end_headers()
+
+            if site.abort_after is not None:
+                self.wfile.write(body[:site.abort_after])
+                self.wfile.flush()
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # 요청별 로그는 측정에 영향을 주므로 출력하지 않음
+            pass
+
+    return FixtureHandler
+
+
+def serve(total_pages=35, per_page=10, latency=0.0, host='127.0.0.1', port=0, data_file=None, ready_queue=None):
+    """fixture 서버 실행 (ready_queue가 있으면 실제 포트를 전달)"""
+    site = FixtureSite(load_records(data_file), total_pages=total_pages, per_page=per_page)
+    server = ThreadingHTTPServer((host, port), make_handler(site, latency))
+    server.daemon_threads = True
+
+    if ready_queue is not None:
+        ready_queue.put(server.server_address[1])
+    else:
+        print(f"fixture 서버 시작: http://{host}:{server.server_address[1]} "
+              f"({total_pages}페이지 x {per_page}개, 지연 {latency}초)")
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def start_in_process(total_pages=35, per_page=10, latency=0.0, host='127.0.0.1', data_file=None):
+    """
+    별도 프로세스에서 fixture 서버 시작 (크롤러 프로세스의 CPU/메모리 측정과 분리)
+
+    Returns:
+        tuple: (프로세스, 기본 URL)
+    """
+    ready_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=serve,
+        kwargs={
+            'total_pages': total_pages,
+            'per_page': per_page,
+            'latency': latency,
+            'host': host,
+            'data_file': data_file,
+            'ready_queue': ready_queue,
+        },
+        daemon=True
+    )
+    process.start()
+    port = ready_queue.get(timeout=30)
+    return process, f"http://{host}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KNREC FAQ fixture 서버')
+    parser.add_argument('--pages', type=int, default=35, help='목록 페이지 수')
+    parser.add_argument('--per-page', type=int, default=10, help='페이지당 FAQ 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연(초)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--data', default=None, help='FAQ 데이터 JSON (기본: output/data 최신 결과)')
+    args = parser.parse_args()
+
+    serve(args.pages, args.per_page, args.latency, args.host, args.port, args.data)
+
+
+if __name__ == '__main__':
+    main()
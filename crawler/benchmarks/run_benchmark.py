@@ -0,0 +1,243 @@
+"""
+KNREC FAQ 크롤러 처리량 벤치마크
+로컬 fixture 서버를 띄우고 KnrecFaqSpider를 실행하여 처리량, 단계별 지연, 최대 메모리를 측정합니다.
+
+사용법 (crawler/ 디렉토리에서):
+    python -m benchmarks.run_benchmark --pages 500 --per-page 10 --latency 0.05
+    python -m benchmarks.run_benchmark --pages 100 -s CONCURRENT_REQUESTS=16 --output bench.json
+"""
+import argparse
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.environ.setdefault('SCRAPY_SETTINGS_MODULE', 'crawler.settings')
+
+from scrapy import signals
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+
+from benchmarks.fixture_server import DETAIL_PATH, LIST_PATH, start_in_process
+
+
+def percentile(values, pct):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+def summarize(values):
+    """지연 시간 목록 요약 (밀리초)"""
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values) * 1000, 2),
+        'p50_ms': round(percentile(values, 50) * 1000, 2),
+        'p95_ms': round(percentile(values, 95) * 1000, 2),
+        'p99_ms': round(percentile(values, 99) * 1000, 2),
+        'max_ms': round(values[-1] * 1000, 2),
+    }
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    if sys.platform == 'darwin':
+        return round(peak / 1024 / 1024, 1)
+    return round(peak / 1024, 1)
+
+
+class BenchmarkProbe:
+    """
+    크롤러 시그널로 단계별 지연 수집
+    - list/detail: 다운로드 지연 (요청 전송 ~ 응답 수신)
+    - item: 상세 응답 수신 ~ 파이프라인 처리 완료 (파싱 + 파이프라인)
+    """
+
+    def __init__(self, crawler):
+        self.latencies = {'list': [], 'detail': [], 'item': []}
+        self.responses = {'list': 0, 'detail': 0, 'other': 0}
+        self.received_at = {}
+        self.items = 0
+        self.dropped = 0
+        self.started_at = None
+        self.finished_at = None
+
+        crawler.signals.connect(self.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(self.response_received, signal=signals.response_received)
+        crawler.signals.connect(self.item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(self.item_dropped, signal=signals.item_dropped)
+
+    def spider_opened(self, spider):
+        self.started_at = time.perf_counter()
+
+    def spider_closed(self, spider):
+        self.finished_at = time.perf_counter()
+
+    def response_received(self, response, request, spider):
+        path = urlparse(response.url).path
+        stage = 'list' if path == LIST_PATH else 'detail' if path == DETAIL_PATH else 'other'
+        self.responses[stage] += 1
+
+        latency = request.meta.get('download_latency')
+        if stage in self.latencies and latency is not None:
+            self.latencies[stage].append(latency)
+        if stage == 'detail':
+            self.received_at[response.url] = time.perf_counter()
+
+    def item_scraped(self, item, response, spider):
+        self.items += 1
+        received = self.received_at.pop(item.get('url'), None)
+        if received is not None:
+            self.latencies['item'].append(time.perf_counter() - received)
+
+    def item_dropped(self, item, response, exception, spider):
+        self.dropped += 1
+
+    def report(self):
+        elapsed = (self.finished_at or time.perf_counter()) - (self.started_at or time.perf_counter())
+        pages = self.responses['list'] + self.responses['detail']
+        return {
+            'elapsed_sec': round(elapsed, 2),
+            'pages': pages,
+            'items': self.items,
+            'dropped_items': self.dropped,
+            'pages_per_sec': round(pages / elapsed, 2) if elapsed > 0 else 0.0,
+            'items_per_sec': round(self.items / elapsed, 2) if elapsed > 0 else 0.0,
+            'responses': self.responses,
+            'latency': {stage: summarize(values) for stage, values in self.latencies.items()},
+            'peak_rss_mb': peak_rss_mb(),
+        }
+
+
+def parse_setting_overrides(pairs):
+    """-s KEY=VALUE 목록을 딕셔너리로 변환 (값은 JSON으로 해석 가능하면 변환)"""
+    overrides = {}
+    for pair in pairs or []:
+        key, _, value = pair.partition('=')
+        try:
+            overrides[key] = json.loads(value)
+        except ValueError:
+            overrides[key] = value
+    return overrides
+
+
+def run_benchmark(pages=35, per_page=10, latency=0.0, detail_mode='http', throttle=False,
+                  settings_overrides=None, data_file=None):
+    """fixture 서버를 대상으로 KnrecFaqSpider 실행 후 측정 결과 반환"""
+    from crawler.spiders.knrec_faq import KnrecFaqSpider
+
+    server, base_url = start_in_process(pages, per_page, latency, data_file=data_file)
+    workdir = tempfile.mkdtemp(prefix='knrec_bench_')
+    original_cwd = os.getcwd()
+
+    try:
+        settings = get_project_settings()
+        settings.set('LOG_LEVEL', 'WARNING')
+        # fixture에 없는 페이지 때문에 Chrome이 실행되지 않도록 렌더링 캐시 replay 모드 사용
+        settings.set('RENDER_CACHE_MODE', 'replay')
+        settings.set('RENDER_CACHE_DIR', os.path.join(workdir, 'render_cache'))
+        settings.set('STATS_DUMP_FILE', os.path.join(workdir, 'stats.json'))
+        if not throttle:
+            # 로컬 서버이므로 요청 간격 없이 크롤러 자체 처리량 측정
+            settings.set('DOWNLOAD_DELAY', 0)
+            settings.set('AUTOTHROTTLE_ENABLED', False)
+        for key, value in (settings_overrides or {}).items():
+            settings.set(key, value)
+
+        # 파이프라인 출력(./output/data)은 임시 디렉토리에 저장
+        os.chdir(workdir)
+
+        process = CrawlerProcess(settings)
+        crawler = process.create_crawler(KnrecFaqSpider)
+        probe = BenchmarkProbe(crawler)
+        process.crawl(crawler, base_url=base_url, analysis='0', mode='full', detail_mode=detail_mode)
+        process.start()
+    finally:
+        os.chdir(original_cwd)
+        server.terminate()
+        server.join()
+
+    result = probe.report()
+    result['config'] = {
+        'pages': pages,
+        'per_page': per_page,
+        'latency': latency,
+        'detail_mode': detail_mode,
+        'throttle': throttle,
+        'settings': settings_overrides or {},
+    }
+    result['stats'] = {
+        key: value for key, value in crawler.stats.get_stats().items()
+        if isinstance(value, (int, float))
+    }
+    result['workdir'] = workdir
+    return result
+
+
+def print_report(result):
+    """측정 결과 출력"""
+    config = result['config']
+    print("\n=== 크롤러 벤치마크 결과 ===")
+    print(f"설정: {config['pages']}페이지 x {config['per_page']}개, 응답 지연 {config['latency']}초, "
+          f"상세 수집 {config['detail_mode']}")
+    print(f"소요 시간: {result['elapsed_sec']}초")
+    print(f"페이지: {result['pages']}개 ({result['pages_per_sec']} pages/sec)")
+    print(f"아이템: {result['items']}개 ({result['items_per_sec']} items/sec), 제외 {result['dropped_items']}개")
+    print(f"최대 RSS: {result['peak_rss_mb']} MB")
+    print("단계별 지연 (ms):")
+    for stage, summary in result['latency'].items():
+        if not summary['count']:
+            continue
+        print(f"  {stage:<7} n={summary['count']:<6} mean={summary['mean_ms']:<8} "
+              f"p50={summary['p50_ms']:<8} p95={summary['p95_ms']:<8} "
+              f"p99={summary['p99_ms']:<8} max={summary['max_ms']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KNREC FAQ 크롤러 처리량 벤치마크')
+    parser.add_argument('--pages', type=int, default=35, help='fixture 목록 페이지 수')
+    parser.add_argument('--per-page', type=int, default=10, help='페이지당 FAQ 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='fixture 서버 응답 지연(초)')
+    parser.add_argument('--detail-mode', choices=['http', 'selenium'], default='http', help='상세 페이지 수집 방식')
+    parser.add_argument('--throttle', action='store_true', help='프로젝트의 DOWNLOAD_DELAY/AutoThrottle 설정 유지')
+    parser.add_argument('-s', '--set', dest='settings', action='append', metavar='KEY=VALUE',
+                        help='Scrapy 설정 덮어쓰기 (여러 번 지정 가능)')
+    parser.add_argument('--data', default=None, help='fixture FAQ 데이터 JSON (기본: output/data 최신 결과)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        pages=args.pages,
+        per_page=args.per_page,
+        latency=args.latency,
+        detail_mode=args.detail_mode,
+        throttle=args.throttle,
+        settings_overrides=parse_setting_overrides(args.settings),
+        data_file=args.data
+    )
+    print_report(result)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+분석 결과 인덱스
+분석 디렉토리마다 최신 분석 파일 목록(analysis_index.json)을 유지하여, 스파이더 시작 시
+디렉토리 전체를 glob/stat 하지 않고 바로 최신 분석 결과를 찾고, 읽은 결과는 프로세스 안에서 TTL 동안 재사용합니다.
+"""
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+INDEX_FILENAME = 'analysis_index.json'
+
+# 프로세스 내 분석 결과 캐시 유지 시간(초)
+DEFAULT_CACHE_TTL = 300
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def parse_analysis_timestamp(timestamp_str):
+    """
+    분석 결과의 ISO 형식 timestamp를 epoch 초로 변환 (같은 문자열은 다시 파싱하지 않음)
+
+    Returns:
+        float: epoch 초, 파싱할 수 없으면 None
+    """
+    if not timestamp_str:
+        return None
+    if timestamp_str.endswith('Z'):
+        timestamp_str = timestamp_str[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(timestamp_str).timestamp()
+    except ValueError:
+        return None
+
+
+class AnalysisIndex:
+    """
+    분석 디렉토리의 대상(스파이더)별 최신 분석 파일 인덱스
+
+    항목: {'site', 'target', 'timestamp', 'analyzed_at', 'validated_at', 'path', 'mtime', 'fingerprint'}
+    분석 결과를 저장할 때 record()로 갱신하고, 인덱스가 없거나 가리키는 파일이 없어졌을 때만
+    디렉토리를 다시 훑어 인덱스를 만듭니다 (기존 분석 파일이 있는 디렉토리도 처음 한 번만 glob).
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, directory, site=None, cache_ttl=DEFAULT_CACHE_TTL):
+        self.directory = Path(directory)
+        self.site = site or self.directory.name
+        self.cache_ttl = cache_ttl
+        self.index_path = self.directory / INDEX_FILENAME
+        self.lock = threading.RLock()
+        self.entries = None
+        self.index_mtime = None
+        self.checked_at = 0.0
+        self.cache = {}  # path -> (mtime, 분석 결과)
+
+    @classmethod
+    def for_directory(cls, directory, site=None, cache_ttl=DEFAULT_CACHE_TTL):
+        """디렉토리별 인덱스 (프로세스 안에서 하나만 생성하여 캐시 공유)"""
+        key = str(Path(directory).resolve())
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(directory, site, cache_ttl)
+            return index
+
+    def _load_entries(self):
+        """인덱스 파일 읽기 (TTL 동안은 다시 확인하지 않고, 이후에는 mtime이 바뀐 경우만 다시 읽음)"""
+        now = time.monotonic()
+        if self.entries is not None and now - self.checked_at < self.cache_ttl:
+            return self.entries
+        self.checked_at = now
+
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.entries = self.rebuild()
+            return self.entries
+
+        if self.entries is None or mtime != self.index_mtime:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('entries', {})
+                self.index_mtime = mtime
+            except Exception as e:
+                logger.warning(f"분석 인덱스 읽기 실패, 다시 생성: {self.index_path} ({e})")
+                self.entries = self.rebuild()
+        return self.entries
+
+    def _write(self, entries):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': datetime.now().isoformat(), 'entries': entries}, f,
+                          ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.index_path)
+            self.index_mtime = self.index_path.stat().st_mtime_ns
+        except Exception as e:
+            logger.error(f"분석 인덱스 저장 실패: {e}")
+
+    def make_entry(self, target, path, analysis=None):
+        path = Path(path)
+        analysis = analysis or {}
+        timestamp = analysis.get('timestamp')
+        return {
+            'site': self.site,
+            'target': target,
+            'timestamp': timestamp,
+            'analyzed_at': parse_analysis_timestamp(timestamp),
+            'validated_at': parse_analysis_timestamp(analysis.get('validated_at')),
+            'path': path.name,
+            'mtime': path.stat().st_mtime,
+            'fingerprint': analysis.get('fingerprint'),
+        }
+
+    def rebuild(self):
+        """디렉토리를 훑어 대상별 최신 분석 파일로 인덱스 재생성"""
+        with self.lock:
+            latest = {}
+            if self.directory.exists():
+                for path in self.directory.glob('*_analysis_*.json'):
+                    target = path.name.rsplit('_analysis_', 1)[0]
+                    current = latest.get(target)
+                    if current is None or path.stat().st_mtime > current.stat().st_mtime:
+                        latest[target] = path
+
+            entries = {}
+            for target, path in latest.items():
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        analysis = json.load(f)
+                except Exception as e:
+                    logger.warning(f"분석 파일 읽기 실패 (인덱스에서 제외): {path} ({e})")
+                    continue
+                entries[target] = self.make_entry(target, path, analysis)
+                self.cache[str(path)] = (entries[target]['mtime'], analysis)
+
+            if entries or self.index_path.exists():
+                self._write(entries)
+            self.entries = entries
+            self.checked_at = time.monotonic()
+            return entries
+
+    def record(self, target, path, analysis=None):
+        """분석 결과 저장 직후 호출 - 대상의 최신 파일로 등록"""
+        with self.lock:
+            entries = dict(self._load_entries())
+            entry = self.make_entry(target, path, analysis)
+            current = entries.get(target)
+            if current and current['path'] != entry['path'] and current['mtime'] > entry['mtime']:
+                return current  # 더 최근 분석이 이미 등록됨
+
+            entries[target] = entry
+            self._write(entries)
+            self.entries = entries
+            self.checked_at = time.monotonic()
+            if analysis is not None:
+                self.cache[str(Path(path))] = (entry['mtime'], copy.deepcopy(analysis))
+            return entry
+
+    def latest(self, target):
+        """대상의 최신 분석 항목 (없으면 None)"""
+        with self.lock:
+            entry = self._load_entries().get(target)
+            if entry and not (self.directory / entry['path']).exists():
+                entry = self.rebuild().get(target)  # 파일이 삭제/이동됨
+            return entry
+
+    def latest_path(self, target):
+        entry = self.latest(target)
+        return self.directory / entry['path'] if entry else None
+
+    def load(self, target):
+        """
+        대상의 최신 분석 결과 (TTL 동안 같은 프로세스에서는 파일을 다시 읽지 않음)
+
+        Returns:
+            tuple: (분석 결과 사본, 인덱스 항목), 없으면 (None, None)
+        """
+        with self.lock:
+            entry = self.latest(target)
+            if not entry:
+                return None, None
+
+            path = str(self.directory / entry['path'])
+            cached = self.cache.get(path)
+            if cached is None or cached[0] != entry['mtime']:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cached = self.cache[path] = (entry['mtime'], json.load(f))
+            # 호출한 쪽에서 수정해도 캐시가 바뀌지 않도록 사본 반환
+            return copy.deepcopy(cached[1]), entry
+
+    def forget(self, path):
+        """삭제한 분석 파일을 캐시에서 제거 (인덱스는 다음 조회 때 정리)"""
+        with self.lock:
+            self.cache.pop(str(Path(path)), None)
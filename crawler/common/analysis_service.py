@@ -6,10 +6,17 @@ import os
 import json
 import glob
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 
+from common.analysis_index import AnalysisIndex, parse_analysis_timestamp
+from common.structure_fingerprint import fetch_structural_fingerprint
+from common.utils import find_max_page
+
 class AnalysisService:
     """
     웹사이트 분석 중앙 관리 서비스
@@ -25,6 +32,12 @@ class AnalysisService:
         # 분석 결과 유효 기간 (7일)
         self.cache_validity_days = 7
         
+        # 분석 결과 인덱스/메모리 캐시 유지 시간(초) - 이 시간 동안은 같은 프로세스에서 파일을 다시 확인하지 않음
+        self.cache_ttl_secs = 300
+        
+        # 만료된 분석도 정적 요청으로 계산한 페이지 구조 지문이 같으면 Chrome 재분석 없이 유효 기간 연장
+        self.fingerprint_revalidation = True
+        
         # 현재 지원하는 웹사이트 목록 (실제 구현된 것만)
         self.supported_sites = {
             'knrec': {
@@ -66,13 +79,21 @@ class AnalysisService:
             if existing_analysis and not self.is_analysis_outdated(existing_analysis):
                 self.logger.info(f"{spider_name}: 기존 분석 결과 사용")
                 return existing_analysis
+            
+            if existing_analysis and self.revalidate_analysis(spider_name, site_name, existing_analysis):
+                self.logger.info(f"{spider_name}: 페이지 구조 변경 없음 - 기존 분석 결과 유효 기간 연장")
+                return existing_analysis
         
         # 새로운 분석 수행
         self.logger.info(f"{spider_name}: 새로운 분석 수행")
         return self.perform_new_analysis(spider_name, site_name)
     
+    def get_index(self, site_name):
+        """사이트 분석 디렉토리의 인덱스 (프로세스 안에서 공유)"""
+        return AnalysisIndex.for_directory(self.analysis_base_dir / site_name, site_name, self.cache_ttl_secs)
+    
     def load_existing_analysis(self, spider_name):
-        """기존 분석 결과 로드"""
+        """기존 분석 결과 로드 (인덱스로 최신 파일을 찾고, 읽은 결과는 메모리에 캐시)"""
         try:
             site_name = spider_name.split('_')[0]
             site_analysis_dir = self.analysis_base_dir / site_name
@@ -81,20 +102,12 @@ class AnalysisService:
                 self.logger.info(f"분석 디렉토리 없음: {site_analysis_dir}")
                 return None
             
-            # 가장 최근 분석 파일 찾기
-            pattern = f"{spider_name}_analysis_*.json"
-            analysis_files = list(site_analysis_dir.glob(pattern))
-            
-            if not analysis_files:
-                self.logger.info(f"분석 파일 없음: {pattern}")
+            analysis, entry = self.get_index(site_name).load(spider_name)
+            if analysis is None:
+                self.logger.info(f"분석 파일 없음: {spider_name}_analysis_*.json")
                 return None
             
-            latest_file = max(analysis_files, key=lambda x: x.stat().st_mtime)
-            
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                analysis = json.load(f)
-                
-            self.logger.info(f"기존 분석 결과 로드: {latest_file}")
+            self.logger.info(f"기존 분석 결과 로드: {site_analysis_dir / entry['path']}")
             return analysis
             
         except Exception as e:
@@ -102,26 +115,14 @@ class AnalysisService:
             return None
     
     def is_analysis_outdated(self, analysis):
-        """분석 결과가 만료되었는지 확인"""
+        """분석 결과가 만료되었는지 확인 (구조 지문으로 재확인한 경우 validated_at 기준)"""
         try:
-            timestamp_str = analysis.get('timestamp')
-            if not timestamp_str:
+            # ISO 형식 파싱 (같은 timestamp는 캐시된 값 사용, 시간대 없는 값은 로컬 시간 기준)
+            analyzed_at = parse_analysis_timestamp(analysis.get('validated_at') or analysis.get('timestamp'))
+            if analyzed_at is None:
                 return True
             
-            # ISO 형식 파싱
-            if timestamp_str.endswith('Z'):
-                timestamp_str = timestamp_str[:-1] + '+00:00'
-                
-            analysis_time = datetime.fromisoformat(timestamp_str)
-            current_time = datetime.now()
-            
-            # 시간대 정보 통일
-            if analysis_time.tzinfo is None:
-                analysis_time = analysis_time.replace(tzinfo=current_time.tzinfo)
-            if current_time.tzinfo is None:
-                current_time = current_time.replace(tzinfo=analysis_time.tzinfo)
-            
-            age = current_time - analysis_time
+            age = timedelta(seconds=time.time() - analyzed_at)
             is_outdated = age > timedelta(days=self.cache_validity_days)
             
             if is_outdated:
@@ -133,6 +134,47 @@ class AnalysisService:
             self.logger.error(f"분석 결과 만료 확인 중 오류: {e}")
             return True
     
+    def revalidate_analysis(self, spider_name, site_name, analysis):
+        """
+        만료된 분석 결과의 구조 지문을 현재 페이지와 비교하여, 같으면 validated_at을 갱신해 저장
+        
+        Returns:
+            bool: 분석 결과를 계속 사용할 수 있으면 True
+        """
+        if not self.fingerprint_revalidation:
+            return False
+        
+        fingerprint = analysis.get('fingerprint')
+        if not fingerprint:
+            self.logger.info(f"{spider_name}: 구조 지문 없는 분석 결과 - 재분석 필요")
+            return False
+        
+        url = analysis.get('url') or self.supported_sites[site_name]['base_url']
+        current = fetch_structural_fingerprint(url)
+        if current != fingerprint:
+            self.logger.info(f"{spider_name}: 페이지 구조 변경 감지 ({fingerprint} -> {current})")
+            return False
+        
+        analysis['validated_at'] = datetime.now().isoformat()
+        self.update_analysis_file(spider_name, site_name, analysis)
+        return True
+    
+    def update_analysis_file(self, spider_name, site_name, analysis):
+        """인덱스의 최신 분석 파일을 같은 이름으로 다시 저장 (임시 파일 후 교체)"""
+        index = self.get_index(site_name)
+        filepath = index.latest_path(spider_name)
+        if filepath is None:
+            return
+        
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(analysis, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, filepath)
+            index.record(spider_name, filepath, analysis)
+        except Exception as e:
+            self.logger.error(f"분석 결과 갱신 실패: {e}")
+    
     def perform_new_analysis(self, spider_name, site_name):
         """새로운 분석 수행"""
         try:
@@ -169,8 +211,15 @@ class AnalysisService:
             analysis_result = getattr(analyzer, analysis_method)()
             
             # asyncio 코루틴인 경우 처리
+            # (이벤트 루프가 이미 실행 중이면 - 예: asyncio 리액터 - 별도 스레드의 새 루프에서 실행)
             if asyncio.iscoroutine(analysis_result):
-                analysis_result = asyncio.run(analysis_result)
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    analysis_result = asyncio.run(analysis_result)
+                else:
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        analysis_result = executor.submit(asyncio.run, analysis_result).result()
             
             # 분석 결과 후처리 (크롤링에 필요한 형태로 변환)
             processed_result = self.process_analysis_result(analysis_result, spider_name)
@@ -229,6 +278,7 @@ class AnalysisService:
                 processed = {
                     'timestamp': raw_result.get('timestamp'),
                     'url': raw_result.get('url'),
+                    'fingerprint': raw_result.get('fingerprint'),
                     'title': raw_result.get('title'),
                     'best_selectors': {
                         'faq_selector': raw_result.get('faq_selector_used', 'ul.result_list li'),
@@ -236,7 +286,11 @@ class AnalysisService:
                         'pagination_selector': '.pagination a'
                     },
                     'simple_search_tab': 'li:nth-child(2) a',  # 간편검색 탭
-                    'total_pages': 35,  # 분석 결과에서 추출 가능
+                    # 분석 시 수집한 페이지네이션 링크 기준 (없으면 None - 스파이더가 목록 페이지에서 확인)
+                    'total_pages': find_max_page(
+                        (link.get('text'), link.get('href'))
+                        for link in (raw_result.get('page11_pagination') or []) + (raw_result.get('pagination') or [])
+                    ),
                     'faq_count': raw_result.get('faq_count', 0),
                     'analysis_summary': {
                         'faq_items_found': len(raw_result.get('faq_items', [])),
@@ -268,6 +322,7 @@ class AnalysisService:
             # 결과 저장
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(analysis_result, f, ensure_ascii=False, indent=2)
+            self.get_index(site_name).record(spider_name, filepath, analysis_result)
             
             self.logger.info(f"분석 결과 저장: {filepath}")
             
@@ -303,6 +358,7 @@ class AnalysisService:
                 if file_time < cutoff_date:
                     analysis_file.unlink()
                     cleaned_count += 1
+                    self.get_index(site_dir.name).forget(analysis_file)
                     self.logger.info(f"오래된 분석 파일 삭제: {analysis_file}")
         
         self.logger.info(f"총 {cleaned_count}개 오래된 분석 파일 정리 완료")
@@ -0,0 +1,171 @@
+"""
+메모리 맵 기반 Bloom filter
+URL 등 문자열 키의 중복 여부를 일정한 메모리로 확인하고, 파일에 저장하여 실행 간에 유지합니다.
+한 번의 실행 안에서만 쓰는 중복 확인은 거짓 양성이 없는 KeySet을 사용합니다.
+"""
+import hashlib
+import logging
+import math
+import mmap
+import struct
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    고정 크기 Bloom filter (거짓 양성은 error_rate 이내, 거짓 음성 없음)
+
+    path를 지정하면 파일을 메모리 맵으로 열어 실행 간에 유지하고,
+    지정하지 않으면 익명 메모리 맵을 사용합니다.
+    """
+
+    MAGIC = b'BLMF'
+    VERSION = 1
+    # magic(4s) version(I) bit_count(Q) hash_count(I) capacity(Q) count(Q)
+    HEADER = struct.Struct('<4sIQIQQ')
+
+    def __init__(self, path=None, capacity=1_000_000, error_rate=0.001):
+        self.path = Path(path) if path else None
+        self.file = None
+
+        if self.path and self.path.exists() and self.path.stat().st_size >= self.HEADER.size:
+            self._open_existing()
+        else:
+            self._create(capacity, error_rate)
+
+    @staticmethod
+    def optimal_size(capacity, error_rate):
+        """(비트 수, 해시 함수 수) 계산"""
+        bit_count = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        hash_count = max(1, int(round(bit_count / capacity * math.log(2))))
+        return bit_count, hash_count
+
+    def _create(self, capacity, error_rate):
+        self.capacity = capacity
+        self.bit_count, self.hash_count = self.optimal_size(capacity, error_rate)
+        self.count = 0
+        size = self.HEADER.size + (self.bit_count + 7) // 8
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.path, 'w+b')
+            self.file.truncate(size)
+            self.map = mmap.mmap(self.file.fileno(), size)
+        else:
+            self.map = mmap.mmap(-1, size)
+        self._write_header()
+
+    def _open_existing(self):
+        self.file = open(self.path, 'r+b')
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        magic, version, self.bit_count, self.hash_count, self.capacity, self.count = \
+            self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"Bloom filter 파일 형식이 아님: {self.path}")
+        logger.info(f"Bloom filter 로드: {self.path} ({self.count}/{self.capacity}개)")
+
+    def _write_header(self):
+        self.HEADER.pack_into(
+            self.map, 0, self.MAGIC, self.VERSION,
+            self.bit_count, self.hash_count, self.capacity, self.count
+        )
+
+    def _positions(self, key):
+        """키의 비트 위치들 (128비트 해시 하나로 k개 위치 생성)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        h2 |= 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.bit_count
+
+    def __contains__(self, key):
+        offset = self.HEADER.size
+        for position in self._positions(key):
+            if not self.map[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, key):
+        """
+        키 추가
+
+        Returns:
+            bool: 새로 추가되었으면 True (이미 있었으면, 또는 거짓 양성이면 False)
+        """
+        offset = self.HEADER.size
+        added = False
+        for position in self._positions(key):
+            index = offset + (position >> 3)
+            mask = 1 << (position & 7)
+            byte = self.map[index]
+            if not byte & mask:
+                self.map[index] = byte | mask
+                added = True
+
+        if added:
+            self.count += 1
+            self._write_header()
+            if self.count == self.capacity + 1:
+                logger.warning(f"Bloom filter 용량 초과 ({self.capacity}개) - 거짓 양성 비율이 설정값보다 높아집니다")
+        return added
+
+    def __len__(self):
+        return self.count
+
+    def flush(self):
+        """헤더와 비트 배열을 파일에 반영"""
+        self._write_header()
+        if self.file:
+            self.map.flush()
+
+    def close(self):
+        if self.map is None:
+            return
+        if self.file:
+            self.flush()
+        self.map.close()
+        self.map = None
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class KeySet:
+    """
+    BloomFilter와 같은 인터페이스의 정확한 키 집합 (거짓 양성 없음)
+
+    한 번의 실행에서 본 키는 실행 규모로 제한되므로 set으로 충분하고,
+    새 문서를 중복으로 잘못 판단하여 건너뛰는 일이 없습니다.
+    """
+
+    path = None
+
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def add(self, key):
+        """
+        키 추가
+
+        Returns:
+            bool: 새로 추가되었으면 True (이미 있었으면 False)
+        """
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+    def __len__(self):
+        return len(self.keys)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.keys = set()
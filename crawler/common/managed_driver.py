@@ -0,0 +1,257 @@
+"""
+재시작 관리 웹드라이버
+오래 실행되는 브라우저는 메모리가 계속 늘고 느려지므로, 페이지 수 / 브라우저 메모리(RSS) / 연속 시간 초과
+기준을 넘거나 브라우저가 죽으면 드라이버를 새로 만들고 쿠키를 복원합니다.
+"""
+import logging
+import threading
+import time
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+try:
+    import psutil
+except ImportError:  # 없으면 메모리 기준 재시작 비활성화
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# 브라우저/드라이버 연결이 끊겼을 때의 오류 메시지 (이 경우 같은 드라이버로는 복구되지 않음)
+DEAD_SESSION_MESSAGES = (
+    'invalid session id',
+    'session deleted',
+    'chrome not reachable',
+    'disconnected',
+    'target window already closed',
+    'tab crashed',
+    'no such window',
+)
+
+# 쿠키 복원 시 CDP Network.setCookies로 전달할 필드
+COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+
+
+def is_dead_session_error(error):
+    """브라우저 세션이 더 이상 사용할 수 없는 상태인지 판단"""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    if isinstance(error, (ConnectionError, MaxRetryError, ProtocolError)):  # chromedriver 프로세스 종료
+        return True
+    if isinstance(error, WebDriverException):
+        message = (error.msg or str(error)).lower()
+        return any(text in message for text in DEAD_SESSION_MESSAGES)
+    return False
+
+
+def browser_rss_mb(driver):
+    """chromedriver와 하위 Chrome 프로세스의 메모리 사용량 합계(MB), 확인할 수 없으면 None"""
+    if psutil is None:
+        return None
+
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+    except Exception:
+        return None
+
+    total = 0
+    for proc in processes:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            continue  # 확인 중 종료된 렌더러 프로세스
+    return total / (1024 * 1024)
+
+
+class ManagedDriver:
+    """
+    WebDriver 래퍼 (속성/메서드는 현재 드라이버로 그대로 전달)
+
+    get() 전에 상태를 확인하여 기준을 넘으면 드라이버를 교체합니다.
+    - max_pages: 드라이버당 최대 페이지 로드 수
+    - max_rss_mb: 브라우저 메모리 기준 (psutil 필요, check_every 페이지마다 확인)
+    - max_timeouts: 연속 시간 초과 횟수 (페이지 로드/요소 대기)
+    브라우저가 죽은 경우에는 바로 교체 후 요청한 페이지를 한 번 더 로드합니다.
+
+    교체 시 쿠키만 복원합니다. 교체는 get() 직전에만 일어나고 바로 새 페이지로 이동하므로 이전 페이지와
+    탭 선택 등 화면 상태는 복원하지 않습니다 (스파이더가 목록 페이지로 이동할 때마다 탭을 다시 선택).
+    """
+
+    def __init__(self, factory, max_pages=0, max_rss_mb=0, max_timeouts=0, check_every=10,
+                 stats=None, name='driver'):
+        self.factory = factory
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb if psutil is not None else 0
+        self.max_timeouts = max_timeouts
+        self.check_every = max(1, check_every)
+        self.stats = stats
+        self.name = name
+
+        self.lock = threading.RLock()
+        self.page_count = 0
+        self.consecutive_timeouts = 0
+        self.recycle_count = 0
+        self.crashed = False
+        self.last_rss_mb = None
+        self.saved_cookies = []  # 브라우저가 죽으면 쿠키를 읽을 수 없으므로 check_every 페이지마다 저장
+        self.started_at = time.monotonic()
+
+        if max_rss_mb and psutil is None:
+            logger.warning("psutil이 없어 브라우저 메모리 기준 재시작을 사용하지 않습니다")
+
+        self.driver = factory()
+
+    def __getattr__(self, name):
+        # __init__ 중이거나 종료 후에는 self.driver가 없을 수 있음
+        driver = self.__dict__.get('driver')
+        if driver is None:
+            raise AttributeError(name)
+
+        attr = getattr(driver, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            try:
+                return attr(*args, **kwargs)
+            except Exception as e:
+                if is_dead_session_error(e):
+                    self.crashed = True  # 다음 get()에서 교체
+                raise
+        return call
+
+    def get(self, url):
+        """페이지 로드 (필요하면 먼저 드라이버 교체, 브라우저가 죽어 있으면 교체 후 재시도)"""
+        with self.lock:
+            reason = self.recycle_reason()
+            if reason:
+                self.recycle(reason)
+
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                self.record_timeout()
+                raise
+            except Exception as e:
+                if not is_dead_session_error(e):
+                    raise
+                logger.warning(f"{self.name} 브라우저 응답 없음, 재시작 후 재시도: {e}")
+                self.recycle('crash')
+                self.driver.get(url)
+
+            self.page_count += 1
+            self.consecutive_timeouts = 0
+            if self.page_count == 1 or self.page_count % self.check_every == 0:
+                try:
+                    self.saved_cookies = self.driver.get_cookies()
+                except Exception as e:
+                    logger.debug(f"{self.name} 쿠키 저장 실패: {e}")
+
+    def record_timeout(self):
+        """요소 대기 시간 초과 등 페이지는 열렸지만 응답이 느린 경우 기록"""
+        self.consecutive_timeouts += 1
+
+    def recycle_reason(self):
+        """교체가 필요한 이유 (없으면 None)"""
+        if self.crashed:
+            return 'crash'
+        if self.max_timeouts and self.consecutive_timeouts >= self.max_timeouts:
+            return 'timeouts'
+        if self.max_pages and self.page_count >= self.max_pages:
+            return 'pages'
+        if self.max_rss_mb and self.page_count and self.page_count % self.check_every == 0:
+            self.last_rss_mb = browser_rss_mb(self.driver)
+            if self.last_rss_mb is not None and self.last_rss_mb >= self.max_rss_mb:
+                return 'memory'
+        return None
+
+    def recycle(self, reason='manual'):
+        """드라이버를 새로 만들고 쿠키 복원"""
+        with self.lock:
+            cookies = self.saved_cookies
+            if not self.crashed:
+                try:
+                    cookies = self.driver.get_cookies()
+                except Exception as e:
+                    logger.debug(f"{self.name} 쿠키 저장 실패: {e}")
+
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.debug(f"{self.name} 종료 실패: {e}")
+
+            self.driver = self.factory()
+            self.recycle_count += 1
+            uptime = time.monotonic() - self.started_at
+            logger.info(
+                f"{self.name} 재시작 ({reason}): 페이지 {self.page_count}개, "
+                f"{uptime:.0f}초 사용, 메모리 {self.last_rss_mb or 0:.0f}MB"
+            )
+            if self.stats is not None:
+                self.stats.inc_value('selenium/driver_recycled')
+                self.stats.inc_value(f'selenium/driver_recycled/{reason}')
+
+            self.page_count = 0
+            self.consecutive_timeouts = 0
+            self.crashed = False
+            self.last_rss_mb = None
+            self.started_at = time.monotonic()
+
+            self.restore_cookies(cookies)
+
+    def restore_cookies(self, cookies):
+        """
+        이전 브라우저의 쿠키 복원
+        CDP로 페이지 이동 없이 설정하고, 실패하면 도메인별로 한 번 이동한 뒤 add_cookie 사용
+        """
+        if not cookies:
+            return
+
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {
+                'cookies': [
+                    {**{field: cookie[field] for field in COOKIE_FIELDS if field in cookie},
+                     **({'expires': cookie['expiry']} if 'expiry' in cookie else {})}
+                    for cookie in cookies
+                ]
+            })
+            return
+        except Exception as e:
+            logger.debug(f"{self.name} CDP 쿠키 복원 실패, 페이지 이동 후 재시도: {e}")
+
+        by_domain = {}
+        for cookie in cookies:
+            by_domain.setdefault(cookie.get('domain', '').lstrip('.'), []).append(cookie)
+
+        for domain, domain_cookies in by_domain.items():
+            if not domain:
+                continue
+            secure = any(cookie.get('secure') for cookie in domain_cookies)
+            try:
+                self.driver.get(f"{'https' if secure else 'http'}://{domain}/")
+                for cookie in domain_cookies:
+                    self.driver.add_cookie(cookie)
+            except Exception as e:
+                logger.warning(f"{self.name} 쿠키 복원 실패 ({domain}): {e}")
+
+    def quit(self):
+        with self.lock:
+            driver, self.driver = self.driver, None
+            if driver is not None:
+                driver.quit()
+
+    def health(self):
+        """현재 드라이버 상태 요약"""
+        return {
+            'pages': self.page_count,
+            'consecutive_timeouts': self.consecutive_timeouts,
+            'recycles': self.recycle_count,
+            'rss_mb': self.last_rss_mb,
+            'crashed': self.crashed,
+        }
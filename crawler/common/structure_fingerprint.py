@@ -0,0 +1,77 @@
+"""
+페이지 구조 지문(fingerprint)
+정적 HTML 한 번으로 DOM의 태그/class 골격을 해시하여, 사이트 템플릿이 바뀌었는지 브라우저 없이 확인합니다.
+글 내용, 링크, 속성 값, 목록 항목 수가 달라져도 같은 템플릿이면 같은 지문이 나옵니다.
+"""
+import hashlib
+import logging
+
+import lxml.html
+import requests
+
+from common.webdriver_factory import DEFAULT_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# 구조와 무관하거나 요청마다 달라질 수 있는 요소 (광고/분석 스크립트, 인라인 스타일 등)
+IGNORED_TAGS = {'script', 'style', 'noscript', 'link', 'meta', 'iframe', 'svg', 'br'}
+
+# 상태 표시용 class (현재 페이지/선택된 탭 등은 템플릿 변경이 아님)
+IGNORED_CLASSES = {'on', 'active', 'current', 'selected', 'is-active', 'focus'}
+
+
+def _node_signature(element):
+    """요소의 태그/id/class와 자식 골격 (같은 골격의 연속된 형제는 하나로 합침)"""
+    classes = sorted(set((element.get('class') or '').split()) - IGNORED_CLASSES)
+    signature = element.tag
+    if element.get('id'):
+        signature += '#' + element.get('id')
+    if classes:
+        signature += '.' + '.'.join(classes)
+
+    children = []
+    for child in element:
+        if not isinstance(child.tag, str) or child.tag in IGNORED_TAGS:
+            continue  # 주석, 처리 명령
+        child_signature = _node_signature(child)
+        if not children or children[-1] != child_signature:
+            children.append(child_signature)
+
+    if children:
+        signature += '(' + ','.join(children) + ')'
+    return signature
+
+
+def structural_fingerprint(html):
+    """
+    HTML의 DOM 골격 해시
+
+    Returns:
+        str: 32자리 16진수 지문, 파싱할 수 없으면 None
+    """
+    if not html:
+        return None
+    try:
+        document = lxml.html.fromstring(html)
+    except Exception as e:
+        logger.warning(f"구조 지문 계산 실패 (HTML 파싱): {e}")
+        return None
+
+    root = document.find('body') if document.find('body') is not None else document
+    return hashlib.blake2b(_node_signature(root).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def fetch_structural_fingerprint(url, timeout=10, user_agent=DEFAULT_USER_AGENT):
+    """
+    정적 요청 한 번으로 페이지 구조 지문 계산 (Chrome 미사용)
+
+    Returns:
+        str: 지문, 요청 실패 시 None
+    """
+    try:
+        response = requests.get(url, timeout=timeout, headers={'User-Agent': user_agent})
+        response.raise_for_status()
+    except Exception as e:
+        logger.warning(f"구조 지문 요청 실패 ({url}): {e}")
+        return None
+    return structural_fingerprint(response.content)
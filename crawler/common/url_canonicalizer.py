@@ -0,0 +1,63 @@
+"""
+사이트 URL 정규화
+같은 문서를 가리키는 URL(카테고리 파라미터, 파라미터 순서, fragment 차이 등)을 하나의 문서 키로 변환합니다.
+문서 키는 중복 확인, 렌더링 캐시 키, 결과 아이템의 게시글 번호에 사용합니다.
+"""
+from urllib.parse import parse_qs, urlparse
+
+from w3lib.url import canonicalize_url
+
+# 사이트별 상세 페이지 규칙: 경로 -> (문서 키 접두어, 문서 번호 파라미터)
+# 경로만 비교하므로 같은 구조의 로컬 fixture 서버 등 다른 호스트에도 적용됨
+SITE_RULES = {
+    'knrec': {
+        '/biz/faq/faq_view.do': ('knrec_faq', 'no'),
+    },
+}
+
+
+class URLCanonicalizer:
+    """URL을 정규화 URL과 안정적인 문서 키로 변환"""
+
+    def __init__(self, rules=None):
+        self.rules = rules or {}
+
+    @classmethod
+    def for_site(cls, site_name):
+        """SITE_RULES에 등록된 사이트 규칙으로 생성 (규칙이 없으면 URL 정규화만 수행)"""
+        return cls(SITE_RULES.get(site_name))
+
+    @staticmethod
+    def canonical_url(url):
+        """쿼리 순서, 빈 파라미터, fragment 차이를 없앤 URL"""
+        return canonicalize_url(url, keep_blank_values=False)
+
+    def match(self, url):
+        """
+        URL에 해당하는 규칙의 (접두어, 문서 번호)
+
+        Returns:
+            tuple: 규칙이 없거나 문서 번호 파라미터가 없으면 None
+        """
+        parsed = urlparse(url)
+        rule = self.rules.get(parsed.path)
+        if not rule:
+            return None
+
+        prefix, param = rule
+        values = parse_qs(parsed.query).get(param)
+        if not values or not values[0].strip():
+            return None
+        return prefix, values[0].strip()
+
+    def document_id(self, url):
+        """사이트 문서 번호 (예: KNREC FAQ의 no), 없으면 None"""
+        matched = self.match(url)
+        return matched[1] if matched else None
+
+    def document_key(self, url):
+        """문서 키 (규칙에 맞으면 '접두어:번호', 아니면 정규화 URL)"""
+        matched = self.match(url)
+        if matched:
+            return f"{matched[0]}:{matched[1]}"
+        return self.canonical_url(url)
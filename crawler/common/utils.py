@@ -8,7 +8,17 @@ import sys
 from datetime import datetime
 import json
 import glob
+import gzip
+import io
 import logging
+import re
+
+from common.analysis_index import AnalysisIndex
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 사항
+    zstandard = None
 
 def get_project_root():
     """프로젝트 루트 디렉토리 경로 반환"""
@@ -40,18 +50,16 @@ def get_latest_analysis_result(target):
     if 'knrec' in target:
         analysis_dir = os.path.join(analysis_dir, 'knrec')
     
-    # 분석 결과 파일 패턴
-    pattern = os.path.join(analysis_dir, f"{target}_analysis_*.json")
-    files = glob.glob(pattern)
+    # 디렉토리 인덱스에서 가장 최근 파일 조회 (매번 glob/stat 하지 않음)
+    latest_file = AnalysisIndex.for_directory(analysis_dir).latest_path(target)
     
-    if not files:
+    if not latest_file:
+        pattern = os.path.join(analysis_dir, f"{target}_analysis_*.json")
         print(f"경고: {target}에 대한 분석 결과 파일을 찾을 수 없습니다. 경로: {pattern}")
         return None
     
-    # 가장 최근 파일 반환
-    latest_file = max(files, key=os.path.getctime)
     print(f"최신 분석 결과 파일: {latest_file}")
-    return latest_file
+    return str(latest_file)
 
 def load_analysis_result(target):
     """분석 결과 로드"""
@@ -62,19 +70,19 @@ def load_analysis_result(target):
         return None
     
     try:
-        with open(result_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            print(f"분석 결과 로드 성공: {result_file}")
-            
-            # 분석 결과 요약 출력
-            if 'url' in data:
-                print(f"- 분석 URL: {data['url']}")
-            if 'table_count' in data:
-                print(f"- 테이블 수: {data['table_count']}")
-            if 'pagination' in data and 'found' in data['pagination']:
-                print(f"- 페이지네이션: {'발견됨' if data['pagination']['found'] else '발견되지 않음'}")
-            
-            return data
+        # 인덱스의 메모리 캐시 사용 (같은 프로세스에서 반복 호출 시 파일을 다시 읽지 않음)
+        data, _ = AnalysisIndex.for_directory(os.path.dirname(result_file)).load(target)
+        print(f"분석 결과 로드 성공: {result_file}")
+        
+        # 분석 결과 요약 출력
+        if 'url' in data:
+            print(f"- 분석 URL: {data['url']}")
+        if 'table_count' in data:
+            print(f"- 테이블 수: {data['table_count']}")
+        if 'pagination' in data and 'found' in data['pagination']:
+            print(f"- 페이지네이션: {'발견됨' if data['pagination']['found'] else '발견되지 않음'}")
+        
+        return data
     except Exception as e:
         print(f"분석 결과 로드 오류: {e}")
         return None
@@ -87,4 +95,77 @@ def ensure_directory_exists(directory):
     """디렉토리가 존재하는지 확인하고, 없으면 생성"""
     if not os.path.exists(directory):
         os.makedirs(directory)
-    return directory 
\ No newline at end of file
+    return directory
+
+PAGE_PARAM_PATTERN = re.compile(r'[?&]page=(\d+)')
+
+def find_max_page(links):
+    """
+    페이지네이션 링크 (텍스트, href) 목록에서 가장 큰 페이지 번호
+    숫자 텍스트와 href의 page 파라미터(다음 묶음/마지막 페이지 링크)를 함께 봅니다.
+
+    Returns:
+        int: 페이지 번호, 페이지네이션 링크가 없으면 None
+    """
+    max_page = None
+    for text, href in links:
+        numbers = []
+        text = (text or '').strip()
+        if text.isdigit():
+            numbers.append(int(text))
+        match = PAGE_PARAM_PATTERN.search(href or '')
+        if match:
+            numbers.append(int(match.group(1)))
+        for number in numbers:
+            if max_page is None or number > max_page:
+                max_page = number
+    return max_page
+
+def open_compressed(path):
+    """확장자(.gz, .zst)에 맞춰 압축을 풀며 읽는 바이너리 스트림 열기"""
+    path = str(path)
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("zstd 파일을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True, read_across_frames=True)
+    return open(path, 'rb')
+
+def iter_output_items(path, columns=None):
+    """
+    크롤링 결과 파일의 아이템을 하나씩 반환
+    JSON 배열(.json), JSON Lines(.jsonl, .jsonl.gz, .jsonl.zst), Parquet(.parquet, pyarrow 필요)을 지원하며,
+    JSONL/Parquet은 줄/배치 단위로 읽으므로 전체 파일을 메모리에 올리지 않습니다.
+    Parquet은 columns를 지정하면 해당 컬럼만 읽습니다.
+    """
+    path = str(path)
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+        return
+
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path, memory_map=True).iter_batches(columns=columns):
+            yield from batch.to_pylist()
+        return
+
+    logger = logging.getLogger(__name__)
+    truncated_errors = (EOFError,) + ((zstandard.ZstdError,) if zstandard else ())
+    with open_compressed(path) as raw:
+        lines = io.TextIOWrapper(raw, encoding='utf-8')
+        line_number = 0
+        try:
+            for line_number, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # 크롤링 중단으로 마지막 줄이 잘린 경우 등
+                    logger.warning(f"손상된 줄 건너뜀: {path}:{line_number}")
+        except truncated_errors as e:
+            # 압축 스트림이 끝까지 기록되지 않은 파일 (마지막 flush 이후 중단)
+            logger.warning(f"압축 스트림이 중간에 끝남: {path} ({line_number}줄까지 읽음): {e}")
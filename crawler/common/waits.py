@@ -0,0 +1,159 @@
+"""
+Selenium 대기 유틸리티
+고정 sleep 대신 DOM 상태(요소 등장, 목록 재렌더링, 네트워크 유휴, 텍스트 변화)를 기다리고,
+브라우저 탐색에만 사이트별 요청 간격(politeness delay)을 적용합니다.
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# 짧은 폴링 간격 (WebDriverWait 기본값 0.5초는 페이지당 대기 시간을 늘림)
+POLL_FREQUENCY = 0.1
+
+# 로드된 리소스 수와 진행 중인 jQuery 요청 수를 함께 조회하는 스크립트
+NETWORK_ACTIVITY_SCRIPT = """
+const resources = performance.getEntriesByType('resource').length;
+const ajax = (window.jQuery && window.jQuery.active) || 0;
+return [document.readyState, resources, ajax];
+"""
+
+
+def wait_until(driver, condition, timeout):
+    """조건이 참이 될 때까지 대기 (시간 초과 시 False)"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY,
+                      ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_selector(driver, selector, timeout):
+    """선택자에 해당하는 요소가 나타날 때까지 대기"""
+    return wait_until(driver, EC.presence_of_element_located((By.CSS_SELECTOR, selector)), timeout)
+
+
+def wait_for_document_ready(driver, timeout):
+    """document.readyState가 complete가 될 때까지 대기"""
+    return wait_until(driver, lambda d: d.execute_script("return document.readyState") == 'complete', timeout)
+
+
+class NetworkIdle:
+    """
+    네트워크 유휴 조건
+    문서 로드가 끝나고 리소스 수가 idle_time 동안 늘지 않으며 jQuery 요청이 없으면 참
+    """
+
+    def __init__(self, idle_time=0.5):
+        self.idle_time = idle_time
+        self.last_count = None
+        self.stable_since = None
+
+    def __call__(self, driver):
+        try:
+            ready_state, resources, ajax = driver.execute_script(NETWORK_ACTIVITY_SCRIPT)
+        except WebDriverException:
+            # 페이지 전환 중에는 스크립트 실행이 실패할 수 있음
+            self.last_count = None
+            return False
+
+        now = time.monotonic()
+        if ready_state != 'complete' or ajax or resources != self.last_count:
+            self.last_count = resources
+            self.stable_since = now
+            return False
+
+        return now - self.stable_since >= self.idle_time
+
+
+def wait_for_network_idle(driver, timeout, idle_time=0.5):
+    """네트워크 요청이 idle_time 동안 없을 때까지 대기"""
+    return wait_until(driver, NetworkIdle(idle_time), timeout)
+
+
+class ListRerendered:
+    """
+    목록 재렌더링 조건
+    이전 목록 요소가 DOM에서 제거되었거나(클릭 후 페이지/목록 교체) 네트워크가 유휴 상태가 된 뒤
+    선택자에 해당하는 목록이 존재하면 참
+    """
+
+    def __init__(self, selector, previous_element=None, idle_time=0.3):
+        self.selector = selector
+        self.previous_element = previous_element
+        self.network_idle = NetworkIdle(idle_time)
+
+    def __call__(self, driver):
+        replaced = self.previous_element is None or EC.staleness_of(self.previous_element)(driver)
+        if not replaced and not self.network_idle(driver):
+            return False
+        return bool(driver.find_elements(By.CSS_SELECTOR, self.selector))
+
+
+def wait_for_rerender(driver, selector, previous_element=None, timeout=5, idle_time=0.3):
+    """클릭 등으로 목록이 다시 그려질 때까지 대기"""
+    return wait_until(driver, ListRerendered(selector, previous_element, idle_time), timeout)
+
+
+def wait_for_text_change(driver, selector, previous_text, timeout):
+    """선택자 요소의 텍스트가 이전 값과 달라질 때까지 대기"""
+    def _changed(d):
+        elements = d.find_elements(By.CSS_SELECTOR, selector)
+        return bool(elements) and elements[0].text != previous_text
+    return wait_until(driver, _changed, timeout)
+
+
+def wait_for_height_change(driver, previous_height, timeout):
+    """스크롤 높이가 이전 값보다 커질 때까지 대기 (무한 스크롤 추가 로딩)"""
+    return wait_until(
+        driver,
+        lambda d: d.execute_script("return document.body.scrollHeight") > previous_height,
+        timeout
+    )
+
+
+class PolitenessDelay:
+    """
+    사이트별 최소 요청 간격
+    Scrapy 다운로더를 거치지 않는 브라우저 탐색에만 사용하며, 여러 드라이버 스레드가
+    같은 호스트에 접근해도 간격이 유지되도록 호출 시점을 예약합니다.
+    """
+
+    def __init__(self, delays=None, default_delay=0.0):
+        # {'knrec.or.kr': 1.0} 형식 (하위 도메인 포함)
+        self.delays = dict(delays or {})
+        self.default_delay = default_delay
+        self.next_allowed = {}
+        self.lock = threading.Lock()
+
+    def delay_for(self, host):
+        """호스트에 적용할 요청 간격 (초)"""
+        for domain, delay in self.delays.items():
+            if host == domain or host.endswith('.' + domain):
+                return float(delay)
+        return self.default_delay
+
+    def reserve(self, url):
+        """해당 호스트의 다음 요청 시점을 예약하고 남은 대기 시간(초) 반환"""
+        host = urlparse(url).hostname or ''
+        delay = self.delay_for(host)
+        if delay <= 0:
+            return 0.0
+
+        with self.lock:
+            now = time.monotonic()
+            ready_at = max(now, self.next_allowed.get(host, 0.0))
+            self.next_allowed[host] = ready_at + delay
+        return ready_at - now
+
+    def wait(self, url):
+        """해당 호스트의 다음 요청 가능 시점까지 대기"""
+        remaining = self.reserve(url)
+        if remaining > 0:
+            time.sleep(remaining)
+        return remaining
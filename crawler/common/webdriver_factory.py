@@ -0,0 +1,135 @@
+"""
+Chrome 웹드라이버 생성 모듈
+스파이더, SeleniumMiddleware, 분석기가 같은 옵션과 리소스 차단 프로파일로 드라이버를 만들도록 합니다.
+"""
+import logging
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 리소스 유형별 차단 URL 패턴 (CDP Network.setBlockedURLs 와일드카드 형식)
+IMAGE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp']
+FONT_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+STYLESHEET_PATTERNS = ['*.css']
+THIRD_PARTY_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*facebook.net*',
+    '*wcs.naver.net*',
+    '*t1.daumcdn.net/kas*',
+    '*youtube.com/embed*',
+]
+
+# 차단 프로파일
+# - text: 텍스트 크롤링용 (이미지, 폰트, CSS, 외부 분석 스크립트 차단, DOMContentLoaded 시점에 반환)
+# - layout: 구조 분석용 (CSS는 유지하여 요소 가시성/클릭 가능 여부를 실제와 같게 유지)
+# - none: 차단 없음
+BLOCKING_PROFILES = {
+    'text': {
+        'patterns': IMAGE_PATTERNS + FONT_PATTERNS + STYLESHEET_PATTERNS + THIRD_PARTY_PATTERNS,
+        'disable_images': True,
+        'page_load_strategy': 'eager',
+    },
+    'layout': {
+        'patterns': IMAGE_PATTERNS + FONT_PATTERNS + THIRD_PARTY_PATTERNS,
+        'disable_images': True,
+        'page_load_strategy': 'normal',
+    },
+    'none': {
+        'patterns': [],
+        'disable_images': False,
+        'page_load_strategy': 'normal',
+    },
+}
+
+
+def build_chrome_options(headless=True, block_profile='text', user_agent=DEFAULT_USER_AGENT,
+                         window_size='1920,1080', extra_arguments=()):
+    """Chrome 옵션 생성"""
+    profile = BLOCKING_PROFILES.get(block_profile, BLOCKING_PROFILES['none'])
+
+    options = Options()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument(f'--window-size={window_size}')
+    # 여러 드라이버를 동시에 띄울 때 브라우저당 메모리와 백그라운드 트래픽 절감
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--mute-audio')
+    if user_agent:
+        options.add_argument(f'--user-agent={user_agent}')
+    for argument in extra_arguments:
+        options.add_argument(argument)
+
+    if profile['disable_images']:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+    options.page_load_strategy = profile['page_load_strategy']
+    return options
+
+
+def apply_resource_blocking(driver, patterns):
+    """CDP로 URL 패턴 차단 (Chrome 전용, 실패해도 드라이버는 그대로 사용)"""
+    if not patterns:
+        return False
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except Exception as e:
+        logger.warning(f"리소스 차단 설정 실패: {e}")
+        return False
+
+
+def create_chrome_driver(headless=True, block_profile='text', blocked_url_patterns=None,
+                         user_agent=DEFAULT_USER_AGENT, window_size='1920,1080', extra_arguments=(),
+                         page_load_timeout=None, use_webdriver_manager=False):
+    """
+    리소스 차단 프로파일이 적용된 Chrome 드라이버 생성
+
+    Args:
+        headless (bool): 헤드리스 모드 사용 여부
+        block_profile (str): 'text', 'layout', 'none' 중 하나
+        blocked_url_patterns (list): 프로파일에 추가로 차단할 URL 패턴
+        user_agent (str): User-Agent (None이면 Chrome 기본값)
+        window_size (str): 창 크기
+        extra_arguments (iterable): 추가 Chrome 인자
+        page_load_timeout (int): 페이지 로드 제한 시간(초)
+        use_webdriver_manager (bool): webdriver_manager로 chromedriver 설치 후 사용
+
+    Returns:
+        WebDriver: Chrome 드라이버
+    """
+    options = build_chrome_options(
+        headless=headless,
+        block_profile=block_profile,
+        user_agent=user_agent,
+        window_size=window_size,
+        extra_arguments=extra_arguments
+    )
+
+    if use_webdriver_manager:
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
+
+    if page_load_timeout:
+        driver.set_page_load_timeout(page_load_timeout)
+
+    profile = BLOCKING_PROFILES.get(block_profile, BLOCKING_PROFILES['none'])
+    patterns = list(profile['patterns']) + list(blocked_url_patterns or [])
+    apply_resource_blocking(driver, patterns)
+
+    return driver
@@ -0,0 +1,164 @@
+"""
+크롤링 체크포인트
+완료한 목록 페이지, 저장한 문서 키, 결과 파일의 기록 위치를 주기적으로 저장하여
+중단된 크롤링을 -a resume=1 로 이어서 실행할 수 있게 합니다.
+"""
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+
+class CrawlCheckpoint:
+    """
+    크롤링 진행 상태 (output/<spider>/checkpoint.json)
+
+    목록 페이지는 그 페이지에서 상세 수집할 문서가 모두 저장(또는 실패로 기록)되었을 때 완료로 기록합니다.
+    실패한 문서는 URL과 함께 보관하여 재개 시 상세 요청만 다시 보냅니다.
+    저장한 문서 키와 결과 파일 위치는 파이프라인이 결과 파일을 디스크에 반영한 직후에만 기록하므로,
+    체크포인트에 있는 문서는 항상 결과 파일의 기록 위치 안에 있습니다.
+    """
+
+    def __init__(self, path, on_pages_saved=None):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.output_path = None
+        self.output_offset = 0
+        self.items_written = 0
+        self.completed_pages = set()
+        self.emitted = set()
+        self.failed = {}  # 상세 수집에 실패한 문서 키 -> {url, title, page} (페이지는 완료 처리, 재개 시 다시 요청)
+        self.pending = {}  # 페이지 -> 아직 저장되지 않은 문서 키
+        self.saved_at = None
+
+        # on_pages_saved({페이지: 저장한 문서 수}): 완료한 페이지가 결과 파일과 함께 디스크에 반영된 뒤 호출
+        # 설정하면 페이지가 완료될 때마다 save_output(파이프라인이 지정, 결과 파일 반영 후 save 호출)으로 바로 저장
+        self.on_pages_saved = on_pages_saved
+        self.save_output = None
+        self.page_items = {}
+        self.unsaved_pages = {}
+
+    @classmethod
+    def load(cls, path):
+        """저장된 체크포인트 로드 (없거나 읽을 수 없으면 None)"""
+        checkpoint = cls(path)
+        if not checkpoint.path.exists():
+            return None
+
+        try:
+            with open(checkpoint.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            checkpoint.logger.error(f"체크포인트 읽기 실패 ({checkpoint.path}): {e}")
+            return None
+
+        checkpoint.output_path = data.get('output_path')
+        checkpoint.output_offset = data.get('output_offset', 0)
+        checkpoint.items_written = data.get('items_written', 0)
+        checkpoint.completed_pages = set(data.get('completed_pages', []))
+        checkpoint.emitted = set(data.get('emitted', []))
+        checkpoint.failed = data.get('failed') or {}
+        checkpoint.saved_at = data.get('saved_at')
+        return checkpoint
+
+    def start_page(self, page_number, keys):
+        """목록 페이지에서 상세 수집할 문서 키 등록 (없으면 바로 완료)"""
+        pending = {key for key in keys if key not in self.emitted}
+        if pending:
+            self.pending[page_number] = pending
+            self.page_items[page_number] = 0
+        else:
+            self._complete_page(page_number)
+
+    def record_item(self, key, page_number=None):
+        """결과 파일에 기록한 문서"""
+        self.emitted.add(key)
+        self.failed.pop(key, None)
+        self._finish_key(key, page_number, saved=True)
+
+    def fail_item(self, key, page_number=None, url=None, title=None):
+        """상세 요청/파싱에 실패한 문서 (저장하지 않고 페이지의 대기 목록에서만 제외, 재개 시 url로 다시 요청)"""
+        if key not in self.emitted:
+            self.failed[key] = {'url': url, 'title': title, 'page': page_number}
+        self._finish_key(key, page_number)
+
+    def discard_page(self, page_number):
+        """처리를 포기한 페이지 (남은 문서가 저장되어도 완료로 기록하지 않음)"""
+        self.pending.pop(page_number, None)
+        self.page_items.pop(page_number, None)
+
+    def _finish_key(self, key, page_number, saved=False):
+        pending = self.pending.get(page_number)
+        if pending is None or key not in pending:
+            return
+
+        pending.discard(key)
+        if saved:
+            self.page_items[page_number] += 1
+        if not pending:
+            del self.pending[page_number]
+            self._complete_page(page_number)
+
+    def _complete_page(self, page_number):
+        self.completed_pages.add(page_number)
+        items = self.page_items.pop(page_number, 0)
+        if self.on_pages_saved is None:
+            return
+
+        self.unsaved_pages[page_number] = items
+        if self.save_output is not None:
+            self.save_output()
+        else:
+            self._notify_saved()  # 결과 파일이 없거나 이미 닫힘
+
+    def _notify_saved(self):
+        if self.unsaved_pages:
+            pages, self.unsaved_pages = self.unsaved_pages, {}
+            self.on_pages_saved(pages)
+
+    def is_completed(self, page_number):
+        return page_number in self.completed_pages
+
+    def is_emitted(self, key):
+        return key in self.emitted
+
+    def save(self, output_path, output_offset, items_written):
+        """
+        현재 상태 저장 (임시 파일 후 교체)
+        output_offset은 디스크에 반영된 결과 파일 크기 (재개 시 이 위치 뒤는 잘라내고 이어서 기록)
+        """
+        self.output_path = str(output_path)
+        self.output_offset = output_offset
+        self.items_written = items_written
+        self.saved_at = datetime.now().isoformat()
+        data = {
+            'saved_at': self.saved_at,
+            'output_path': self.output_path,
+            'output_offset': self.output_offset,
+            'items_written': self.items_written,
+            'completed_pages': sorted(self.completed_pages),
+            'emitted': sorted(self.emitted),
+            'failed': self.failed,
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"체크포인트 저장 실패: {e}")
+            return
+
+        if self.on_pages_saved is not None:
+            self._notify_saved()
+
+    def remove(self):
+        """정상 종료 시 삭제 (다음 resume은 처음부터 크롤링)"""
+        try:
+            self.path.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.error(f"체크포인트 삭제 실패: {e}")
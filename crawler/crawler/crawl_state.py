@@ -0,0 +1,123 @@
+"""
+증분 크롤링을 위한 크롤 상태 저장소
+문서 키(KNREC는 FAQ 'no' 값)별로 목록 서명, 본문 해시, 확인 시각을 SQLite에 보관합니다.
+"""
+import hashlib
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+class CrawlStateStore:
+    """
+    문서별 마지막 크롤링 상태를 보관하는 SQLite 저장소
+
+    목록 페이지에서 얻은 제목 등으로 만든 목록 서명이 이전 실행과 같으면
+    상세 페이지를 다시 가져올 필요가 없는 것으로 판단합니다.
+    """
+
+    # 이 횟수만큼 기록할 때마다 커밋 (종료 시 나머지 커밋)
+    COMMIT_INTERVAL = 50
+
+    def __init__(self, db_path):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                list_hash TEXT NOT NULL,
+                content_hash TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                last_changed TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.pending_writes = 0
+
+        count = self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        self.logger.info(f"크롤 상태 저장소 로드: {self.db_path} ({count}개 문서)")
+
+    @staticmethod
+    def hash_text(*parts):
+        """텍스트 조각들의 SHA-1 해시"""
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update((part or '').strip().encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def get(self, doc_id):
+        """문서 상태 조회"""
+        row = self.conn.execute(
+            "SELECT doc_id, url, list_hash, content_hash, first_seen, last_seen, last_changed "
+            "FROM documents WHERE doc_id = ?",
+            (doc_id,)
+        ).fetchone()
+        if not row:
+            return None
+
+        keys = ('doc_id', 'url', 'list_hash', 'content_hash', 'first_seen', 'last_seen', 'last_changed')
+        return dict(zip(keys, row))
+
+    def is_unchanged(self, doc_id, *list_parts):
+        """이전에 본문까지 수집했고 목록 서명이 같으면 True"""
+        state = self.get(doc_id)
+        if not state or not state['content_hash']:
+            return False
+        return state['list_hash'] == self.hash_text(*list_parts)
+
+    def touch(self, doc_id):
+        """변경 없는 문서의 마지막 확인 시각 갱신"""
+        self.conn.execute(
+            "UPDATE documents SET last_seen = ? WHERE doc_id = ?",
+            (datetime.now().isoformat(), doc_id)
+        )
+        self._maybe_commit()
+
+    def record(self, doc_id, url, list_parts, content):
+        """
+        수집한 문서 상태 기록
+
+        Returns:
+            bool: 새 문서이거나 본문이 바뀌었으면 True
+        """
+        now = datetime.now().isoformat()
+        list_hash = self.hash_text(*list_parts)
+        content_hash = self.hash_text(content)
+
+        state = self.get(doc_id)
+        changed = not state or state['content_hash'] != content_hash
+
+        self.conn.execute("""
+            INSERT INTO documents (doc_id, url, list_hash, content_hash, first_seen, last_seen, last_changed)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(doc_id) DO UPDATE SET
+                url = excluded.url,
+                list_hash = excluded.list_hash,
+                content_hash = excluded.content_hash,
+                last_seen = excluded.last_seen,
+                last_changed = CASE WHEN documents.content_hash = excluded.content_hash
+                                    THEN documents.last_changed ELSE excluded.last_changed END
+        """, (doc_id, url, list_hash, content_hash, now, now, now))
+        self._maybe_commit()
+
+        return changed
+
+    def _maybe_commit(self):
+        self.pending_writes += 1
+        if self.pending_writes >= self.COMMIT_INTERVAL:
+            self.conn.commit()
+            self.pending_writes = 0
+
+    def close(self):
+        """남은 변경사항 커밋 후 연결 종료"""
+        try:
+            self.conn.commit()
+        finally:
+            self.conn.close()
@@ -0,0 +1,85 @@
+"""
+Scrapy 확장
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from twisted.internet import task
+
+from crawler.latency import LatencyStats
+
+
+class StatsDumpExtension:
+    """
+    크롤링 stats와 지연 시간 요약을 주기적으로 JSON 파일에 저장
+    STATS_DUMP_INTERVAL초마다, 그리고 스파이더 종료 시 기록합니다.
+    """
+
+    def __init__(self, crawler, interval, path=None):
+        self.logger = logging.getLogger(__name__)
+        self.crawler = crawler
+        self.interval = interval
+        self.path = path
+        self.latency = LatencyStats.for_crawler(crawler)
+        self.task = None
+        self.started_at = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        interval = crawler.settings.getfloat('STATS_DUMP_INTERVAL', 0)
+        if interval <= 0:
+            raise NotConfigured
+
+        extension = cls(crawler, interval, crawler.settings.get('STATS_DUMP_FILE'))
+        crawler.signals.connect(extension.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        return extension
+
+    def spider_opened(self, spider):
+        # 미지정 시 output/<spider>/stats.json (크롤 상태 파일과 같은 위치)
+        if not self.path:
+            output_dir = getattr(spider, 'output_dir', Path('output'))
+            self.path = Path(output_dir) / spider.name / 'stats.json'
+        self.path = Path(self.path)
+        self.started_at = time.monotonic()
+
+        self.task = task.LoopingCall(self.dump, spider, False)
+        self.task.start(self.interval, now=False)
+        self.logger.info(f"stats 주기 저장: {self.path} ({self.interval}초 간격)")
+
+    def spider_closed(self, spider, reason):
+        if self.task and self.task.running:
+            self.task.stop()
+        self.dump(spider, True, reason)
+
+    def dump(self, spider, final=False, reason=None):
+        """현재 stats와 지연 시간 요약을 파일에 기록 (임시 파일 후 교체)"""
+        latency = self.latency.export()
+        snapshot = {
+            'spider': spider.name,
+            'dumped_at': datetime.now().isoformat(),
+            'elapsed_sec': round(time.monotonic() - self.started_at, 2),
+            'final': final,
+            'finish_reason': reason,
+            'latency': latency,
+            'stats': {
+                key: value for key, value in self.crawler.stats.get_stats().items()
+                if not key.startswith('latency/')
+            },
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"stats 저장 실패: {e}")
@@ -0,0 +1,121 @@
+"""
+작업별 지연 시간 히스토그램
+Selenium 탐색/대기/클릭/추출 등의 소요 시간을 로그 스케일 버킷에 누적하고,
+p50/p95/p99 요약을 Scrapy stats(latency/<작업>/...)로 내보냅니다.
+"""
+import math
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+
+class LatencyHistogram:
+    """
+    로그 스케일 버킷 히스토그램 (샘플을 보관하지 않아 장시간 크롤링에도 메모리 일정)
+    백분위수는 해당 버킷의 상한값이므로 오차는 버킷 비율(GROWTH) 이내
+    """
+
+    MIN_MS = 0.1
+    GROWTH = 1.1
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def bucket_index(self, ms):
+        if ms <= self.MIN_MS:
+            return 0
+        return int(math.ceil(math.log(ms / self.MIN_MS, self.GROWTH)))
+
+    def bucket_upper(self, index):
+        return self.MIN_MS * (self.GROWTH ** index)
+
+    def add(self, ms):
+        index = self.bucket_index(ms)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, pct):
+        """백분위수 (밀리초)"""
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # 버킷 상한이 실제 최대값보다 클 수 있으므로 최대값으로 제한
+                return min(self.bucket_upper(index), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count, 2) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50), 2),
+            'p95_ms': round(self.percentile(95), 2),
+            'p99_ms': round(self.percentile(99), 2),
+            'max_ms': round(self.max, 2),
+        }
+
+
+class LatencyStats:
+    """
+    작업 이름별 지연 시간 히스토그램 모음
+    드라이버 풀/미들웨어 워커 스레드에서도 기록할 수 있도록 잠금 사용
+    """
+
+    _by_crawler = weakref.WeakKeyDictionary()
+
+    def __init__(self, stats=None, crawler=None):
+        self.stats = stats
+        # 스파이더 생성 시점에는 crawler.stats가 아직 없으므로 내보낼 때 조회
+        self.crawler = crawler
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def for_crawler(cls, crawler):
+        """크롤러별 공용 인스턴스 (스파이더, 미들웨어, 확장이 같은 히스토그램 사용)"""
+        latency = cls._by_crawler.get(crawler)
+        if latency is None:
+            latency = cls(crawler=crawler)
+            cls._by_crawler[crawler] = latency
+        return latency
+
+    def record(self, name, seconds):
+        """소요 시간(초) 기록"""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.add(seconds * 1000)
+
+    @contextmanager
+    def timer(self, name):
+        """with 블록 소요 시간 기록 (예외가 발생해도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def summaries(self):
+        with self.lock:
+            return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def export(self):
+        """요약을 Scrapy stats에 반영 (latency/<작업>/p95_ms 등)"""
+        summaries = self.summaries()
+        stats = self.stats if self.stats is not None else getattr(self.crawler, 'stats', None)
+        if stats is not None:
+            for name, summary in summaries.items():
+                for key, value in summary.items():
+                    stats.set_value(f'latency/{name}/{key}', value)
+        return summaries
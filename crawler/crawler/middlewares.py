@@ -4,12 +4,20 @@
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
 from scrapy import signals
+from scrapy.exceptions import IgnoreRequest
 from scrapy.http import HtmlResponse
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
-import time
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet import task, threads
+from twisted.python.threadpool import ThreadPool
+from scrapy.utils.project import data_path
+import queue
+import threading
+
+from common.waits import PolitenessDelay, wait_for_height_change, wait_for_network_idle, wait_for_selector
+from common.webdriver_factory import create_chrome_driver
+from common.managed_driver import ManagedDriver
+from crawler.render_cache import RenderCache
+from crawler.latency import LatencyStats
 
 
 class CrawlerSpiderMiddleware:
@@ -102,101 +110,260 @@ class CrawlerDownloaderMiddleware:
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
 
+class SharedPolitenessMiddleware:
+    """
+    샤드 크롤링(-a work_queue=...) 시 Scrapy 요청에도 모든 워커 프로세스가 공유하는 호스트별 요청 간격 적용
+    워커마다 DOWNLOAD_DELAY를 두면 전체 요청 속도가 워커 수에 비례해 늘어나므로 대신 사용합니다.
+    """
+
+    async def process_request(self, request, spider):
+        # Selenium 요청은 SeleniumMiddleware가 브라우저 탐색 직전에 같은 예약을 사용
+        if not getattr(spider, 'work_queue', None) or request.meta.get('selenium', False):
+            return None
+
+        from twisted.internet import reactor
+        # 예약은 SQLite 쓰기 트랜잭션 (다른 워커와 잠금 경합 시 대기)이므로 리액터 스레드 밖에서 수행
+        remaining = await maybe_deferred_to_future(threads.deferToThread(spider.politeness.reserve, request.url))
+        if remaining > 0:
+            await maybe_deferred_to_future(task.deferLater(reactor, remaining, lambda: None))
+        return None
+
+
 class SeleniumMiddleware:
-    """Scrapy middleware using selenium"""
+    """
+    Scrapy middleware using selenium
+    
+    meta['selenium']이 설정된 요청만 처리하며, 브라우저 작업은 드라이버 풀(SELENIUM_MIDDLEWARE_POOL_SIZE개)을 가진
+    별도 스레드 풀에서 수행하여 리액터 스레드(일반 HTTP 다운로드)를 막지 않습니다.
+    스파이더의 드라이버 풀(SELENIUM_DRIVER_POOL_SIZE)과는 따로 생성됩니다.
+    렌더링 캐시가 켜져 있으면 meta['render_state'](탭 상태 등)까지 포함한 키로 결과를 재사용합니다.
+    """
 
-    def __init__(self, timeout=15):
+    def __init__(self, timeout=15, pool_size=1, politeness_delays=None,
+                 headless=True, block_profile='text', blocked_url_patterns=None,
+                 render_cache=None, stats=None, latency=None, recycle=None):
         self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.headless = headless
+        self.block_profile = block_profile
+        self.blocked_url_patterns = blocked_url_patterns or []
+        # 브라우저 탐색은 Scrapy DOWNLOAD_DELAY를 거치지 않으므로 사이트별 간격을 직접 적용
+        self.politeness = PolitenessDelay(politeness_delays)
+        self.threadpool = None
+        self.drivers = []
+        self.idle_drivers = queue.Queue()
+        self.drivers_lock = threading.Lock()
+        self.render_cache = render_cache
+        self.stats = stats
+        self.latency = latency or LatencyStats(stats)
+        # 드라이버 재시작 기준 (ManagedDriver의 max_pages, max_rss_mb, max_timeouts)
+        self.recycle = recycle or {}
 
     @classmethod
     def from_crawler(cls, crawler):
         middleware = cls(
-            timeout=crawler.settings.get('SELENIUM_TIMEOUT', 15)
+            timeout=crawler.settings.getint('SELENIUM_TIMEOUT', 15),
+            pool_size=crawler.settings.getint('SELENIUM_MIDDLEWARE_POOL_SIZE', 1),
+            politeness_delays=crawler.settings.getdict('SITE_POLITENESS_DELAYS'),
+            headless=crawler.settings.getbool('SELENIUM_HEADLESS', True),
+            block_profile=crawler.settings.get('SELENIUM_BLOCK_PROFILE', 'text'),
+            blocked_url_patterns=crawler.settings.getlist('SELENIUM_BLOCKED_URL_PATTERNS'),
+            render_cache=RenderCache(
+                data_path(crawler.settings.get('RENDER_CACHE_DIR', 'render_cache'), createdir=True),
+                mode=crawler.settings.get('RENDER_CACHE_MODE', 'off'),
+                expiration_secs=crawler.settings.getint('RENDER_CACHE_EXPIRATION_SECS', 0)
+            ),
+            stats=crawler.stats,
+            latency=LatencyStats.for_crawler(crawler),
+            recycle={
+                'max_pages': crawler.settings.getint('SELENIUM_RECYCLE_PAGES', 0),
+                'max_rss_mb': crawler.settings.getint('SELENIUM_RECYCLE_RSS_MB', 0),
+                'max_timeouts': crawler.settings.getint('SELENIUM_RECYCLE_TIMEOUTS', 0),
+            }
         )
         crawler.signals.connect(middleware.spider_opened, signal=signals.spider_opened)
         crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
         return middleware
 
     def spider_opened(self, spider):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+        # 스파이더 인자(-a render_cache=replay)로 캐시 모드를 바꾼 경우 스파이더의 캐시를 함께 사용
+        self.render_cache = getattr(spider, 'render_cache', None) or self.render_cache
+        # 샤드 크롤링에서는 모든 워커가 공유하는 요청 간격 사용
+        if getattr(spider, 'work_queue', None):
+            self.politeness = spider.politeness
+        # 드라이버는 첫 Selenium 요청 시 워커 스레드에서 생성 (Selenium 요청이 없으면 Chrome 미실행)
+        self.threadpool = ThreadPool(minthreads=0, maxthreads=self.pool_size, name='SeleniumMiddleware')
+        self.threadpool.start()
+        spider.logger.info(f"SeleniumMiddleware - 스레드 풀 시작 (최대 드라이버 {self.pool_size}개)")
+    
+    def spider_closed(self, spider):
+        if self.threadpool:
+            self.threadpool.stop()
+            self.threadpool = None
         
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                spider.logger.error(f"SeleniumMiddleware - Chrome driver close failed: {e}")
+        if self.drivers:
+            spider.logger.info(f"SeleniumMiddleware - Chrome driver closed ({len(self.drivers)}개)")
+        self.drivers = []
+
+    def create_driver(self):
+        """재시작 관리 드라이버 생성 (렌더링마다 페이지를 새로 열므로 화면 상태 복원은 필요 없음)"""
+        return ManagedDriver(
+            self.create_browser,
+            stats=self.stats,
+            name=f'SeleniumMiddleware 드라이버 {len(self.drivers)}',
+            **self.recycle
+        )
+
+    def create_browser(self):
         user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-        chrome_options.add_argument(f"user-agent={user_agent}")
+        return create_chrome_driver(
+            headless=self.headless,
+            block_profile=self.block_profile,
+            blocked_url_patterns=self.blocked_url_patterns,
+            user_agent=user_agent,
+            page_load_timeout=self.timeout,
+            use_webdriver_manager=True
+        )
+
+    def acquire_driver(self, spider):
+        """유휴 드라이버를 가져오고, 없으면 풀 크기 내에서 새로 생성"""
+        try:
+            return self.idle_drivers.get_nowait()
+        except queue.Empty:
+            pass
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.set_page_load_timeout(self.timeout)
-        spider.logger.info("SeleniumMiddleware - Chrome driver initialized")
-    
-    def spider_closed(self, spider):
-        if hasattr(self, 'driver'):
-            self.driver.quit()
-            spider.logger.info("SeleniumMiddleware - Chrome driver closed")
+        with self.drivers_lock:
+            create = len(self.drivers) < self.pool_size
+            if create:
+                self.drivers.append(None)  # 생성 중인 자리 예약
+        
+        if not create:
+            return self.idle_drivers.get()
+        
+        try:
+            driver = self.create_driver()
+        except Exception:
+            with self.drivers_lock:
+                self.drivers.remove(None)
+            raise
+        
+        with self.drivers_lock:
+            self.drivers[self.drivers.index(None)] = driver
+        spider.logger.info(f"SeleniumMiddleware - Chrome driver initialized ({len(self.drivers)}/{self.pool_size})")
+        return driver
 
-    def process_request(self, request, spider):
+    def release_driver(self, driver):
+        self.idle_drivers.put(driver)
+
+    async def process_request(self, request, spider):
         if not request.meta.get('selenium', False):
             return None
         spider.logger.info(f"SeleniumMiddleware - Processing request: {request.url}")
 
+        cached = self.load_cached_response(request)
+        if cached is not None:
+            return cached
+        if self.render_cache and self.render_cache.replay:
+            raise IgnoreRequest(f"SeleniumMiddleware - 렌더링 캐시 없음 (replay 모드): {request.url}")
+
+        from twisted.internet import reactor
         try:
-            self.driver.get(request.url)
-            # 페이지 로딩 대기
-            wait_time = request.meta.get('wait_time', 3)
-            spider.logger.info(f"페이지 로딩 대기 시간: {wait_time}초")
-            time.sleep(wait_time)
-            # 스크롤
-            if request.meta.get('scroll', False):
-                self.scroll_to_bottom(self.driver)
-            # 특정 요소 대기
-            if 'wait_for' in request.meta:
-                self.wait_for_element(self.driver, request.meta['wait_for'])
-            # 페이지 HTML 소스 가져오기
-            body = self.driver.page_source
-            # 드라이버 객체를 메타에 추가
-            request.meta['driver'] = self.driver
-            spider.logger.info("셀레니움 드라이버를 메타에 추가했습니다.")
-            # HtmlResponse 반환
-            return HtmlResponse(
-                url=request.url,
-                body=body,
-                encoding='utf-8',
-                request=request,
-                status=200
+            # 브라우저 작업은 스레드 풀에서 수행 (리액터는 다른 다운로드를 계속 처리)
+            return await maybe_deferred_to_future(
+                threads.deferToThreadPool(reactor, self.threadpool, self.render, request, spider)
             )
         except Exception as e:
             spider.logger.error(f"SeleniumMiddleware - Error processing request: {e}")
             import traceback
             spider.logger.error(traceback.format_exc())
             return None
+
+    def render_state(self, request):
+        """캐시 키에 포함할 렌더링 상태 (탭 등 URL에 드러나지 않는 상태)"""
+        state = request.meta.get('render_state', '')
+        if request.meta.get('scroll', False):
+            state = f"{state}|scroll"
+        return state
+
+    def load_cached_response(self, request):
+        """렌더링 캐시에 있으면 캐시된 HtmlResponse 반환"""
+        if not self.render_cache or not self.render_cache.readable:
+            return None
+        
+        html = self.render_cache.get(request.url, self.render_state(request))
+        if html is None:
+            self.stats.inc_value('render_cache/miss')
+            return None
+        
+        self.stats.inc_value('render_cache/hit')
+        return HtmlResponse(
+            url=request.url,
+            body=html,
+            encoding='utf-8',
+            request=request,
+            status=200,
+            flags=['render_cache']
+        )
+
+    def render(self, request, spider):
+        """드라이버 풀의 브라우저로 페이지를 렌더링하여 HtmlResponse 생성 (워커 스레드에서 실행)"""
+        with self.latency.timer('selenium/pool_wait'):
+            driver = self.acquire_driver(spider)
+        try:
+            with self.latency.timer('selenium/politeness'):
+                self.politeness.wait(request.url)
+            with self.latency.timer('selenium/navigate'):
+                driver.get(request.url)
+            # 특정 요소 대기 (wait_time은 고정 대기가 아닌 최대 대기 시간)
+            wait_time = request.meta.get('wait_time', self.timeout)
+            with self.latency.timer('selenium/wait'):
+                if 'wait_for' in request.meta:
+                    self.wait_for_element(driver, request.meta['wait_for'], wait_time, spider)
+                else:
+                    # 대기할 요소가 없으면 비동기 로딩이 끝날 때까지 (eager 로드 전략 보완)
+                    wait_for_network_idle(driver, wait_time)
+            # 스크롤
+            if request.meta.get('scroll', False):
+                with self.latency.timer('selenium/scroll'):
+                    self.scroll_to_bottom(driver)
+            # 페이지 HTML 소스 가져오기
+            with self.latency.timer('selenium/extract'):
+                body = driver.page_source
+        finally:
+            # 풀 드라이버는 다른 요청이 재사용하므로 meta로 넘기지 않음
+            self.release_driver(driver)
+        
+        if self.render_cache and self.render_cache.put(request.url, body, self.render_state(request)):
+            self.stats.inc_value('render_cache/stored')
+        
+        # HtmlResponse 반환
+        return HtmlResponse(
+            url=request.url,
+            body=body,
+            encoding='utf-8',
+            request=request,
+            status=200
+        )
     
-    def scroll_to_bottom(self, driver):
-        """스크롤을 페이지 하단까지 내리는 함수"""
+    def scroll_to_bottom(self, driver, timeout=2):
+        """스크롤을 페이지 하단까지 내리는 함수 (높이 변화가 없으면 종료)"""
         last_height = driver.execute_script("return document.body.scrollHeight")
     
         while True:
             # 페이지 하단으로 스크롤
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")        
-            # 페이지 로딩 대기
-            time.sleep(2)
-            # 새 스크롤 높이 계산
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            # 스크롤 높이가 더 이상 변하지 않으면 종료
-            if new_height == last_height:
+            # 추가 콘텐츠 로딩으로 스크롤 높이가 늘어날 때까지 대기
+            if not wait_for_height_change(driver, last_height, timeout):
+                # 스크롤 높이가 더 이상 변하지 않으면 종료
                 break
-            last_height = new_height
+            last_height = driver.execute_script("return document.body.scrollHeight")
 
-    def wait_for_element(self, driver, selector):
+    def wait_for_element(self, driver, selector, timeout, spider):
         """특정 요소가 로드될 때까지 대기하는 함수"""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-        except Exception as e:
-            print(f"요소를 찾을 수 없습니다: {e}")
\ No newline at end of file
+        if not wait_for_selector(driver, selector, timeout):
+            spider.logger.warning(f"SeleniumMiddleware - 요소를 찾을 수 없습니다: {selector}")
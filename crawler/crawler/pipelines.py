@@ -6,11 +6,49 @@
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
-from scrapy.exceptions import DropItem
+from scrapy.exceptions import DropItem, NotConfigured
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet import defer, threads
+from twisted.python.threadpool import ThreadPool
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import gzip
+import hashlib
 import json
 import re
+import threading
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+from common.bloom_filter import KeySet
+from common.url_canonicalizer import URLCanonicalizer
+
+try:
+    import orjson
+except ImportError:  # 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 사항
+    zstandard = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet 내보내기는 선택 사항
+    pa = None
+    pq = None
+
+
+def output_basename(spider):
+    """결과 파일 이름 (스파이더 이름_타임스탬프, 샤드 워커는 워커 ID를 붙여 파일이 겹치지 않게 함)"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if getattr(spider, 'work_queue', None):
+        return f"{spider.name}_{timestamp}_{spider.worker_id}"
+    return f"{spider.name}_{timestamp}"
 
 
 class CrawlerPipeline:
@@ -20,39 +58,164 @@ class CrawlerPipeline:
 class RenewableEnergyPipeline:
     """
     재생에너지 데이터를 처리하고 저장하는 파이프라인
+    
+    OUTPUT_FORMAT='jsonl'이면 아이템을 한 줄씩 기록하여 크롤링이 중단되어도 기록된 줄은 그대로 읽을 수 있고,
+    OUTPUT_COMPRESSION('gzip', 'zstd')으로 압축하여 저장합니다. 'json'은 기존 JSON 배열 형식입니다.
+    중복 확인은 스파이더의 문서 필터(document_filter)를 공유하여, 스파이더가 상세 수집 전에 저장된 문서를 건너뛸 수 있습니다.
     """
-    def __init__(self):
-        self.ids_seen = set()
+    def __init__(self, output_format='jsonl', compression=None, buffer_size=1024 * 1024, fsync_every=500,
+                 data_dir='./output/data', checkpoint_every=50):
+        self.ids_seen = None
+        self.data_dir = data_dir
+        self.document_key = URLCanonicalizer().document_key
         self.file = None
+        self.raw_file = None
+        self.filepath = None
+        self.output_format = output_format
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.fsync_every = fsync_every
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint = None
+        self.items_written = 0
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            output_format=crawler.settings.get('OUTPUT_FORMAT', 'jsonl'),
+            compression=crawler.settings.get('OUTPUT_COMPRESSION'),
+            buffer_size=crawler.settings.getint('OUTPUT_BUFFER_SIZE', 1024 * 1024),
+            fsync_every=crawler.settings.getint('OUTPUT_FSYNC_EVERY', 500),
+            data_dir=crawler.settings.get('OUTPUT_DATA_DIR', './output/data'),
+            checkpoint_every=crawler.settings.getint('CHECKPOINT_INTERVAL', 50)
+        )
 
     def open_spider(self, spider):
         # 저장 디렉토리 생성
-        self.data_dir = './output/data'
         os.makedirs(self.data_dir, exist_ok=True)
 
+        if self.compression == 'zstd' and zstandard is None:
+            spider.logger.warning("zstandard 패키지 없음 - gzip으로 압축합니다")
+            self.compression = 'gzip'
+
         # 파일명에 스파이더 이름과 타임스탬프 사용
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{spider.name}_{timestamp}.json"
-        filepath = os.path.join(self.data_dir, filename)
+        extension = '.jsonl' if self.output_format == 'jsonl' else '.json'
+        extension += {'gzip': '.gz', 'zstd': '.zst'}.get(self.compression, '')
+        
+        # 재개(-a resume=1): 체크포인트의 결과 파일을 마지막 체크포인트 위치까지 잘라내고 이어서 기록
+        self.checkpoint = getattr(spider, 'checkpoint', None)
+        resumed = self.resumable_output(spider, extension)
+        if resumed:
+            self.filepath = resumed
+            self.raw_file = open(self.filepath, 'r+b', buffering=self.buffer_size)
+            self.raw_file.truncate(self.checkpoint.output_offset)
+            self.raw_file.seek(self.checkpoint.output_offset)
+            self.items_written = self.checkpoint.items_written
+        else:
+            self.filepath = os.path.join(self.data_dir, f"{output_basename(spider)}{extension}")
+            self.raw_file = open(self.filepath, 'wb', buffering=self.buffer_size)
+        
+        # 큰 쓰기 버퍼 위에 압축 스트림을 연결
+        self.file = self.open_stream()
+
+        if self.output_format != 'jsonl' and not resumed:
+            self.file.write(b'[\n')
+        self.first_item = self.items_written == 0
         
-        self.file = open(filepath, 'w', encoding='utf-8')
-        self.file.write('[\n')
-        self.first_item = True
+        # 스파이더에 문서 필터가 없으면 이번 실행용 필터 사용
+        self.ids_seen = getattr(spider, 'document_filter', None)
+        if self.ids_seen is None:
+            self.ids_seen = KeySet()
+        self.document_key = getattr(spider, 'document_key', self.document_key)
         
-        spider.logger.info(f"결과를 {filepath} 파일에 저장합니다.")
+        # 페이지 완료를 바로 알려야 하는 경우(샤드 워커) 결과 파일을 반영한 뒤 체크포인트 저장
+        if self.checkpoint:
+            self.checkpoint.save_output = self.save_checkpoint
+        
+        if resumed:
+            spider.logger.info(f"체크포인트부터 이어서 저장: {self.filepath} (기존 {self.items_written}개)")
+        else:
+            spider.logger.info(f"결과를 {self.filepath} 파일에 저장합니다.")
+
+    def resumable_output(self, spider, extension):
+        """이어서 기록할 결과 파일 경로 (재개 모드가 아니거나 형식이 다르면 None)"""
+        if not self.checkpoint or not getattr(spider, 'resume', False):
+            return None
+        
+        path = self.checkpoint.output_path
+        if not path or not os.path.exists(path):
+            return None
+        if not path.endswith(extension):
+            spider.logger.warning(f"체크포인트 결과 파일 형식이 현재 설정과 다름 - 새 파일에 저장: {path}")
+            return None
+        return path
+
+    def open_stream(self):
+        """결과 파일 위에 압축 스트림 연결 (압축하지 않으면 파일 그대로)"""
+        if self.compression == 'gzip':
+            return gzip.GzipFile(fileobj=self.raw_file, mode='wb', compresslevel=6)
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor().stream_writer(self.raw_file, closefd=False)
+        return self.raw_file
 
     def close_spider(self, spider):
         if self.file:
-            self.file.write('\n]')
+            # 체크포인트는 JSON 배열의 닫는 괄호 전 위치로 저장 (재개 시 괄호를 잘라내고 이어서 기록)
+            if self.checkpoint:
+                self.save_checkpoint()
+                self.checkpoint.save_output = None
+            if self.output_format != 'jsonl':
+                self.file.write(b'\n]')
+            self.flush(sync=True)
+            if self.file is not self.raw_file:
+                self.file.close()
+            self.raw_file.close()
+            self.file = None
+            self.raw_file = None
+
+    def flush(self, sync=False):
+        """버퍼와 압축 블록을 파일에 기록 (sync이면 디스크까지 fsync)"""
+        if self.compression == 'zstd':
+            self.file.flush(zstandard.FLUSH_BLOCK)
+        elif self.file is not self.raw_file:
+            self.file.flush()
+        self.raw_file.flush()
+        if sync:
+            os.fsync(self.raw_file.fileno())
+
+    def save_checkpoint(self):
+        """
+        압축 단위(gzip 멤버, zstd 프레임)를 끝맺고 디스크에 반영한 뒤 체크포인트 저장
+        체크포인트 위치까지는 완결된 압축 스트림이므로 재개 시 잘라낸 뒤 새 멤버/프레임을 이어 붙일 수 있음
+        """
+        if self.compression == 'gzip':
             self.file.close()
+        elif self.compression == 'zstd':
+            self.file.flush(zstandard.FLUSH_FRAME)
+        self.raw_file.flush()
+        os.fsync(self.raw_file.fileno())
+        self.checkpoint.save(self.filepath, self.raw_file.tell(), self.items_written)
+        
+        if self.compression == 'gzip':
+            self.file = self.open_stream()
+
+    def serialize(self, item):
+        """아이템을 UTF-8 JSON 바이트로 변환 (orjson이 있으면 사용)"""
+        record = ItemAdapter(item).asdict()
+        if orjson is not None:
+            return orjson.dumps(record, default=str)
+        return json.dumps(record, ensure_ascii=False, default=str).encode('utf-8')
 
     def process_item(self, item, spider):
         adapter = ItemAdapter(item)
         
         url = adapter.get('url')
-        if url in self.ids_seen:
+        key = self.document_key(url) if url else None
+        if key and not self.ids_seen.add(key):
+            # 이미 저장된 문서 - 체크포인트의 페이지 대기 목록에서는 제외해야 페이지가 완료됨
+            if self.checkpoint:
+                self.checkpoint.record_item(key, adapter.get('page'))
             raise DropItem(f"Duplicate item found: {item['url']}")
-        self.ids_seen.add(url)
         
         # 크롤링 시간 추가
         adapter['crawled_at'] = datetime.now().isoformat()
@@ -63,13 +226,26 @@ class RenewableEnergyPipeline:
         if 'content' in adapter:
             adapter['content'] = self._clean_text(adapter['content'])
 
-        # JSON으로 저장
-        line = json.dumps(ItemAdapter(item).asdict(), ensure_ascii=False)
-        if self.first_item:
-            self.first_item = False
+        line = self.serialize(item)
+        if self.output_format == 'jsonl':
+            # JSON Lines: 줄 단위로 완결되므로 중단되어도 기록된 줄은 유효
+            self.file.write(line + b'\n')
         else:
-            self.file.write(',\n')
-        self.file.write(line)
+            # JSON 배열
+            if self.first_item:
+                self.first_item = False
+            else:
+                self.file.write(b',\n')
+            self.file.write(line)
+
+        # 주기적으로 디스크에 반영 (중단 시 손실 범위 제한, 체크포인트 저장 시에도 반영)
+        self.items_written += 1
+        if self.checkpoint:
+            self.checkpoint.record_item(key, adapter.get('page'))
+            if self.checkpoint_every and self.items_written % self.checkpoint_every == 0:
+                self.save_checkpoint()
+        elif self.fsync_every and self.items_written % self.fsync_every == 0:
+            self.flush(sync=True)
         
         return item 
 
@@ -81,43 +257,322 @@ class RenewableEnergyPipeline:
         text = re.sub(r'\s+', ' ', text).strip()
         return text
 
+class ParquetExportPipeline:
+    """
+    수집 결과를 Parquet 파일로 내보내는 파이프라인 (pyarrow 필요)
+    
+    PARQUET_ROW_GROUP_SIZE개마다 row group을 기록하고, 값 종류가 적은
+    source/document_type/spider 컬럼은 사전(dictionary) 인코딩합니다.
+    RenewableEnergyPipeline 뒤에 두면 정리된 텍스트가 저장됩니다.
+    """
+    # RenewableEnergyItem 필드 순서
+    COLUMNS = [
+        'page', 'title', 'content', 'url', 'source', 'document_type', 'date_published',
+        'spider', 'post_no', 'file_urls', 'files', 'crawled_at'
+    ]
+    DICTIONARY_COLUMNS = ['source', 'document_type', 'spider']
+    
+    def __init__(self, row_group_size=1000, compression='zstd', data_dir='./output/data'):
+        self.row_group_size = row_group_size
+        self.data_dir = data_dir
+        self.compression = compression
+        self.writer = None
+        self.rows = {column: [] for column in self.COLUMNS}
+        self.buffered = 0
+        self.items_written = 0
+        self.schema = pa.schema([
+            ('page', pa.int32()),
+            ('title', pa.string()),
+            ('content', pa.string()),
+            ('url', pa.string()),
+            ('source', pa.string()),
+            ('document_type', pa.string()),
+            ('date_published', pa.string()),
+            ('spider', pa.string()),
+            ('post_no', pa.string()),
+            ('file_urls', pa.list_(pa.string())),
+            ('files', pa.string()),  # 다운로드 결과(dict 목록)는 JSON 문자열로 저장
+            ('crawled_at', pa.string()),
+        ])
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('PARQUET_EXPORT_ENABLED', False):
+            raise NotConfigured
+        if pa is None:
+            raise NotConfigured("Parquet 내보내기에는 pyarrow 패키지가 필요합니다")
+        return cls(
+            row_group_size=crawler.settings.getint('PARQUET_ROW_GROUP_SIZE', 1000),
+            compression=crawler.settings.get('PARQUET_COMPRESSION', 'zstd'),
+            data_dir=crawler.settings.get('OUTPUT_DATA_DIR', './output/data')
+        )
+    
+    def open_spider(self, spider):
+        os.makedirs(self.data_dir, exist_ok=True)
+        
+        self.filepath = os.path.join(self.data_dir, f"{output_basename(spider)}.parquet")
+        self.writer = pq.ParquetWriter(
+            self.filepath,
+            self.schema,
+            compression=self.compression,
+            use_dictionary=self.DICTIONARY_COLUMNS
+        )
+        spider.logger.info(f"Parquet 결과를 {self.filepath} 파일에 저장합니다.")
+    
+    def close_spider(self, spider):
+        if self.writer:
+            self.write_row_group()
+            self.writer.close()
+            self.writer = None
+            spider.logger.info(f"Parquet 저장 완료: {self.filepath} ({self.items_written}개)")
+    
+    def process_item(self, item, spider):
+        adapter = ItemAdapter(item)
+        
+        for column in self.COLUMNS:
+            value = adapter.get(column)
+            if column == 'page' and value is not None:
+                value = int(value)
+            elif column == 'file_urls' and value is not None:
+                value = [str(url) for url in value]
+            elif column == 'files' and value is not None:
+                value = json.dumps(value, ensure_ascii=False, default=str)
+            elif value is not None and not isinstance(value, str):
+                value = str(value)
+            self.rows[column].append(value)
+        
+        self.buffered += 1
+        if self.buffered >= self.row_group_size:
+            self.write_row_group()
+        
+        return item
+    
+    def write_row_group(self):
+        """버퍼의 아이템들을 row group 하나로 기록"""
+        if not self.buffered:
+            return
+        
+        table = pa.Table.from_pydict(self.rows, schema=self.schema)
+        self.writer.write_table(table, row_group_size=self.buffered)
+        self.items_written += self.buffered
+        self.rows = {column: [] for column in self.COLUMNS}
+        self.buffered = 0
+
 class FileDownloadPipeline:
     """
     첨부 파일을 다운로드하는 파이프라인
+    
+    다운로드는 별도 스레드 풀(FILE_DOWNLOAD_CONCURRENCY개)에서 스레드별로 연결을 재사용하는 requests.Session으로
+    수행하여 리액터를 막지 않습니다. 중단된 파일은 .partial에 남겨 두었다가 HTTP Range로 이어받되,
+    처음 받을 때 저장한 ETag/Last-Modified를 If-Range로 보내 원격 파일이 바뀌었으면 처음부터 다시 받습니다.
+    완료된 파일은 SHA-256 해시 경로(<해시 앞 2자리>/<해시><확장자>)에 저장하여 같은 내용은 한 번만 보관합니다.
     """
     
-    def __init__(self, files_dir):
-        self.files_dir = files_dir
+    def __init__(self, files_dir, concurrency=4, timeout=30, retries=3, user_agent=None, stats=None):
+        self.files_dir = Path(files_dir)
+        self.partial_dir = self.files_dir / '.partial'
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.user_agent = user_agent
+        self.stats = stats
+        self.local = threading.local()  # 스레드별 requests.Session (세션은 스레드 간 공유에 안전하지 않음)
+        self.sessions = []
+        self.sessions_guard = threading.Lock()
+        self.threadpool = None
+        self.downloaded = {}  # URL -> 다운로드 결과 (같은 실행 내 중복 요청 방지)
+        self.url_locks = {}
+        self.url_locks_guard = threading.Lock()
         
     @classmethod
     def from_crawler(cls, crawler):
         return cls(
-            files_dir=crawler.settings.get('FILES_STORE', 'files')
+            files_dir=crawler.settings.get('FILES_STORE', 'files'),
+            concurrency=crawler.settings.getint('FILE_DOWNLOAD_CONCURRENCY', 4),
+            timeout=crawler.settings.getint('FILE_DOWNLOAD_TIMEOUT', 30),
+            retries=crawler.settings.getint('FILE_DOWNLOAD_RETRIES', 3),
+            user_agent=crawler.settings.get('USER_AGENT'),
+            stats=crawler.stats
         )
-        
-    def process_item(self, item, spider):
+    
+    def open_spider(self, spider):
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        self.threadpool = ThreadPool(minthreads=0, maxthreads=self.concurrency, name='FileDownloadPipeline')
+        self.threadpool.start()
+    
+    def close_spider(self, spider):
+        if self.threadpool:
+            self.threadpool.stop()
+            self.threadpool = None
+        with self.sessions_guard:
+            for session in self.sessions:
+                session.close()
+            self.sessions = []
+    
+    def session(self):
+        """현재 스레드의 세션 (처음 사용할 때 생성, 연결 재사용/일시적 오류 재시도)"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                max_retries=Retry(total=self.retries, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            if self.user_agent:
+                session.headers['User-Agent'] = self.user_agent
+            self.local.session = session
+            with self.sessions_guard:
+                self.sessions.append(session)
+        return session
+    
+    async def process_item(self, item, spider):
         adapter = ItemAdapter(item)
-        if 'file_urls' in adapter and adapter['file_urls']:
-            import requests
-            import os
-            
-            for url in adapter['file_urls']:
-                try:
-                    # 파일명 추출
-                    filename = url.split('/')[-1]
-                    save_path = os.path.join(self.files_dir, filename)
-                    
-                    # 디렉토리 생성
-                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                    
-                    # 파일 다운로드
-                    response = requests.get(url, stream=True)
-                    with open(save_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                            
-                    spider.logger.info(f'파일 다운로드 완료: {save_path}')
-                except Exception as e:
-                    spider.logger.error(f'파일 다운로드 실패: {url}, 오류: {e}')
-        
-        return item
\ No newline at end of file
+        file_urls = [url for url in (adapter.get('file_urls') or []) if url]
+        if not file_urls:
+            return item
+        
+        from twisted.internet import reactor
+        
+        # 아이템의 첨부 파일들을 동시에 다운로드 (전체 동시 실행 수는 스레드 풀 크기로 제한)
+        results = await maybe_deferred_to_future(defer.DeferredList([
+            threads.deferToThreadPool(reactor, self.threadpool, self.download, url, spider)
+            for url in file_urls
+        ], consumeErrors=True))
+        
+        files = []
+        for url, (success, result) in zip(file_urls, results):
+            if success:
+                files.append(result)
+            else:
+                self.stats.inc_value('file_download/failed')
+                spider.logger.error(f'파일 다운로드 실패: {url}, 오류: {result.getErrorMessage()}')
+        
+        try:
+            adapter['files'] = files
+        except KeyError:
+            # files 필드가 없는 아이템 클래스
+            pass
+        return item
+    
+    def download(self, url, spider):
+        """파일 다운로드 (스레드 풀에서 실행, 같은 URL은 한 스레드만 받음)"""
+        with self.url_locks_guard:
+            lock = self.url_locks.setdefault(url, threading.Lock())
+        with lock:
+            if url not in self.downloaded:
+                self.downloaded[url] = self._download(url, spider)
+            return self.downloaded[url]
+    
+    def _download(self, url, spider):
+        """
+        부분 파일이 있으면 Range 요청으로 이어받은 뒤 해시 경로로 이동
+        이어받기는 처음 받을 때 저장한 검증값이 If-Range로 일치할 때만 (다르면 서버가 전체 파일을 보냄)
+        """
+        partial_path = self.partial_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.part"
+        validator_path = partial_path.with_name(partial_path.name + '.json')
+        offset = partial_path.stat().st_size if partial_path.exists() else 0
+        validator = self.load_validator(validator_path) if offset else None
+        
+        # 검증값이 없으면 바뀐 파일 뒤에 이어 붙일 수 있으므로 처음부터 받음
+        headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if validator else {}
+        
+        with self.session().get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416 and headers:
+                # 부분 파일이 이미 전체 크기면 완료, 아니면 원격 파일이 바뀐 것
+                status = 'resumed' if self.content_length_of(response) == offset else None
+            else:
+                response.raise_for_status()
+                if response.status_code == 206 and headers:
+                    status = 'resumed' if self.content_range_start(response) == offset else None
+                    mode = 'ab'
+                else:
+                    # Range 미지원, 원격 파일 변경(If-Range 불일치) 또는 새 다운로드 - 처음부터 기록
+                    mode, status = 'wb', 'downloaded'
+                    if headers:
+                        self.stats.inc_value('file_download/restarted')
+                    self.save_validator(validator_path, response)
+                
+                if status:
+                    with open(partial_path, mode) as f:
+                        for chunk in response.iter_content(chunk_size=64 * 1024):
+                            if chunk:
+                                f.write(chunk)
+        
+        if status is None:
+            # 부분 파일이 원격 파일과 맞지 않음 - 지우고 처음부터 다시 받음
+            spider.logger.warning(f'부분 파일이 원격 파일과 다름 - 처음부터 다시 받습니다: {url}')
+            self.stats.inc_value('file_download/restarted')
+            partial_path.unlink(missing_ok=True)
+            validator_path.unlink(missing_ok=True)
+            return self._download(url, spider)
+        
+        validator_path.unlink(missing_ok=True)
+        checksum, size = self.file_checksum(partial_path)
+        extension = os.path.splitext(urlparse(url).path)[1].lower()[:10]
+        relative_path = os.path.join(checksum[:2], f"{checksum}{extension}")
+        final_path = self.files_dir / relative_path
+        
+        if final_path.exists():
+            # 같은 내용의 파일이 이미 있으면 저장하지 않음
+            partial_path.unlink()
+            status = 'duplicate'
+        else:
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(partial_path, final_path)
+        
+        result = {
+            'url': url,
+            'path': relative_path,
+            'checksum': checksum,
+            'size': size,
+            'status': status,
+        }
+        self.stats.inc_value(f'file_download/{status}')
+        spider.logger.info(f'파일 다운로드 완료 ({status}): {url} -> {final_path}')
+        return result
+    
+    @staticmethod
+    def load_validator(path):
+        """부분 파일을 받을 때 저장한 If-Range 검증값 (없으면 None)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('validator')
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def save_validator(path, response):
+        """
+        이어받기에 사용할 검증값 저장 (약한 ETag는 If-Range에 쓸 수 없으므로 Last-Modified 사용)
+        검증값이 없으면 저장하지 않아 다음 시도는 처음부터 받음
+        """
+        etag = response.headers.get('ETag')
+        validator = etag if etag and not etag.startswith('W/') else response.headers.get('Last-Modified')
+        if validator:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'url': response.url, 'validator': validator}, f)
+        else:
+            path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def content_range_start(response):
+        """206 응답의 Content-Range 시작 위치 (bytes <시작>-<끝>/<전체>)"""
+        match = re.match(r'bytes\s+(\d+)-', response.headers.get('Content-Range', ''))
+        return int(match.group(1)) if match else None
+    
+    @staticmethod
+    def content_length_of(response):
+        """416 응답의 Content-Range 전체 크기 (bytes */<전체>)"""
+        match = re.match(r'bytes\s+\*/(\d+)', response.headers.get('Content-Range', ''))
+        return int(match.group(1)) if match else None
+    
+    def file_checksum(self, path):
+        """파일의 SHA-256 해시와 크기"""
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+                size += len(chunk)
+        return digest.hexdigest(), size
@@ -0,0 +1,125 @@
+"""
+Selenium 렌더링 결과 캐시
+브라우저로 렌더링한 HTML을 문서 키(정규화 URL 또는 사이트 문서 번호) + 탭 상태를 키로 gzip 압축하여 디스크에 저장하고,
+replay 모드에서는 Chrome 없이 저장된 페이지만으로 추출을 다시 실행할 수 있게 합니다.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from common.url_canonicalizer import URLCanonicalizer
+
+
+class RenderCache:
+    """
+    렌더링 HTML 디스크 캐시
+
+    모드:
+        off: 사용 안 함
+        use: 캐시에 있으면 사용하고, 없으면 렌더링 후 저장
+        refresh: 항상 렌더링하고 결과로 캐시 갱신
+        replay: 캐시만 사용 (없으면 건너뜀, 브라우저를 띄우지 않음)
+    """
+
+    MODES = ('off', 'use', 'refresh', 'replay')
+
+    def __init__(self, cache_dir, mode='use', expiration_secs=0, canonicalizer=None):
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 렌더링 캐시 모드: {mode} ({', '.join(self.MODES)})")
+
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.expiration_secs = expiration_secs
+        # 같은 문서의 다른 URL(카테고리 파라미터 등)이 같은 캐시 항목을 사용하도록 문서 키 사용
+        self.canonicalizer = canonicalizer or URLCanonicalizer()
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self):
+        return self.mode != 'off'
+
+    @property
+    def replay(self):
+        return self.mode == 'replay'
+
+    @property
+    def readable(self):
+        """캐시에서 읽을 수 있는 모드인지"""
+        return self.mode in ('use', 'replay')
+
+    @property
+    def writable(self):
+        """렌더링 결과를 저장하는 모드인지"""
+        return self.mode in ('use', 'refresh')
+
+    def canonical_url(self, url):
+        return self.canonicalizer.canonical_url(url)
+
+    def key_for(self, url, state=''):
+        """캐시 키 (문서 키 + 탭 상태의 SHA-1)"""
+        raw = f"{self.canonicalizer.document_key(url)}\x00{state or ''}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def path_for(self, key):
+        return self.cache_dir / key[:2] / f'{key}.json.gz'
+
+    def get(self, url, state=''):
+        """
+        저장된 렌더링 HTML 조회
+
+        Returns:
+            str: HTML, 없거나 만료되었으면 None
+        """
+        if not self.readable:
+            return None
+
+        path = self.path_for(self.key_for(url, state))
+        if not path.exists():
+            return None
+
+        # replay 모드에서는 만료와 관계없이 사용
+        if self.expiration_secs and not self.replay:
+            if time.time() - path.stat().st_mtime > self.expiration_secs:
+                return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)['html']
+        except Exception as e:
+            self.logger.warning(f"렌더링 캐시 읽기 실패 ({path}): {e}")
+            return None
+
+    def put(self, url, html, state=''):
+        """렌더링 HTML 저장 (임시 파일에 쓴 뒤 교체하여 여러 스레드/프로세스에서 안전)"""
+        if not self.writable or not html:
+            return False
+
+        path = self.path_for(self.key_for(url, state))
+        record = {
+            'url': url,
+            'canonical_url': self.canonical_url(url),
+            'document_key': self.canonicalizer.document_key(url),
+            'state': state or '',
+            'rendered_at': datetime.now().isoformat(),
+            'html': html,
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            self.logger.warning(f"렌더링 캐시 저장 실패 ({url}): {e}")
+            return False
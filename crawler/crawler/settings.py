@@ -22,10 +22,11 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 ROBOTSTXT_OBEY = False  # 신재생에너지 크롤링을 위해 비활성화
 
 # Configure maximum concurrent requests performed by Scrapy (default: 16)
-CONCURRENT_REQUESTS = 1  # Selenium 사용 시 순차 처리
+CONCURRENT_REQUESTS = 8  # HTTP 상세 페이지 동시 요청 (Selenium 작업은 드라이버 풀 크기로 제한)
+CONCURRENT_REQUESTS_PER_DOMAIN = 8
 
 # Configure a delay for requests for the same website (default: 0)
-DOWNLOAD_DELAY = 2
+DOWNLOAD_DELAY = 0.25
 RANDOMIZE_DOWNLOAD_DELAY = 0.5
 
 # Disable cookies (enabled by default)
@@ -49,29 +50,61 @@ DEFAULT_REQUEST_HEADERS = {
 
 # Enable or disable downloader middlewares
 # See https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
-# Selenium 미들웨어는 사용하지 않음 (베이스 스파이더에서 직접 관리)
-#DOWNLOADER_MIDDLEWARES = {
-#    'crawler.middlewares.SeleniumMiddleware': 800,
-#}
+# Selenium 미들웨어는 meta['selenium']이 설정된 요청만 처리 (스레드 풀에서 렌더링, 첫 요청 시 드라이버 생성)
+DOWNLOADER_MIDDLEWARES = {
+    'crawler.middlewares.SharedPolitenessMiddleware': 750,
+    'crawler.middlewares.SeleniumMiddleware': 800,
+}
 
 # Enable or disable extensions
 # See https://docs.scrapy.org/en/latest/topics/extensions.html
-#EXTENSIONS = {
-#    "scrapy.extensions.telnet.TelnetConsole": None,
-#}
+EXTENSIONS = {
+    'crawler.extensions.StatsDumpExtension': 500,
+}
+
+# stats와 작업별 지연 시간(p50/p95/p99) 요약을 주기적으로 JSON 저장 (0이면 비활성화)
+STATS_DUMP_INTERVAL = 30
+# 저장 경로 (미지정 시 output/<spider>/stats.json)
+STATS_DUMP_FILE = None
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 ITEM_PIPELINES = {
     'crawler.pipelines.RenewableEnergyPipeline': 300,
+    'crawler.pipelines.ParquetExportPipeline': 400,  # PARQUET_EXPORT_ENABLED일 때만 동작
 }
 
+# 수집 결과 저장 형식 (RenewableEnergyPipeline)
+# 'jsonl': 아이템당 한 줄 (중단되어도 기록된 줄은 유효, 줄 단위 스트리밍 가능), 'json': 기존 JSON 배열
+OUTPUT_FORMAT = 'jsonl'
+# 압축 (None, 'gzip', 'zstd' - zstd는 zstandard 패키지 필요, 없으면 gzip)
+OUTPUT_COMPRESSION = None
+OUTPUT_BUFFER_SIZE = 1024 * 1024  # 쓰기 버퍼 크기(바이트)
+OUTPUT_FSYNC_EVERY = 500  # 이 개수의 아이템마다 flush + fsync (0이면 종료 시에만)
+OUTPUT_DATA_DIR = './output/data'  # 결과 파일 디렉토리 (실행 위치 기준, Parquet 내보내기도 같은 위치)
+
+# 체크포인트: output/<spider>/checkpoint.json에 완료 페이지, 저장한 문서, 결과 파일 위치를 기록
+# 중단 후 -a resume=1 로 실행하면 완료한 페이지와 저장한 문서를 건너뛰고 같은 결과 파일에 이어서 기록
+CHECKPOINT_ENABLED = True
+CHECKPOINT_INTERVAL = 50  # 이 개수의 아이템마다 결과 파일을 디스크에 반영하고 체크포인트 저장
+
+# Parquet 내보내기 (pyarrow 필요, 분석/재처리 작업에서 컬럼 단위로 빠르게 로드)
+PARQUET_EXPORT_ENABLED = False
+PARQUET_ROW_GROUP_SIZE = 1000  # 이 개수마다 row group 기록
+PARQUET_COMPRESSION = 'zstd'
+
+# 첨부 파일 다운로드 (FileDownloadPipeline: 내용 해시 경로로 저장, 중단된 파일은 Range로 이어받기)
+FILES_STORE = './output/files'
+FILE_DOWNLOAD_CONCURRENCY = 4  # 동시 다운로드 수 (스레드 풀/연결 풀 크기)
+FILE_DOWNLOAD_TIMEOUT = 30
+FILE_DOWNLOAD_RETRIES = 3
+
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
 AUTOTHROTTLE_ENABLED = True
-AUTOTHROTTLE_START_DELAY = 2
+AUTOTHROTTLE_START_DELAY = 0.5
 AUTOTHROTTLE_MAX_DELAY = 10
-AUTOTHROTTLE_TARGET_CONCURRENCY = 1.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
 AUTOTHROTTLE_DEBUG = False
 
 # Enable and configure HTTP caching (disabled by default)
@@ -82,6 +115,13 @@ AUTOTHROTTLE_DEBUG = False
 #HTTPCACHE_IGNORE_HTTP_CODES = []
 #HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
 
+# Selenium 렌더링 결과 캐시 (Scrapy HTTPCACHE는 브라우저 렌더링 경로를 저장하지 않음)
+# 'off', 'use'(있으면 재사용, 없으면 렌더링 후 저장), 'refresh'(항상 렌더링 후 갱신), 'replay'(캐시만 사용, Chrome 미실행)
+# 스파이더 인자 -a render_cache=replay 로 덮어쓸 수 있음. 네트워크 없이 재추출하려면 HTTPCACHE_ENABLED도 함께 사용
+RENDER_CACHE_MODE = 'off'
+RENDER_CACHE_DIR = 'render_cache'  # .scrapy/ 아래 (gzip 압축)
+RENDER_CACHE_EXPIRATION_SECS = 0  # 0이면 만료 없음 (replay 모드는 만료 무시)
+
 # Set settings whose default value is deprecated to a future-proof value
 FEED_EXPORT_ENCODING = "utf-8"
 
@@ -96,3 +136,47 @@ FEED_STORE_EMPTY = False  # 빈 파일 저장 방지
 # Selenium 관련 설정 (베이스 스파이더에서 사용)
 SELENIUM_TIMEOUT = 15
 SELENIUM_HEADLESS = True
+# 브라우저 리소스 차단 프로파일 ('text': 이미지/폰트/CSS/외부 분석 스크립트 차단, 'layout': CSS 유지, 'none')
+SELENIUM_BLOCK_PROFILE = 'text'
+# 프로파일에 추가로 차단할 URL 패턴 (예: '*.mp4', '*banner*')
+SELENIUM_BLOCKED_URL_PATTERNS = []
+# 헤드리스 드라이버 최대 수 (크롤링 프로세스 하나의 Chrome 수는 최대 두 값의 합)
+# SELENIUM_DRIVER_POOL_SIZE: 스파이더 드라이버 풀 (목록 Selenium 대체, 상세 페이지 렌더링)
+# SELENIUM_MIDDLEWARE_POOL_SIZE: SeleniumMiddleware (meta['selenium'] 요청이 있을 때만 생성)
+# shard_launcher로 워커 N개를 실행하면 워커마다 따로 만들므로 전체는 N x (두 값의 합)
+SELENIUM_DRIVER_POOL_SIZE = 4
+SELENIUM_MIDDLEWARE_POOL_SIZE = 1
+# 드라이버 재시작 기준 (장시간 크롤링에서 브라우저 메모리 증가/속도 저하 방지, 0이면 사용 안 함)
+# 드라이버당 페이지 로드 수 / 브라우저 메모리 합계 MB (psutil 필요) / 연속 시간 초과 횟수
+SELENIUM_RECYCLE_PAGES = 300
+SELENIUM_RECYCLE_RSS_MB = 1500
+SELENIUM_RECYCLE_TIMEOUTS = 3
+
+# 브라우저(Selenium) 탐색에만 적용하는 사이트별 최소 요청 간격(초)
+# Scrapy 요청은 DOWNLOAD_DELAY/AutoThrottle이 처리하므로 여기에 포함되지 않음
+SITE_POLITENESS_DELAYS = {
+    'knrec.or.kr': 0.5,
+}
+
+# 상세 페이지 수집 방식 ('http': 정적 요청 후 선택자 없을 때만 Selenium, 'selenium': 항상 브라우저)
+# 스파이더 인자 -a detail_mode=selenium 으로 덮어쓸 수 있음
+DETAIL_FETCH_MODE = 'http'
+
+# 증분 크롤링: output/<spider>/crawl_state.sqlite3 기준으로 새로 추가되거나 제목이 바뀐 FAQ만 상세 수집
+# 스파이더 인자 -a incremental=1 로도 켤 수 있음
+INCREMENTAL_CRAWL = False
+
+# 중복 필터 (한 번의 실행 안에서는 정확한 집합 사용)
+# SEEN_FILTER_PERSIST=True 이면 저장한 문서를 output/<spider>/seen_documents.bloom에 유지하여 다음 실행에서 상세 수집 전에 건너뜀
+# (증분 크롤링 모드에서는 crawl_state가 변경 여부를 판단하므로 사용하지 않음)
+SEEN_FILTER_PERSIST = False
+SEEN_FILTER_CAPACITY = 1_000_000  # 실행 간 필터의 예상 최대 문서 수 (초과 시 거짓 양성 비율 증가)
+SEEN_FILTER_ERROR_RATE = 0.001  # 거짓 양성(새 문서를 중복으로 판단) 비율
+
+# 샤드 크롤링 (python -m crawler.shard_launcher --workers N)
+# 워커들은 SQLite 작업 큐에서 목록 페이지를 나눠 가져가고, 호스트별 요청 간격은 모든 워커가 함께 지킴
+# (SITE_POLITENESS_DELAYS에 없는 호스트는 SHARD_HOST_DELAY 적용, 워커별 DOWNLOAD_DELAY/AutoThrottle은 끔)
+SHARD_HOST_DELAY = 0.25
+SHARD_PREFETCH_PAGES = 2  # 워커가 동시에 처리하는 목록 페이지 수
+SHARD_LEASE_SECS = 300  # 이 시간 동안 끝나지 않은 페이지는 다른 워커가 다시 가져감
+SHARD_SEED_TIMEOUT = 60  # 첫 워커의 페이지 등록을 기다리는 시간 (넘으면 각 워커가 첫 페이지를 직접 받음)
@@ -0,0 +1,246 @@
+"""
+샤드 크롤링 실행기
+스파이더를 여러 워커 프로세스로 실행하여 목록 페이지를 SQLite 작업 큐(crawler.work_queue)로 나눠 처리하고,
+워커별 결과 파일을 하나의 JSONL로 합칩니다.
+사이트 분석은 실행기가 한 번만 수행해 워커에 전달하고, 목록 첫 페이지는 첫 워커만 받아 전체 페이지를 등록합니다.
+
+사용법 (crawler 디렉토리에서):
+    python -m crawler.shard_launcher --workers 4 -a mode=full
+    python -m crawler.shard_launcher --workers 4 -a base_url=http://127.0.0.1:8765 -s SHARD_HOST_DELAY=0
+"""
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault('SCRAPY_SETTINGS_MODULE', 'crawler.settings')
+
+from scrapy.utils.project import get_project_settings
+
+from common.url_canonicalizer import URLCanonicalizer
+from common.utils import iter_output_items
+from crawler.work_queue import ShardWorkQueue
+
+try:
+    import orjson
+except ImportError:  # 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 사항
+    zstandard = None
+
+
+def worker_command(spider, worker_id, queue_path, shard_dir, spider_args=(), settings=None, analysis_file=None,
+                   seed_worker='w1'):
+    """워커 프로세스 실행 명령 (scrapy crawl, 첫 페이지는 seed_worker만 받아 전체 페이지를 등록)"""
+    command = [
+        sys.executable, '-m', 'scrapy', 'crawl', spider,
+        '-a', f'work_queue={queue_path}',
+        '-a', f'worker_id={worker_id}',
+        '-a', f'seed_worker={seed_worker}',
+    ]
+    if analysis_file:
+        command += ['-a', f'analysis_file={analysis_file}']
+    for arg in spider_args:
+        command += ['-a', arg]
+
+    worker_settings = {
+        # 요청 간격은 작업 큐의 공유 예약(SHARD_HOST_DELAY, SITE_POLITENESS_DELAYS)으로 지킴
+        'DOWNLOAD_DELAY': 0,
+        'AUTOTHROTTLE_ENABLED': False,
+    }
+    worker_settings.update(settings or {})
+    # 워커별 결과/로그는 작업 디렉토리에 기록 (OUTPUT_DATA_DIR은 합친 결과 위치로 사용)
+    worker_settings.update({
+        'OUTPUT_DATA_DIR': str(shard_dir),
+        'LOG_FILE': str(shard_dir / f'{worker_id}.log'),
+        'STATS_DUMP_FILE': str(shard_dir / f'{worker_id}_stats.json'),
+    })
+    for key, value in worker_settings.items():
+        command += ['-s', f'{key}={value}']
+    return command
+
+
+def open_output(path, compression=None):
+    """합친 결과 파일 열기 (확장자에 맞춰 압축)"""
+    if compression == 'gzip':
+        return gzip.open(path, 'wb')
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+    return open(path, 'wb', buffering=1024 * 1024)
+
+
+def spider_site(spider):
+    """스파이더 이름의 사이트 부분 (knrec_faq -> knrec, 분석 결과 디렉토리와 같은 규칙)"""
+    return spider.split('_')[0]
+
+
+def merge_outputs(shard_dir, spider, output_path, compression=None, site=None):
+    """
+    워커별 결과 파일을 하나의 JSONL로 합침 (문서 키 기준 중복 제거, 줄 단위로 읽고 씀)
+    한 번 실행의 결과만 합치므로 중복 확인은 정확한 집합으로 수행 (거짓 양성으로 문서가 빠지지 않음)
+
+    Returns:
+        tuple: (기록한 아이템 수, 제외한 중복 수)
+    """
+    canonicalizer = URLCanonicalizer.for_site(site or spider_site(spider))
+    seen = set()
+    merged = duplicates = 0
+
+    shard_files = sorted(
+        path for path in Path(shard_dir).glob(f'{spider}_*')
+        if path.name.endswith(('.json', '.jsonl', '.jsonl.gz', '.jsonl.zst'))
+    )
+    with open_output(output_path, compression) as out:
+        for shard_file in shard_files:
+            for item in iter_output_items(shard_file):
+                url = item.get('url')
+                if url:
+                    key = canonicalizer.document_key(url)
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                if orjson is not None:
+                    line = orjson.dumps(item)
+                else:
+                    line = json.dumps(item, ensure_ascii=False).encode('utf-8')
+                out.write(line + b'\n')
+                merged += 1
+
+    return merged, duplicates
+
+
+def prepare_analysis(spider, spider_args, shard_dir):
+    """
+    사이트 분석을 실행기에서 한 번만 수행하고 결과 파일 경로 반환 (워커는 -a analysis_file로 읽음)
+    -a analysis=0 이거나 분석 결과가 없으면 None (워커가 기본 설정 또는 각자 분석 사용)
+    """
+    if any(arg.split('=', 1)[0] in ('analysis', 'analysis_file') for arg in spider_args):
+        return None
+
+    try:
+        from common.analysis_service import get_analysis_service
+        result = get_analysis_service().get_or_create_analysis(spider)
+    except Exception as e:
+        print(f"사이트 분석 실패 - 워커가 각자 분석 결과를 확인합니다: {e}")
+        return None
+    if not result:
+        return None
+
+    path = shard_dir / 'analysis.json'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, default=str)
+    return path
+
+
+def max_browsers(workers, settings, project_settings):
+    """
+    워커들이 띄울 수 있는 최대 Chrome 수
+    워커마다 스파이더 드라이버 풀과 SeleniumMiddleware 풀을 따로 만들므로 워커 수 x (두 풀 크기의 합)
+    """
+    per_worker = sum(
+        int(settings.get(key, project_settings.getint(key, 1)))
+        for key in ('SELENIUM_DRIVER_POOL_SIZE', 'SELENIUM_MIDDLEWARE_POOL_SIZE')
+    )
+    return workers * per_worker
+
+
+def run(workers=4, spider='knrec_faq', spider_args=(), settings=None, keep_shards=False, site=None):
+    """워커들을 실행하고 끝나면 결과를 합침 (종료 코드 반환, site는 문서 키 규칙 - 기본은 스파이더 이름에서)"""
+    settings = dict(settings or {})
+    project_settings = get_project_settings()
+    data_dir = (PROJECT_ROOT / settings.get('OUTPUT_DATA_DIR', project_settings.get('OUTPUT_DATA_DIR', './output/data'))).resolve()
+    compression = settings.get('OUTPUT_COMPRESSION', project_settings.get('OUTPUT_COMPRESSION'))
+    if compression == 'zstd' and zstandard is None:
+        compression = 'gzip'
+
+    run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+    shard_dir = data_dir / 'shards' / f'{spider}_{run_id}'
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    queue_path = shard_dir / 'work_queue.sqlite3'
+    ShardWorkQueue(queue_path).close()  # 워커 시작 전에 테이블 생성
+
+    started = time.monotonic()
+    analysis_file = prepare_analysis(spider, spider_args, shard_dir)
+    print(f"샤드 크롤링 시작: 워커 {workers}개, 작업 디렉토리 {shard_dir} "
+          f"(Selenium 사용 시 최대 Chrome {max_browsers(workers, settings, project_settings)}개)")
+
+    processes = []
+    for index in range(1, workers + 1):
+        worker_id = f'w{index}'
+        command = worker_command(spider, worker_id, queue_path, shard_dir, spider_args, settings, analysis_file)
+        processes.append((worker_id, subprocess.Popen(command, cwd=str(PROJECT_ROOT))))
+
+    exit_codes = {}
+    try:
+        for worker_id, process in processes:
+            exit_codes[worker_id] = process.wait()
+    except KeyboardInterrupt:
+        print("중단 요청 - 워커 종료 중")
+        for _, process in processes:
+            process.terminate()
+        for worker_id, process in processes:
+            exit_codes[worker_id] = process.wait()
+    crawl_elapsed = time.monotonic() - started
+
+    queue = ShardWorkQueue(queue_path)
+    counts = queue.counts()
+    queue.close()
+
+    extension = '.jsonl' + {'gzip': '.gz', 'zstd': '.zst'}.get(compression, '')
+    output_path = data_dir / f'{spider}_{run_id}{extension}'
+    merged, duplicates = merge_outputs(shard_dir, spider, output_path, compression, site)
+
+    print(f"크롤링 소요 시간: {crawl_elapsed:.2f}초 (워커 종료 코드: {exit_codes})")
+    print(f"작업 큐 상태: {counts}")
+    print(f"결과: {output_path} ({merged}개, 중복 제외 {duplicates}개, "
+          f"{merged / crawl_elapsed if crawl_elapsed else 0:.2f} items/sec)")
+
+    complete = all(code == 0 for code in exit_codes.values()) and set(counts) <= {'done'}
+    if complete and not keep_shards:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+    else:
+        print(f"워커 로그/결과 보관: {shard_dir}")
+    return 0 if complete else 1
+
+
+def parse_key_value(values):
+    """KEY=VALUE 목록을 dict로 변환"""
+    result = {}
+    for value in values:
+        key, _, raw = value.partition('=')
+        result[key] = raw
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='샤드 크롤링 실행기')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='워커 프로세스 수')
+    parser.add_argument('--spider', default='knrec_faq')
+    parser.add_argument('-a', dest='spider_args', action='append', default=[], metavar='NAME=VALUE',
+                        help='스파이더 인자 (여러 번 지정 가능)')
+    parser.add_argument('-s', dest='settings', action='append', default=[], metavar='KEY=VALUE',
+                        help='워커 Scrapy 설정 (여러 번 지정 가능)')
+    parser.add_argument('--keep-shards', action='store_true', help='워커별 결과/로그 보관')
+    parser.add_argument('--site', default=None,
+                        help='결과 병합 시 문서 키 규칙 (url_canonicalizer.SITE_RULES, 기본: 스파이더 이름의 사이트 부분)')
+    args = parser.parse_args()
+
+    sys.exit(run(args.workers, args.spider, args.spider_args, parse_key_value(args.settings), args.keep_shards,
+                 args.site))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,19 +2,69 @@
 신재생에너지 관련 웹사이트 크롤링을 위한 단순화된 베이스 스파이더
 """
 import scrapy
+from scrapy.http import HtmlResponse
+from scrapy.utils.project import data_path
 import json
 import logging
 import time
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from urllib.parse import urljoin
+from twisted.internet import defer
+from common.waits import PolitenessDelay, wait_for_selector
+from common.webdriver_factory import create_chrome_driver
+from common.managed_driver import ManagedDriver
+from common.analysis_index import AnalysisIndex
+from common.bloom_filter import BloomFilter, KeySet
+from common.url_canonicalizer import URLCanonicalizer
+from crawler.render_cache import RenderCache
+from crawler.latency import LatencyStats
+
+
+# 목록 요소들의 제목/링크 정보를 WebDriver 호출 한 번으로 수집하는 스크립트
+# arguments[0]: CSS 선택자 또는 요소 배열, arguments[1]: 제목 후보 선택자 목록 (앞에서부터 우선)
+LIST_ITEMS_SCRIPT = """
+const elements = typeof arguments[0] === 'string'
+    ? Array.from(document.querySelectorAll(arguments[0]))
+    : Array.from(arguments[0]);
+const titleSelectors = arguments[1] || [];
+return elements.map((el) => {
+    const link = el.querySelector('a');
+    let text = '';
+    for (const selector of titleSelectors) {
+        const sub = el.querySelector(selector);
+        if (sub && sub.innerText.trim()) {
+            text = sub.innerText.trim();
+            break;
+        }
+    }
+    const href = link ? link.href : '';
+    let no = null;
+    try {
+        no = href ? new URL(href, location.href).searchParams.get('no') : null;
+    } catch (e) {}
+    return {
+        title_attr: link ? link.getAttribute('title') : null,
+        link_text: link ? link.innerText : '',
+        text: text || el.innerText.trim(),
+        href: href,
+        no: no
+    };
+});
+"""
+
+# 선택자에 해당하는 모든 요소의 텍스트를 WebDriver 호출 한 번으로 수집하는 스크립트
+ELEMENT_TEXTS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]), (el) => el.innerText);
+"""
 
 
 class BaseRenewableEnergySpider(scrapy.Spider):
@@ -26,9 +76,50 @@ class BaseRenewableEnergySpider(scrapy.Spider):
         # 크롤링 모드 설정
         self.mode = kwargs.get('mode', 'test')
         
+        # 상세 페이지 수집 방식 (http: Scrapy 요청 + 정적 파싱, selenium: 브라우저 렌더링)
+        self.detail_mode = kwargs.get('detail_mode')
+        
         # Selenium 드라이버 초기화
         self.driver = None
         self.selenium_timeout = 15  # 기본값 설정
+        self.selenium_headless = True
+        self.selenium_block_profile = 'text'  # 이미지/폰트/CSS/외부 스크립트 차단
+        self.selenium_blocked_url_patterns = []
+        
+        # 드라이버 재시작 기준 (페이지 수, 브라우저 메모리 MB, 연속 시간 초과 횟수, 0이면 사용 안 함)
+        self.selenium_recycle_pages = 0
+        self.selenium_recycle_rss_mb = 0
+        self.selenium_recycle_timeouts = 0
+        
+        # 브라우저 탐색에만 적용하는 사이트별 요청 간격 (Scrapy 요청은 DOWNLOAD_DELAY/AutoThrottle 적용)
+        self.politeness = PolitenessDelay()
+        
+        # 작업별 지연 시간 히스토그램 (from_crawler에서 crawler.stats와 연결)
+        self.latency = LatencyStats()
+        
+        # 상세 페이지 병렬 처리를 위한 드라이버 풀 (필요 시 생성)
+        self.driver_pool_size = 1
+        self.driver_pool = None
+        self.pool_drivers = []
+        self.pool_executor = None
+        
+        # 렌더링 캐시 (-a render_cache=use|refresh|replay, 미지정 시 RENDER_CACHE_MODE 설정)
+        self.render_cache_mode = kwargs.get('render_cache')
+        self.render_cache = None
+        
+        # 중복 필터 (from_crawler에서 생성)
+        # seen_filter: 이번 실행에서 이미 요청한 URL (정확한 집합)
+        # document_filter: 저장된 문서 (파이프라인과 공유, 실행 간 유지 시에만 Bloom filter 파일)
+        self.seen_filter = None
+        self.document_filter = None
+        
+        # URL -> 문서 키 변환 (사이트 규칙은 하위 스파이더에서 지정)
+        self.url_canonicalizer = URLCanonicalizer()
+        
+        # 사이트 구조 분석 결과 사용 여부 (-a analysis=0 이면 분석 없이 기본 선택자 사용)
+        self.use_analysis = str(kwargs.get('analysis', '1')).lower() not in ('0', 'false', 'no', 'off')
+        # 미리 준비한 분석 결과 파일 (-a analysis_file=<경로>, 샤드 실행기가 분석을 한 번만 하고 워커에 전달)
+        self.analysis_file = kwargs.get('analysis_file')
         
         # 출력 디렉토리 설정
         self.setup_output_directory()
@@ -45,9 +136,67 @@ class BaseRenewableEnergySpider(scrapy.Spider):
         
         # 설정값 읽기 (crawler를 통해 접근)
         spider.selenium_timeout = crawler.settings.getint('SELENIUM_TIMEOUT', 15)
+        spider.selenium_headless = crawler.settings.getbool('SELENIUM_HEADLESS', True)
+        spider.selenium_block_profile = crawler.settings.get('SELENIUM_BLOCK_PROFILE', 'text')
+        spider.selenium_blocked_url_patterns = crawler.settings.getlist('SELENIUM_BLOCKED_URL_PATTERNS')
+        spider.selenium_recycle_pages = crawler.settings.getint('SELENIUM_RECYCLE_PAGES', 0)
+        spider.selenium_recycle_rss_mb = crawler.settings.getint('SELENIUM_RECYCLE_RSS_MB', 0)
+        spider.selenium_recycle_timeouts = crawler.settings.getint('SELENIUM_RECYCLE_TIMEOUTS', 0)
+        spider.politeness = PolitenessDelay(crawler.settings.getdict('SITE_POLITENESS_DELAYS'))
+        spider.latency = LatencyStats.for_crawler(crawler)
+        spider.driver_pool_size = max(1, crawler.settings.getint('SELENIUM_DRIVER_POOL_SIZE', 1))
+        if not spider.detail_mode:
+            spider.detail_mode = crawler.settings.get('DETAIL_FETCH_MODE', 'http')
+        
+        spider.render_cache = RenderCache(
+            data_path(crawler.settings.get('RENDER_CACHE_DIR', 'render_cache'), createdir=True),
+            mode=spider.render_cache_mode or crawler.settings.get('RENDER_CACHE_MODE', 'off'),
+            expiration_secs=crawler.settings.getint('RENDER_CACHE_EXPIRATION_SECS', 0),
+            canonicalizer=spider.url_canonicalizer
+        )
+        if spider.render_cache.enabled:
+            spider.logger.info(f"렌더링 캐시: {spider.render_cache.mode} ({spider.render_cache.cache_dir})")
+        
+        spider.open_duplicate_filters(crawler.settings, crawler.settings.getbool('SEEN_FILTER_PERSIST', False))
         
         return spider
     
+    def open_duplicate_filters(self, settings, persist=False):
+        """
+        중복 확인 필터 생성
+        이번 실행 안의 중복은 정확한 집합(KeySet)으로 확인하고, persist이면 문서 필터만
+        output/<spider>/seen_documents.bloom Bloom filter로 실행 간에 유지
+        """
+        self.close_duplicate_filters()
+        self.seen_filter = KeySet()
+        self.document_filter = KeySet()
+        if not persist:
+            return
+        
+        path = self.output_dir / self.name / 'seen_documents.bloom'
+        try:
+            self.document_filter = BloomFilter(
+                path,
+                capacity=settings.getint('SEEN_FILTER_CAPACITY', 1_000_000),
+                error_rate=settings.getfloat('SEEN_FILTER_ERROR_RATE', 0.001)
+            )
+        except Exception as e:
+            self.logger.error(f"문서 중복 필터 열기 실패 - 이번 실행에서만 중복 확인: {e}")
+            return
+        
+        self.logger.info(f"실행 간 중복 필터: {path} (저장된 문서 {len(self.document_filter)}개)")
+    
+    def close_duplicate_filters(self):
+        for key_filter in (self.seen_filter, self.document_filter):
+            if key_filter is not None:
+                key_filter.close()
+        self.seen_filter = None
+        self.document_filter = None
+    
+    def document_key(self, url):
+        """중복 확인, 렌더링 캐시, 결과 아이템에 사용하는 문서 키"""
+        return self.url_canonicalizer.document_key(url)
+    
     def setup_output_directory(self):
         """출력 디렉토리 설정"""
         project_root = Path(__file__).parent.parent.parent.parent
@@ -63,6 +212,20 @@ class BaseRenewableEnergySpider(scrapy.Spider):
     
     def load_analysis_result(self):
         """분석 결과 로드"""
+        if not self.use_analysis:
+            self.logger.info("분석 결과 사용 안 함 - 기본 설정 사용")
+            return None
+        
+        if self.analysis_file:
+            try:
+                with open(self.analysis_file, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+                self.logger.info(f"전달받은 분석 결과 사용: {self.analysis_file}")
+                return result
+            except Exception as e:
+                self.logger.error(f"분석 결과 파일 읽기 실패 - 기본 설정 사용: {e}")
+                return None
+        
         try:
             # 중앙 분석 서비스 시도
             try:
@@ -80,12 +243,9 @@ class BaseRenewableEnergySpider(scrapy.Spider):
             analysis_dir = self.output_dir.parent / 'output' / 'analysis' / site_name
             
             if analysis_dir.exists():
-                analysis_files = list(analysis_dir.glob(f'{self.name}_analysis_*.json'))
-                if analysis_files:
-                    latest_file = max(analysis_files, key=lambda x: x.stat().st_mtime)
-                    with open(latest_file, 'r', encoding='utf-8') as f:
-                        result = json.load(f)
-                    self.logger.info(f"로컬 분석 결과 로드 성공: {latest_file}")
+                result, entry = AnalysisIndex.for_directory(analysis_dir, site_name).load(self.name)
+                if result is not None:
+                    self.logger.info(f"로컬 분석 결과 로드 성공: {analysis_dir / entry['path']}")
                     return result
             
             self.logger.warning("분석 결과를 찾을 수 없습니다")
@@ -95,19 +255,35 @@ class BaseRenewableEnergySpider(scrapy.Spider):
             self.logger.error(f"분석 결과 로드 실패: {e}")
             return None
     
+    def create_driver(self, name='Selenium 드라이버'):
+        """
+        재시작 관리 드라이버 생성
+        SELENIUM_RECYCLE_* 기준을 넘거나 브라우저가 죽으면 새 브라우저로 교체하고 쿠키 복원
+        """
+        return ManagedDriver(
+            self.create_browser,
+            max_pages=self.selenium_recycle_pages,
+            max_rss_mb=self.selenium_recycle_rss_mb,
+            max_timeouts=self.selenium_recycle_timeouts,
+            stats=self.crawler.stats if getattr(self, 'crawler', None) else None,
+            name=name
+        )
+    
+    def create_browser(self):
+        """Chrome 드라이버 생성 (공통 팩토리, 리소스 차단 프로파일 적용)"""
+        # 암묵적 대기는 사용하지 않음 (요소가 없을 때 find_elements가 매번 타임아웃까지 멈춤)
+        # 대기는 common.waits의 명시적 조건 대기로 처리
+        return create_chrome_driver(
+            headless=self.selenium_headless,
+            block_profile=self.selenium_block_profile,
+            blocked_url_patterns=self.selenium_blocked_url_patterns,
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        )
+    
     def setup_selenium(self):
         """Selenium 웹드라이버 설정"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(self.selenium_timeout)
+            self.driver = self.create_driver()
             
             self.logger.info("Selenium 웹드라이버 초기화 성공")
             return True
@@ -116,39 +292,163 @@ class BaseRenewableEnergySpider(scrapy.Spider):
             self.logger.error(f"Selenium 웹드라이버 초기화 실패: {e}")
             return False
     
-    def selenium_get(self, url, wait_for_element=None, timeout=None):
-        """Selenium으로 페이지 로드"""
-        if not self.driver and not self.setup_selenium():
+    def setup_driver_pool(self):
+        """병렬 작업용 드라이버 풀 설정 (SELENIUM_DRIVER_POOL_SIZE 개)"""
+        if self.driver_pool is not None:
+            return True
+        
+        pool = queue.Queue()
+        for i in range(self.driver_pool_size):
+            try:
+                driver = self.create_driver(name=f'풀 드라이버 {i + 1}')
+            except Exception as e:
+                self.logger.error(f"풀 드라이버 {i + 1} 초기화 실패: {e}")
+                break
+            self.pool_drivers.append(driver)
+            pool.put(driver)
+        
+        if not self.pool_drivers:
+            self.logger.error("드라이버 풀 초기화 실패")
             return False
         
+        self.driver_pool = pool
+        self.pool_executor = ThreadPoolExecutor(
+            max_workers=len(self.pool_drivers),
+            thread_name_prefix=f'{self.name}_driver'
+        )
+        self.logger.info(f"드라이버 풀 초기화 완료: {len(self.pool_drivers)}개")
+        return True
+    
+    @contextmanager
+    def pooled_driver(self):
+        """풀에서 드라이버를 빌려 쓰고 반환"""
+        with self.latency.timer('selenium/pool_wait'):
+            driver = self.driver_pool.get()
+        try:
+            yield driver
+        finally:
+            self.driver_pool.put(driver)
+    
+    def _call_with_pooled_driver(self, func, arg):
+        with self.pooled_driver() as driver:
+            return func(driver, arg)
+    
+    def defer_to_driver_pool(self, func, arg):
+        """
+        드라이버 풀 작업을 리액터 스레드 밖에서 실행
+        
+        Returns:
+            Deferred: func(driver, arg)의 결과
+        """
+        from twisted.internet import reactor
+        
+        if not self.setup_driver_pool():
+            return defer.fail(RuntimeError("드라이버 풀 초기화 실패"))
+        
+        d = defer.Deferred()
+        
+        def _done(future):
+            error = future.exception()
+            if error is not None:
+                reactor.callFromThread(d.errback, error)
+            else:
+                reactor.callFromThread(d.callback, future.result())
+        
+        future = self.pool_executor.submit(self._call_with_pooled_driver, func, arg)
+        future.add_done_callback(_done)
+        return d
+    
+    def shutdown_driver_pool(self):
+        """드라이버 풀 정리"""
+        if self.pool_executor:
+            self.pool_executor.shutdown(wait=True)
+            self.pool_executor = None
+        
+        for driver in self.pool_drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.error(f"풀 드라이버 정리 실패: {e}")
+        
+        if self.pool_drivers:
+            self.logger.info(f"드라이버 풀 정리 완료: {len(self.pool_drivers)}개")
+        self.pool_drivers = []
+        self.driver_pool = None
+    
+    def selenium_get(self, url, wait_for_element=None, timeout=None, driver=None):
+        """Selenium으로 페이지 로드 (driver 미지정 시 self.driver 사용)"""
+        if driver is None:
+            if not self.driver and not self.setup_selenium():
+                return False
+            driver = self.driver
+        
         try:
-            self.driver.get(url)
+            with self.latency.timer('selenium/politeness'):
+                self.politeness.wait(url)
+            with self.latency.timer('selenium/navigate'):
+                driver.get(url)
             
             if wait_for_element:
                 wait_timeout = timeout or self.selenium_timeout
-                wait = WebDriverWait(self.driver, wait_timeout)
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for_element)))
+                with self.latency.timer('selenium/wait'):
+                    found = wait_for_selector(driver, wait_for_element, wait_timeout)
+                if not found:
+                    self.logger.warning(f"페이지 로드 시간 초과: {url}")
+                    if isinstance(driver, ManagedDriver):
+                        driver.record_timeout()
+                    return False
             
             self.logger.debug(f"페이지 로드 성공: {url}")
             return True
             
-        except TimeoutException:
-            self.logger.warning(f"페이지 로드 시간 초과: {url}")
-            return False
         except Exception as e:
             self.logger.error(f"페이지 로드 실패: {e}")
             return False
     
-    def selenium_click(self, selector, timeout=None):
+    def load_rendered_page(self, url, state=''):
+        """
+        렌더링 캐시에 저장된 페이지 조회
+        
+        Returns:
+            HtmlResponse: 캐시된 렌더링 결과, 없으면 None
+        """
+        if not self.render_cache or not self.render_cache.readable:
+            return None
+        
+        html = self.render_cache.get(url, state)
+        if html is None:
+            self.crawler.stats.inc_value('render_cache/miss')
+            return None
+        
+        self.crawler.stats.inc_value('render_cache/hit')
+        return HtmlResponse(url=url, body=html, encoding='utf-8', flags=['render_cache'])
+    
+    def save_rendered_page(self, url, driver=None, state=''):
+        """현재 드라이버의 렌더링 결과를 캐시에 저장"""
+        if not self.render_cache or not self.render_cache.writable:
+            return
+        
+        driver = driver or self.driver
+        try:
+            with self.latency.timer('render_cache/store'):
+                stored = self.render_cache.put(url, driver.page_source, state)
+            if stored:
+                self.crawler.stats.inc_value('render_cache/stored')
+        except Exception as e:
+            self.logger.warning(f"렌더링 결과 캐시 저장 실패: {e}")
+    
+    def selenium_click(self, selector, timeout=None, driver=None):
         """Selenium으로 요소 클릭"""
-        if not self.driver:
+        driver = driver or self.driver
+        if not driver:
             return False
         
         try:
             wait_timeout = timeout or self.selenium_timeout
-            wait = WebDriverWait(self.driver, wait_timeout)
-            element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-            element.click()
+            with self.latency.timer('selenium/click'):
+                wait = WebDriverWait(driver, wait_timeout)
+                element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
+                element.click()
             return True
             
         except TimeoutException:
@@ -158,18 +458,48 @@ class BaseRenewableEnergySpider(scrapy.Spider):
             self.logger.warning(f"요소 클릭 실패: {e}")
             return False
     
-    def selenium_find_elements(self, selector):
+    def selenium_find_elements(self, selector, driver=None):
         """Selenium으로 요소들 찾기"""
-        if not self.driver:
+        driver = driver or self.driver
+        if not driver:
             return []
         
         try:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            with self.latency.timer('selenium/find'):
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
             return elements
         except Exception as e:
             self.logger.error(f"요소 찾기 실패: {e}")
             return []
     
+    def selenium_execute(self, script, *args, driver=None):
+        """Selenium으로 스크립트 실행 (여러 요소 정보를 한 번의 왕복으로 조회)"""
+        driver = driver or self.driver
+        if not driver:
+            return None
+        
+        try:
+            with self.latency.timer('selenium/extract'):
+                return driver.execute_script(script, *args)
+        except Exception as e:
+            self.logger.error(f"스크립트 실행 실패: {e}")
+            return None
+    
+    def selenium_collect_list_items(self, elements_or_selector, title_selectors=(), driver=None):
+        """
+        목록 요소들의 제목/링크 정보를 한 번에 수집
+        
+        Returns:
+            list: {'title_attr', 'link_text', 'text', 'href', 'no'} 딕셔너리 목록
+        """
+        return self.selenium_execute(
+            LIST_ITEMS_SCRIPT, elements_or_selector, list(title_selectors), driver=driver
+        ) or []
+    
+    def selenium_element_texts(self, selector, driver=None):
+        """선택자에 해당하는 모든 요소의 텍스트를 한 번에 수집"""
+        return self.selenium_execute(ELEMENT_TEXTS_SCRIPT, selector, driver=driver) or []
+    
     def get_analysis_config(self, key, default=None):
         """분석 결과에서 설정값 조회"""
         if not self.analysis_result:
@@ -199,21 +529,41 @@ class BaseRenewableEnergySpider(scrapy.Spider):
             except Exception as e:
                 self.logger.error(f"Selenium 드라이버 정리 실패: {e}")
         
+        self.shutdown_driver_pool()
+        
+        try:
+            self.close_duplicate_filters()
+        except Exception as e:
+            self.logger.error(f"중복 필터 저장 실패: {e}")
+        
+        # 지연 시간 요약을 stats에 반영 (종료 시 Scrapy stats 덤프에 포함)
+        for name, summary in self.latency.export().items():
+            self.logger.info(
+                f"지연 시간 {name}: n={summary['count']} p50={summary['p50_ms']}ms "
+                f"p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms"
+            )
+        
         self.logger.info(f"스파이더 종료: {reason}")
 
 
 class BaseFAQSpider(BaseRenewableEnergySpider):
     """FAQ 페이지 전용 베이스 스파이더"""
     
+    # FAQ 제목 후보 선택자 (앞에서부터 우선)
+    TITLE_SELECTORS = ('a', '.title', 'h3', 'h4', 'strong', '.result_tit')
+    
     def extract_faq_items(self, faq_elements, content_selector=None):
         """FAQ 항목들 추출"""
         items = []
         
-        for i, element in enumerate(faq_elements, 1):
+        # 제목/링크를 요소별 조회 대신 스크립트 한 번으로 수집
+        entries = self.selenium_collect_list_items(faq_elements, self.TITLE_SELECTORS)
+        
+        for i, entry in enumerate(entries, 1):
             try:
                 # 제목 추출
-                title = self.extract_text(element, 'a, .title, h3, h4, strong, .result_tit')
-                link = self.extract_link(element)
+                title = entry['text']
+                link = urljoin('https://www.knrec.or.kr', entry['href']) if entry['href'] else ""
                 
                 if not title or not link:
                     self.logger.warning(f"FAQ {i}: 제목 또는 링크 없음")
@@ -275,16 +625,37 @@ class BaseFAQSpider(BaseRenewableEnergySpider):
         
         return ""
     
-    def extract_detail_content(self, url, content_selector):
+    def extract_static_content(self, response, content_selector):
+        """
+        정적 HTML 응답에서 내용 추출 (브라우저 없이 parsel로 파싱)
+        
+        Returns:
+            list: 요소별 텍스트 목록, 선택자에 해당하는 요소가 없으면 None
+        """
+        with self.latency.timer('parse/detail'):
+            nodes = response.css(content_selector)
+            if not nodes:
+                return None
+            
+            texts = []
+            for node in nodes:
+                parts = node.xpath('.//text()[not(ancestor::script or ancestor::style)]').getall()
+                text = '\n'.join(part.strip() for part in parts if part.strip())
+                if text and text not in texts:
+                    texts.append(text)
+            return texts
+    
+    def extract_detail_content(self, url, content_selector, driver=None):
         """상세 페이지에서 내용 추출"""
-        if not self.selenium_get(url, wait_for_element=content_selector):
+        if not self.selenium_get(url, wait_for_element=content_selector, driver=driver):
             return ""
         
+        self.save_rendered_page(url, driver=driver)
+        
         try:
-            content_elements = self.selenium_find_elements(content_selector)
-            if content_elements:
-                contents = [elem.text for elem in content_elements if elem.text.strip()]
-                return '\n\n'.join(contents)
+            texts = self.selenium_element_texts(content_selector, driver=driver)
+            contents = [text for text in texts if text and text.strip()]
+            return '\n\n'.join(contents)
         except Exception as e:
             self.logger.error(f"상세 내용 추출 실패: {e}")
         
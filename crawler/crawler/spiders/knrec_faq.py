@@ -1,14 +1,28 @@
 """
 한국에너지공단 신재생에너지센터 FAQ 크롤링 스파이더
-단순화된 베이스 클래스를 상속받아 순수 Selenium 방식으로 크롤링합니다.
+목록/상세 페이지를 Scrapy 요청으로 가져오고, 정적 HTML에 내용이 없을 때만 Selenium을 사용합니다.
 """
+import os
+import re
 import time
 import logging
 import scrapy
+from scrapy import signals
+from scrapy.exceptions import DontCloseSpider
+from scrapy.utils.defer import deferred_from_coro, maybe_deferred_to_future
+from twisted.internet import defer, task
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from pathlib import Path
+from urllib.parse import urlparse
 from .base import BaseFAQSpider
 from crawler.items import RenewableEnergyItem
+from crawler.crawl_state import CrawlStateStore
+from crawler.checkpoint import CrawlCheckpoint
+from crawler.work_queue import ShardWorkQueue, SharedPolitenessDelay
+from common.waits import wait_for_rerender
+from common.url_canonicalizer import URLCanonicalizer
+from common.utils import find_max_page
 
 
 class KnrecFaqSpider(BaseFAQSpider):
@@ -21,58 +35,312 @@ class KnrecFaqSpider(BaseFAQSpider):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
+        # 사이트 주소 (-a base_url=http://127.0.0.1:8765 로 로컬 fixture 서버 등을 대상으로 실행)
+        self.base_url = kwargs.get('base_url', 'https://www.knrec.or.kr').rstrip('/')
+        if 'base_url' in kwargs:
+            self.start_urls = [f"{self.base_url}/biz/faq/faq_list01.do"]
+            self.allowed_domains = [urlparse(self.base_url).hostname]
+        
+        # 상세 페이지는 카테고리 파라미터와 관계없이 FAQ 번호(no)로 식별
+        self.url_canonicalizer = URLCanonicalizer.for_site('knrec')
+        
         # 크롤링 통계
         self.total_pages = 0
+        self.pagination_total = None  # 페이지네이션 링크로 확인한 가장 큰 페이지 번호
+        self.last_page = None  # 새 FAQ가 없던 첫 페이지 (이후 페이지는 탐색하지 않음)
         self.processed_pages = 0
         self.extracted_faqs = 0
         self.duplicate_faqs = 0
-        self.seen_urls = set()
+        self.unchanged_faqs = 0
+        self.unique_faqs = 0
+        
+        # 증분 크롤링 (-a incremental=1): 이전 실행과 목록 정보가 같은 FAQ는 상세 페이지 생략
+        self.incremental = kwargs.get('incremental')
+        self.crawl_state = None
+        
+        # 샤드 크롤링 (-a work_queue=<큐 경로> -a worker_id=w1): 목록 페이지를 여러 워커 프로세스가 작업 큐에서 나눠 처리
+        self.work_queue_path = kwargs.get('work_queue')
+        self.worker_id = kwargs.get('worker_id') or f"w{os.getpid()}"
+        self.work_queue = None
+        self.shard_prefetch = 2
+        self.shard_waiting = False
+        # 첫 페이지로 전체 페이지를 등록하는 워커 (-a seed_worker=w1, 나머지 워커는 등록될 때까지 대기)
+        self.seed_worker = kwargs.get('seed_worker')
+        self.seed_timeout = 60
+        
+        # 체크포인트 (-a resume=1 이면 중단된 크롤링을 이어서 실행)
+        self.resume = str(kwargs.get('resume', '0')).lower() in ('1', 'true', 'yes')
+        self.checkpoint = None
     
     @classmethod
     def from_crawler(cls, crawler, *args, **kwargs):
         """Scrapy crawler에서 스파이더 생성"""
         spider = super().from_crawler(crawler, *args, **kwargs)
+        
+        if spider.incremental is None:
+            spider.incremental = crawler.settings.getbool('INCREMENTAL_CRAWL', False)
+        else:
+            spider.incremental = str(spider.incremental).lower() in ('1', 'true', 'yes')
+        
+        # 증분 크롤링 상태는 파이프라인이 결과 파일에 기록한 아이템만 반영
+        crawler.signals.connect(spider.record_crawl_state, signal=signals.item_scraped)
+        
+        if spider.work_queue_path:
+            spider.open_work_queue(crawler.settings)
+            crawler.signals.connect(spider.shard_idle, signal=signals.spider_idle)
+        
+        # 증분 모드는 crawl_state로 변경 여부를 판단하고, 샤드 워커들은 같은 필터 파일을 동시에 쓸 수 없으므로
+        # 저장된 문서를 실행 간에 건너뛰지 않음
+        if (spider.incremental or spider.work_queue) and spider.document_filter.path:
+            spider.logger.warning("증분/샤드 크롤링 모드에서는 실행 간 중복 필터를 사용하지 않습니다")
+            spider.open_duplicate_filters(crawler.settings, persist=False)
+        
+        # 샤드 모드는 작업 큐가 진행 상태를 보관 (워커별 체크포인트는 페이지 완료 시점 확인에만 사용)
+        if spider.work_queue:
+            spider.open_shard_checkpoint()
+        elif crawler.settings.getbool('CHECKPOINT_ENABLED', True):
+            spider.open_checkpoint()
+        
         return spider
     
+    async def start(self):
+        """크롤링 시작 (Scrapy 2.13 이상, 이전 버전은 start_requests 사용)"""
+        if self.work_queue and self.seed_worker and self.seed_worker != self.worker_id:
+            await self.wait_for_shard_seed()
+        for request in self.start_requests():
+            yield request
+    
+    async def wait_for_shard_seed(self, interval=0.2):
+        """
+        첫 워커가 작업 큐에 페이지를 등록할 때까지 대기 (모든 워커가 첫 페이지를 받지 않도록)
+        seed_timeout 안에 등록되지 않으면 이 워커가 직접 첫 페이지를 받아 등록
+        """
+        from twisted.internet import reactor
+        
+        deadline = time.monotonic() + self.seed_timeout
+        while not self.work_queue.max_page():
+            if time.monotonic() >= deadline:
+                self.logger.warning(f"샤드 워커 {self.worker_id}: {self.seed_worker}의 페이지 등록 대기 시간 초과")
+                return
+            await maybe_deferred_to_future(task.deferLater(reactor, interval, lambda: None))
+    
     def start_requests(self):
         """크롤링 시작"""
+        # 샤드 워커: 다른 워커가 페이지를 이미 등록했으면 첫 페이지를 다시 받지 않고 작업 큐에서 바로 가져감
+        registered = self.work_queue.max_page() if self.work_queue else None
+        if registered:
+            self.prepare_crawl()
+            self.total_pages = registered
+            self.crawler.stats.set_value(f'{self.name}/total_pages', self.total_pages)
+            self.logger.info(f"샤드 워커 {self.worker_id}: 작업 큐에 등록된 {registered}페이지에서 시작")
+            for request in self.claim_shard_pages(self.shard_prefetch):
+                yield request
+            return
+        
         for url in self.start_urls:
             yield scrapy.Request(url=url, callback=self.parse)
     
-    def parse(self, response):
-        """메인 파싱 로직"""
+    def prepare_crawl(self):
+        """분석 결과 설정과 증분 크롤링 상태 로드"""
         self.logger.info("=== KNREC FAQ 크롤링 시작 ===")
         
-        # 실제 크롤링 수행 및 Item 생성
-        yield from self.crawl_faqs()
+        # 분석 결과에서 설정 로드
+        self.load_crawling_config()
+        
+        # 증분 크롤링 상태 로드
+        if self.incremental:
+            self.open_crawl_state()
     
-    def crawl_faqs(self):
-        """실제 FAQ 크롤링 로직 - Item을 yield"""
+    async def parse(self, response):
+        """첫 목록 페이지 파싱 - 전체 페이지 수 확인 후 목록 페이지별 요청 생성"""
+        self.prepare_crawl()
         
-        # Selenium 초기화
-        if not self.setup_selenium():
-            self.logger.error("Selenium 초기화 실패")
+        # 전체 페이지 수 확인
+        self.determine_total_pages(response)
+        
+        # 샤드 모드: 전체 페이지를 작업 큐에 등록하고 이 워커가 처리할 페이지만 가져감
+        if self.work_queue:
+            self.work_queue.seed(range(1, self.total_pages + 1))
+            pages = self.work_queue.claim(self.worker_id, self.shard_prefetch)
+            self.logger.info(f"샤드 워커 {self.worker_id}: 페이지 {pages} 처리 시작")
+            for page_num in pages:
+                if page_num != 1:
+                    yield self.shard_page_request(page_num)
+            if 1 in pages:
+                async for result in self.parse_shard_page(response, page_number=1):
+                    yield result
             return
         
-        # 분석 결과에서 설정 로드
-        self.load_crawling_config()
+        # 크롤링할 페이지 결정 (재개 시 완료한 페이지 제외)
+        pages_to_crawl = list(range(1, self.total_pages + 1))
+        if self.checkpoint and self.checkpoint.completed_pages:
+            pages_to_crawl = [page for page in pages_to_crawl if not self.checkpoint.is_completed(page)]
+            self.logger.info(f"체크포인트: 완료한 {len(self.checkpoint.completed_pages)}개 페이지 제외")
+        if self.mode == 'test':
+            self.logger.info(f"테스트 모드: 전체 {len(pages_to_crawl)}개 페이지 크롤링")
+        else:
+            self.logger.info(f"전체 모드: {len(pages_to_crawl)}개 페이지 크롤링")
+        
+        # 이전 실행에서 실패한 상세 문서 (완료한 페이지에 속해 있어도 다시 요청)
+        if self.resume and self.checkpoint and self.checkpoint.failed:
+            for request in self.retry_failed_details():
+                yield request
         
-        # 첫 페이지 접근
-        if not self.selenium_get(self.start_urls[0], wait_for_element="ul.result_list"):
-            self.logger.error("초기 페이지 로드 실패")
+        # 나머지 목록 페이지는 개별 요청으로 스케줄링 (동시 처리 및 개별 재시도)
+        for page_num in pages_to_crawl:
+            if page_num == 1:
+                continue
+            yield scrapy.Request(
+                url=self.list_page_url(page_num),
+                callback=self.parse_list_page,
+                cb_kwargs={'page_number': page_num}
+            )
+        
+        # 첫 페이지는 현재 응답으로 바로 처리
+        async for result in self.parse_list_page(response, page_number=1):
+            yield result
+    
+    def open_checkpoint(self):
+        """체크포인트 열기 (output/<spider>/checkpoint.json, 재개 시 저장한 문서는 상세 수집 전에 제외)"""
+        path = self.output_dir / self.name / 'checkpoint.json'
+        checkpoint = CrawlCheckpoint.load(path) if self.resume else None
+        
+        if checkpoint is None:
+            if self.resume:
+                self.logger.warning(f"체크포인트 없음 - 처음부터 크롤링: {path}")
+            self.checkpoint = CrawlCheckpoint(path)
             return
         
-        # 간편검색 탭 클릭
-        self.click_simple_search_tab()
+        self.checkpoint = checkpoint
+        for key in checkpoint.emitted:
+            self.document_filter.add(key)
+        self.logger.info(
+            f"체크포인트에서 재개: 완료 페이지 {len(checkpoint.completed_pages)}개, "
+            f"저장 문서 {len(checkpoint.emitted)}개 ({checkpoint.saved_at})"
+        )
+    
+    def open_shard_checkpoint(self):
+        """
+        샤드 워커의 페이지 진행 상태 (작업 큐 디렉토리의 <worker_id>_checkpoint.json)
+        목록 페이지의 상세 문서가 모두 결과 파일에 반영(또는 실패로 기록)된 뒤에만 작업 큐에 완료로 기록
+        """
+        path = Path(self.work_queue_path).parent / f'{self.worker_id}_checkpoint.json'
+        self.checkpoint = CrawlCheckpoint(path, on_pages_saved=self.complete_shard_pages)
+    
+    def complete_shard_pages(self, pages):
+        """결과 파일에 반영된 페이지를 작업 큐에 완료로 기록"""
+        for page_number, items in sorted(pages.items()):
+            self.work_queue.complete(page_number, items)
+    
+    def open_crawl_state(self):
+        """증분 크롤링 상태 저장소 열기 (output/<spider>/crawl_state.sqlite3)"""
+        try:
+            db_path = self.output_dir / self.name / 'crawl_state.sqlite3'
+            self.crawl_state = CrawlStateStore(db_path)
+            self.logger.info(f"증분 크롤링 모드: {db_path}")
+        except Exception as e:
+            self.logger.error(f"크롤 상태 저장소 열기 실패 - 전체 크롤링으로 진행: {e}")
+            self.crawl_state = None
+    
+    def open_work_queue(self, settings):
+        """샤드 작업 큐 열기 (요청 간격도 모든 워커가 공유)"""
+        self.work_queue = ShardWorkQueue(self.work_queue_path, lease_secs=settings.getint('SHARD_LEASE_SECS', 300))
+        self.politeness = SharedPolitenessDelay(
+            self.work_queue,
+            settings.getdict('SITE_POLITENESS_DELAYS'),
+            default_delay=settings.getfloat('SHARD_HOST_DELAY', 0.25)
+        )
+        self.shard_prefetch = max(1, settings.getint('SHARD_PREFETCH_PAGES', 2))
+        self.seed_timeout = settings.getfloat('SHARD_SEED_TIMEOUT', 60)
+        self.logger.info(f"샤드 워커 {self.worker_id}: 작업 큐 {self.work_queue_path}")
+    
+    def shard_page_request(self, page_number):
+        """작업 큐에서 가져온 목록 페이지 요청"""
+        return scrapy.Request(
+            url=self.list_page_url(page_number),
+            callback=self.parse_shard_page,
+            errback=self.shard_page_failed,
+            cb_kwargs={'page_number': page_number},
+            dont_filter=True
+        )
+    
+    def claim_shard_pages(self, count=1):
+        """
+        다음 목록 페이지 요청 (마지막 페이지 이후는 요청 없이 완료 처리)
+        지금 가져갈 페이지가 없으면 빈 목록 - 다른 워커의 페이지가 남아 있으면 shard_idle이 계속 확인
+        """
+        requests = []
+        while len(requests) < count:
+            pages = self.work_queue.claim(self.worker_id, count - len(requests))
+            if not pages:
+                break
+            for page in pages:
+                if self.beyond_last_page(page):
+                    self.work_queue.complete(page)
+                    self.crawler.stats.inc_value(f'{self.name}/pages_skipped')
+                else:
+                    requests.append(self.shard_page_request(page))
+        return requests
+    
+    async def parse_shard_page(self, response, page_number):
+        """
+        샤드 모드 목록 페이지 처리 - 작업 큐에서 다음 페이지를 가져옴
+        페이지 완료는 상세 문서가 모두 저장된 뒤 체크포인트가 기록 (complete_shard_pages)
+        """
+        try:
+            async for result in self.parse_list_page(response, page_number):
+                yield result
+            # 상세 수집할 문서를 등록하지 않은 페이지(빈 목록, 마지막 페이지 이후 등)는 바로 완료
+            if page_number not in self.checkpoint.pending and not self.checkpoint.is_completed(page_number):
+                self.checkpoint.start_page(page_number, [])
+        except Exception as e:
+            self.logger.error(f"샤드 페이지 {page_number} 처리 실패: {e}")
+            self.checkpoint.discard_page(page_number)
+            self.work_queue.fail(page_number)
         
-        # 전체 페이지 수 확인
-        self.determine_total_pages()
+        for request in self.claim_shard_pages():
+            yield request
+    
+    def shard_idle(self):
+        """
+        할 일이 없을 때 (spider_idle, 엔진이 약 5초마다 호출)
+        다른 워커가 처리 중인 페이지가 남아 있으면 종료하지 않고 기다렸다가, 멈추거나 종료된 워커의
+        lease가 만료되면 그 페이지를 가져감
+        """
+        requests = self.claim_shard_pages(self.shard_prefetch)
+        if requests:
+            self.shard_waiting = False
+            self.logger.info(f"샤드 워커 {self.worker_id}: 페이지 {len(requests)}개 추가로 가져옴")
+            for request in requests:
+                self.crawler.engine.crawl(request)
+            raise DontCloseSpider
         
-        # 모든 페이지 크롤링하고 Item yield
-        yield from self.crawl_all_pages()
+        claimed, remaining = self.work_queue.in_progress()
+        if not claimed:
+            return
         
-        # 크롤링 완료 요약
-        self.log_crawling_summary()
+        if not self.shard_waiting:
+            self.shard_waiting = True
+            self.logger.info(
+                f"샤드 워커 {self.worker_id}: 다른 워커가 처리 중인 페이지 {claimed}개 - "
+                f"완료 또는 lease 만료(최대 {remaining:.0f}초)까지 대기"
+            )
+        raise DontCloseSpider
+    
+    def shard_page_failed(self, failure):
+        """목록 페이지 다운로드 실패 - 작업 큐에 되돌리고 다음 페이지를 가져옴"""
+        page_number = failure.request.cb_kwargs['page_number']
+        self.logger.error(f"샤드 페이지 {page_number} 요청 실패: {failure.value}")
+        self.work_queue.fail(page_number)
+        return self.claim_shard_pages()
+    
+    def extract_faq_no(self, url):
+        """상세 페이지 URL에서 FAQ 번호(no) 추출 (없으면 문서 키 사용)"""
+        return self.url_canonicalizer.document_id(url) or self.document_key(url)
+    
+    def list_page_url(self, page_number):
+        """목록 페이지 URL"""
+        return f"{self.base_url}/biz/faq/faq_list01.do?page={page_number}&"
     
     def load_crawling_config(self):
         """분석 결과에서 크롤링 설정 로드"""
@@ -93,85 +361,239 @@ class KnrecFaqSpider(BaseFAQSpider):
         self.logger.info(f"  - 내용 선택자: {self.content_selector}")
         self.logger.info(f"  - 간편검색 탭: {self.simple_search_tab}")
     
-    def click_simple_search_tab(self):
-        """간편검색 탭 클릭"""
+    def click_simple_search_tab(self, driver=None):
+        """간편검색 탭 클릭 후 목록이 다시 그려질 때까지 대기"""
         try:
-            if self.selenium_click(self.simple_search_tab, timeout=5):
+            driver = driver or self.driver
+            previous_items = self.selenium_find_elements(self.faq_selector, driver=driver)
+            
+            if self.selenium_click(self.simple_search_tab, timeout=5, driver=driver):
                 self.logger.info("간편검색 탭 클릭 성공")
-                time.sleep(2)  # 페이지 로딩 대기
+                # 고정 대기 대신 이전 목록 교체 또는 네트워크 유휴 + 목록 존재 확인
+                previous = previous_items[0] if previous_items else None
+                with self.latency.timer('selenium/wait'):
+                    rerendered = wait_for_rerender(driver, self.faq_selector, previous, timeout=5)
+                if not rerendered:
+                    self.logger.warning("간편검색 탭 클릭 후 목록 갱신 대기 시간 초과")
             else:
                 self.logger.warning("간편검색 탭 클릭 실패 - 기본 탭으로 진행")
         except Exception as e:
             self.logger.warning(f"간편검색 탭 클릭 중 오류: {e}")
     
-    def determine_total_pages(self):
-        """전체 페이지 수 확인"""
+    # 페이지 번호/다음 묶음/마지막 페이지 링크
+    PAGINATION_LINKS = ".pagination a, .paging a, .page_num a, a[title*='마지막'], a.last, a.end"
+    
+    def find_last_page(self, response):
+        """목록 페이지 페이지네이션 링크에서 가장 큰 페이지 번호 (링크가 없으면 None)"""
+        links = [
+            (link.css('::text').get(), link.attrib.get('href'))
+            for link in response.css(self.PAGINATION_LINKS)
+        ]
+        return find_max_page(links)
+    
+    def determine_total_pages(self, response):
+        """
+        전체 페이지 수 확인 (목록 페이지의 페이지네이션 기준, 없으면 분석 시 렌더링한 페이지네이션)
+        둘 다 없으면 첫 페이지부터 한 페이지씩 확인하며 진행 (probe_next_page)
+        """
         try:
-            # 여러 방법으로 페이지 수 확인 시도
-            max_page = 1
+            max_page = self.find_last_page(response)
             
-            # 1. 페이지네이션에서 숫자 확인
-            pagination_elements = self.selenium_find_elements(".pagination a, .paging a, .page_num a")
-            for element in pagination_elements:
-                text = element.text.strip()
-                if text.isdigit():
-                    max_page = max(max_page, int(text))
+            if max_page is None:
+                max_page = self.get_analysis_config('total_pages')
             
-            # 2. 마지막 페이지 링크 확인
-            last_page_elements = self.selenium_find_elements("a[title*='마지막'], .last, .end")
-            for element in last_page_elements:
-                href = element.get_attribute('href')
-                if href and 'page=' in href:
-                    import re
-                    page_match = re.search(r'page=(\d+)', href)
-                    if page_match:
-                        max_page = max(max_page, int(page_match.group(1)))
-            
-            # 3. 전체 35페이지 사용
-            if max_page < 35:
-                max_page = 35
+            if max_page is None:
+                self.logger.warning("페이지네이션 링크 없음 - 새 FAQ가 없는 페이지까지 한 페이지씩 확인")
+            else:
+                self.pagination_total = max_page
             
-            self.total_pages = max_page
+            self.total_pages = max_page or 1
+            self.crawler.stats.set_value(f'{self.name}/total_pages', self.total_pages)
             self.logger.info(f"전체 페이지 수: {self.total_pages}")
             
         except Exception as e:
             self.logger.error(f"페이지 수 확인 실패: {e}")
-            self.total_pages = 35  # 기본값
+            self.total_pages = max(self.total_pages, 1)
     
-    def crawl_all_pages(self):
-        """모든 페이지 크롤링하고 Item yield"""
+    def discover_pages(self, response, page_number):
+        """
+        목록 페이지에서 보이는 페이지네이션으로 전체 페이지 수 갱신
+        (마지막 페이지 링크 없이 10페이지 단위로만 보이는 경우 다음 묶음을 이어서 발견)
         
-        # 크롤링할 페이지 결정
-        if self.mode == 'test':
-            pages_to_crawl = list(range(1, self.total_pages + 1))  # 테스트도 전체 페이지
-            self.logger.info(f"테스트 모드: 전체 {len(pages_to_crawl)}개 페이지 크롤링")
-        else:
-            pages_to_crawl = list(range(1, self.total_pages + 1))
-            self.logger.info(f"전체 모드: {len(pages_to_crawl)}개 페이지 크롤링")
+        Returns:
+            list: 새로 발견한 페이지 번호 목록
+        """
+        if self.last_page is not None:
+            return []
         
-        # 각 페이지 크롤링
-        for page_num in pages_to_crawl:
+        max_page = self.find_last_page(response)
+        if max_page is not None and (self.pagination_total is None or max_page > self.pagination_total):
+            self.pagination_total = max_page
+        if max_page is None or max_page <= self.total_pages:
+            return []
+        
+        new_pages = list(range(self.total_pages + 1, max_page + 1))
+        self.total_pages = max_page
+        self.crawler.stats.set_value(f'{self.name}/total_pages', self.total_pages)
+        self.logger.info(f"페이지 {page_number}에서 추가 페이지 발견: 전체 {self.total_pages}페이지")
+        return new_pages
+    
+    def probe_next_page(self, page_number):
+        """
+        페이지네이션으로 확인한 페이지가 없을 때 알려진 마지막 페이지 다음 페이지 하나를 추가
+        (확인되지 않은 페이지를 미리 모두 요청하지 않고 새 FAQ가 있는 동안만 이어서 요청)
+        
+        Returns:
+            list: 추가한 페이지 번호 목록
+        """
+        if self.pagination_total is not None or page_number != self.total_pages or self.beyond_last_page(page_number + 1):
+            return []
+        self.total_pages = page_number + 1
+        self.crawler.stats.set_value(f'{self.name}/total_pages', self.total_pages)
+        return [self.total_pages]
+    
+    def schedule_pages(self, pages):
+        """새로 찾은 목록 페이지 요청 (샤드 모드는 작업 큐에 등록)"""
+        if self.work_queue:
+            self.work_queue.seed(pages)
+            return []
+        return [
+            scrapy.Request(
+                url=self.list_page_url(page_num),
+                callback=self.parse_list_page,
+                cb_kwargs={'page_number': page_num}
+            )
+            for page_num in pages
+        ]
+    
+    def is_last_page(self, page_number, faq_urls, rendered):
+        """
+        이후 페이지 탐색을 멈출 페이지인지 확인
+        - 페이지네이션으로 확인한 범위를 벗어나고 새 FAQ가 없는 페이지
+        - Selenium/렌더링 캐시로 확인한 빈 목록 페이지
+        (범위 안에서 이미 본 FAQ만 있는 페이지는 크롤링 중 목록이 밀린 경우이므로 계속 진행)
+        """
+        if any(self.document_key(url) not in self.seen_filter for _, url in faq_urls or []):
+            return False
+        if self.pagination_total is None or page_number > self.pagination_total:
+            return True
+        return rendered and not faq_urls
+    
+    def mark_last_page(self, page_number):
+        """새 FAQ가 없는 페이지를 끝으로 기록 (이후 페이지는 탐색하지 않음)"""
+        if self.last_page is None or page_number < self.last_page:
+            self.last_page = page_number
+            self.crawler.stats.set_value(f'{self.name}/last_page', page_number)
+            self.logger.info(f"페이지 {page_number}: 새 FAQ 없음 - 이후 페이지 탐색 중단")
+    
+    def beyond_last_page(self, page_number):
+        return self.last_page is not None and page_number > self.last_page
+    
+    async def parse_list_page(self, response, page_number):
+        """목록 페이지의 FAQ를 정적으로 파싱 (목록이 없으면 Selenium으로 대체)"""
+        if self.beyond_last_page(page_number):
+            self.logger.debug(f"페이지 {page_number}: 마지막 페이지({self.last_page}) 이후 - 건너뜀")
+            self.crawler.stats.inc_value(f'{self.name}/pages_skipped')
+            return
+        
+        # 새로 보이는 페이지 요청 (샤드 모드는 작업 큐에 등록)
+        # (재개 시 완료한 페이지 이후의 페이지도 발견할 수 있도록 완료 여부보다 먼저 확인)
+        for request in self.schedule_pages(self.discover_pages(response, page_number)):
+            yield request
+        
+        if self.checkpoint and self.checkpoint.is_completed(page_number):
+            self.logger.info(f"페이지 {page_number}: 체크포인트에서 완료됨 - 건너뜀")
+            self.crawler.stats.inc_value(f'{self.name}/pages_resumed')
+            for request in self.schedule_pages(self.probe_next_page(page_number)):
+                yield request
+            return
+        
+        faq_urls = self.parse_faq_entries(response)
+        rendered = False  # Selenium/렌더링 캐시로 확인한 목록인지
+        
+        if faq_urls is None:
+            cached = self.load_rendered_page(self.list_page_url(page_number), self.list_render_state())
+            if cached is not None:
+                self.logger.info(f"페이지 {page_number}: 렌더링 캐시 사용")
+                faq_urls = self.parse_faq_entries(cached) or []  # 렌더링 결과에도 없으면 빈 목록
+                rendered = True
+            elif self.render_cache and self.render_cache.replay:
+                self.logger.warning(f"페이지 {page_number}: 렌더링 캐시 없음 (replay 모드) - 건너뜀")
+                return
+        
+        if faq_urls is None:
+            self.logger.info(f"페이지 {page_number}: 정적 목록 없음 - Selenium으로 대체")
             try:
-                self.logger.info(f"페이지 {page_num} 크롤링 시작")
-                
-                if self.navigate_to_page(page_num):
-                    # Item들을 yield
-                    yield from self.extract_page_items(page_num)
-                    self.processed_pages += 1
+                faq_urls = await maybe_deferred_to_future(
+                    self.defer_to_driver_pool(self.collect_page_with_selenium, page_number)
+                )
+                rendered = True
+            except Exception as e:
+                self.logger.error(f"페이지 {page_number} 크롤링 실패: {e}")
+                return
+        
+        # 범위를 벗어난 페이지면 이후 페이지 탐색 중단, 새 FAQ가 있으면 다음 페이지 확인
+        if self.is_last_page(page_number, faq_urls, rendered):
+            self.mark_last_page(page_number)
+        else:
+            for request in self.schedule_pages(self.probe_next_page(page_number)):
+                yield request
+        
+        async for result in self.extract_page_items(page_number, faq_urls):
+            yield result
+        
+        self.processed_pages += 1
+        self.crawler.stats.inc_value(f'{self.name}/pages_processed')
+    
+    def parse_faq_entries(self, response):
+        """
+        목록 페이지 정적 HTML에서 FAQ 제목과 URL 추출
+        
+        Returns:
+            list: (제목, URL) 목록, 목록 요소나 유효한 링크가 없으면 None
+        """
+        with self.latency.timer('parse/list'):
+            elements = response.css(self.faq_selector)
+            if not elements:
+                return None
+            
+            faq_urls = []
+            for i, element in enumerate(elements, 1):
+                link = element.css('a')
+                href = (link.attrib.get('href') or '').strip() if link else ''
+                if not href or href.startswith('javascript'):
+                    self.logger.debug(f"FAQ {i}: 정적 링크 없음")
+                    continue
                 
-                time.sleep(1)  # 페이지 간 간격
+                link_text = '\n'.join(t.strip() for t in link.css('::text').getall() if t.strip())
+                title = self.clean_title(link.attrib.get('title'), link_text)
+                url = response.urljoin(href)
                 
-            except Exception as e:
-                self.logger.error(f"페이지 {page_num} 크롤링 실패: {e}")
-                continue
+                if title and url:
+                    faq_urls.append((title, url))
+                else:
+                    self.logger.warning(f"FAQ {i}: 제목 또는 URL 없음")
+            
+            return faq_urls or None
+    
+    def list_render_state(self):
+        """목록 페이지 렌더링 캐시 키에 포함할 탭 상태"""
+        return f"tab={self.simple_search_tab}"
     
-    def navigate_to_page(self, page_number):
+    def collect_page_with_selenium(self, driver, page_number):
+        """Selenium으로 목록 페이지를 열어 FAQ 제목과 URL 수집 (드라이버 풀 워커에서 실행)"""
+        if not self.navigate_to_page(page_number, driver=driver):
+            raise RuntimeError(f"페이지 {page_number} 이동 실패")
+        self.save_rendered_page(self.list_page_url(page_number), driver=driver, state=self.list_render_state())
+        return self.collect_faq_urls_from_page(page_number, driver=driver)
+    
+    def navigate_to_page(self, page_number, driver=None):
         """특정 페이지로 이동"""
         try:
-            target_url = f"https://www.knrec.or.kr/biz/faq/faq_list01.do?page={page_number}&"
+            target_url = self.list_page_url(page_number)
             
-            if self.selenium_get(target_url, wait_for_element="ul.result_list"):
-                self.click_simple_search_tab()  # 간편검색 탭 다시 클릭
+            if self.selenium_get(target_url, wait_for_element="ul.result_list", driver=driver):
+                self.click_simple_search_tab(driver=driver)  # 간편검색 탭 다시 클릭
                 self.logger.info(f"페이지 {page_number} 이동 성공")
                 return True
             else:
@@ -182,82 +604,210 @@ class KnrecFaqSpider(BaseFAQSpider):
             self.logger.error(f"페이지 {page_number} 이동 중 오류: {e}")
             return False
     
-    def extract_page_items(self, page_number):
-        """현재 페이지의 모든 FAQ를 Item으로 추출하고 yield (각 FAQ마다 페이지 새로고침)"""
-        try:
-            page_extracted = 0
+    async def extract_page_items(self, page_number, faq_urls):
+        """수집한 FAQ 목록을 Item 또는 상세 페이지 요청으로 변환하여 yield"""
+        if not faq_urls:
+            self.logger.warning(f"페이지 {page_number}: FAQ URL 없음")
+            return
+        
+        self.logger.info(f"페이지 {page_number}: {len(faq_urls)}개 FAQ URL 수집 완료")
+        
+        # 중복 확인 후 새 FAQ만 선별
+        new_faqs = []
+        for i, (title, url) in enumerate(faq_urls, 1):
+            key = self.document_key(url)
+            if not self.seen_filter.add(key):
+                self.duplicate_faqs += 1
+                self.crawler.stats.inc_value(f'{self.name}/duplicates')
+                self.logger.debug(f"페이지 {page_number} FAQ {i}: 중복 제외 - {title[:30]}...")
+                continue
             
-            # 먼저 모든 FAQ URL을 수집 (DOM 변화 전에)
-            faq_urls = self.collect_faq_urls_from_page(page_number)
+            self.unique_faqs += 1
             
-            if not faq_urls:
-                self.logger.warning(f"페이지 {page_number}: FAQ URL 없음")
-                return
+            # 이미 저장된 문서 (실행 간 중복 필터 사용 시 이전 실행 포함)는 브라우저/상세 요청 전에 제외
+            if key in self.document_filter:
+                self.crawler.stats.inc_value(f'{self.name}/previously_seen')
+                self.logger.debug(f"페이지 {page_number} FAQ {i}: 저장된 문서 - {title[:30]}...")
+                continue
             
-            self.logger.info(f"페이지 {page_number}: {len(faq_urls)}개 FAQ URL 수집 완료")
+            # 증분 모드: 이전 실행과 제목이 같은 FAQ는 상세 페이지 생략
+            if self.crawl_state:
+                faq_no = self.extract_faq_no(url)
+                if self.crawl_state.is_unchanged(faq_no, self.list_signature_title(title)):
+                    self.crawl_state.touch(faq_no)
+                    self.unchanged_faqs += 1
+                    self.crawler.stats.inc_value(f'{self.name}/unchanged_skipped')
+                    self.logger.debug(f"페이지 {page_number} FAQ {i}: 변경 없음 - {title[:30]}...")
+                    continue
             
-            # 각 URL을 처리
-            for i, (title, url) in enumerate(faq_urls, 1):
+            new_faqs.append((i, title, url))
+        
+        # 이 페이지에서 저장해야 할 문서 (모두 저장되면 체크포인트에 페이지 완료로 기록)
+        if self.checkpoint:
+            self.checkpoint.start_page(page_number, [self.document_key(url) for _, _, url in new_faqs])
+        
+        # HTTP 모드: 상세 페이지를 Scrapy 요청으로 넘겨 동시 처리 (정적 파싱, 필요 시 Selenium 대체)
+        if self.detail_mode == 'http':
+            for i, title, url in new_faqs:
+                yield scrapy.Request(
+                    url=url,
+                    callback=self.parse_detail,
+                    errback=self.detail_failed,
+                    cb_kwargs={'page_number': page_number, 'index': i, 'title': title, 'url': url}
+                )
+            self.logger.info(f"페이지 {page_number}: {len(new_faqs)}개 상세 페이지 요청 생성")
+            return
+        
+        # Selenium 모드: 상세 내용을 드라이버 풀 워커들에 분배 (결과는 입력 순서 유지)
+        results = await maybe_deferred_to_future(defer.DeferredList([
+            deferred_from_coro(self.render_detail_content(url))
+            for _, _, url in new_faqs
+        ], consumeErrors=True))
+        
+        # 페이지 내 순서대로 Item 생성
+        page_extracted = 0
+        for (i, title, url), (success, content) in zip(new_faqs, results):
+            if not success:
+                self.logger.warning(f"페이지 {page_number} FAQ {i}: 추출 중 오류: {content.getErrorMessage()}")
+                self.record_detail_failure(page_number, url, title)
+                continue
+            
+            page_extracted += 1
+            self.logger.info(f"페이지 {page_number} FAQ {i}: 추출 완료 - {title[:30]}...")
+            yield self.build_item(page_number, title, url, content)
+        
+        self.logger.info(f"페이지 {page_number}: {page_extracted}개 새로운 FAQ 추출 완료")
+    
+    async def parse_detail(self, response, page_number, index, title, url):
+        """상세 페이지 정적 파싱 (정적 본문이 없을 때만 Selenium으로 대체, 본문을 얻지 못하면 실패로 기록)"""
+        try:
+            texts = self.extract_static_content(response, self.content_selector)
+            
+            if texts:
+                content = '\n\n'.join(texts)
+            else:
+                self.logger.info(f"페이지 {page_number} FAQ {index}: 정적 본문 없음 - Selenium으로 대체")
                 try:
-                    # 중복 확인
-                    if url in self.seen_urls:
-                        self.duplicate_faqs += 1
-                        self.logger.debug(f"페이지 {page_number} FAQ {i}: 중복 제외 - {title[:30]}...")
-                        continue
-                    
-                    self.seen_urls.add(url)
-                    
-                    # 상세 내용 추출
-                    content = self.extract_detail_content(url, self.content_selector)
-                    
-                    # Item 생성 (page를 첫 번째 필드로)
-                    item = RenewableEnergyItem()
-                    item['page'] = page_number
-                    item['title'] = title
-                    item['content'] = content
-                    item['url'] = url
-                    item['source'] = "한국에너지공단 신재생에너지센터"
-                    item['document_type'] = "FAQ"
-                    item['date_published'] = time.strftime('%Y-%m-%d')
-                    item['spider'] = self.name
-                    
-                    self.extracted_faqs += 1
-                    page_extracted += 1
-                    self.logger.info(f"페이지 {page_number} FAQ {i}: 추출 완료 - {title[:30]}...")
-                    
-                    yield item
-                    
+                    content = await self.render_detail_content(url)
                 except Exception as e:
-                    self.logger.warning(f"페이지 {page_number} FAQ {i}: 추출 중 오류: {e}")
-                    continue
-            
-            self.logger.info(f"페이지 {page_number}: {page_extracted}개 새로운 FAQ 추출 완료")
+                    self.logger.error(f"페이지 {page_number} FAQ {index}: Selenium 대체 실패: {e}")
+                    self.record_detail_failure(page_number, url, title)
+                    return
             
+            item = self.build_item(page_number, title, url, content)
         except Exception as e:
-            self.logger.error(f"페이지 {page_number} FAQ 추출 실패: {e}")
+            self.logger.error(f"페이지 {page_number} FAQ {index}: 상세 페이지 처리 실패: {e}")
+            self.record_detail_failure(page_number, url, title)
+            return
+        
+        self.logger.info(f"페이지 {page_number} FAQ {index}: 추출 완료 - {title[:30]}...")
+        yield item
+    
+    def detail_failed(self, failure):
+        """상세 페이지 요청 실패 (재시도 초과 등) - 목록 페이지가 완료될 수 있도록 실패로 기록"""
+        kwargs = failure.request.cb_kwargs
+        self.logger.error(f"페이지 {kwargs['page_number']} FAQ {kwargs['index']}: 상세 페이지 요청 실패: {failure.value}")
+        self.record_detail_failure(kwargs['page_number'], kwargs['url'], kwargs['title'])
     
-    def collect_faq_urls_from_page(self, page_number):
-        """페이지에서 모든 FAQ의 제목과 URL을 미리 수집"""
+    def record_detail_failure(self, page_number, url, title):
+        """저장하지 못한 상세 문서를 체크포인트의 페이지 대기 목록에서 제외 (재개 시 다시 요청하도록 실패 목록에 기록)"""
+        self.crawler.stats.inc_value(f'{self.name}/detail_failed')
+        if self.checkpoint:
+            self.checkpoint.fail_item(self.document_key(url), page_number, url=url, title=title)
+    
+    def retry_failed_details(self):
+        """재개 시 이전 실행에서 실패한 상세 문서 다시 요청 (목록 페이지는 완료 상태로 두고 상세 요청만 보냄)"""
+        retries = []
+        for key, failed in self.checkpoint.failed.items():
+            if not failed.get('url') or key in self.document_filter or not self.seen_filter.add(key):
+                continue
+            retries.append(scrapy.Request(
+                url=failed['url'],
+                callback=self.parse_detail,
+                errback=self.detail_failed,
+                cb_kwargs={'page_number': failed['page'], 'index': 'retry', 'title': failed['title'], 'url': failed['url']},
+                dont_filter=True
+            ))
+        
+        if retries:
+            self.logger.info(f"체크포인트: 실패한 상세 문서 {len(retries)}개 다시 요청")
+            self.crawler.stats.set_value(f'{self.name}/detail_retried', len(retries))
+        return retries
+    
+    async def render_detail_content(self, url):
+        """
+        브라우저 렌더링으로 상세 내용 추출 (렌더링 캐시에 있으면 Chrome 없이 정적 파싱)
+        본문을 얻지 못하면(캐시에 본문 없음, 로드/추출 실패) 예외 - 빈 문서를 저장하지 않고 실패로 기록
+        """
+        cached = self.load_rendered_page(url)
+        if cached is not None:
+            content = '\n\n'.join(self.extract_static_content(cached, self.content_selector) or [])
+        elif self.render_cache and self.render_cache.replay:
+            raise RuntimeError(f"렌더링 캐시 없음 (replay 모드): {url}")
+        else:
+            content = await maybe_deferred_to_future(self.defer_to_driver_pool(
+                lambda driver, url: self.extract_detail_content(url, self.content_selector, driver=driver),
+                url
+            ))
+        
+        if not content:
+            raise RuntimeError(f"상세 본문 없음: {url}")
+        return content
+    
+    def build_item(self, page_number, title, url, content):
+        """FAQ Item 생성"""
+        # Item 생성 (page를 첫 번째 필드로)
+        item = RenewableEnergyItem()
+        item['page'] = page_number
+        item['title'] = title
+        item['content'] = content
+        item['url'] = url
+        item['source'] = "한국에너지공단 신재생에너지센터"
+        item['document_type'] = "FAQ"
+        item['date_published'] = time.strftime('%Y-%m-%d')
+        item['spider'] = self.name
+        item['post_no'] = self.extract_faq_no(url)
+        
+        self.extracted_faqs += 1
+        self.crawler.stats.inc_value(f'{self.name}/items_extracted')
+        return item
+    
+    def record_crawl_state(self, item, response, spider):
+        """
+        결과 파일에 기록된 아이템의 증분 크롤링 상태 기록 (item_scraped)
+        본문이 비어 있거나 파이프라인에서 제외된 문서는 기록하지 않아 다음 실행에서 다시 수집
+        """
+        if not self.crawl_state or not item.get('content'):
+            return
+        try:
+            self.crawl_state.record(
+                item['post_no'], item['url'], [self.list_signature_title(item['title'])], item['content']
+            )
+        except Exception as e:
+            self.logger.error(f"크롤 상태 기록 실패 ({item.get('url')}): {e}")
+    
+    @staticmethod
+    def list_signature_title(title):
+        """목록 서명용 제목 (파이프라인이 저장 전에 공백을 정리하므로 같은 규칙으로 비교)"""
+        return ' '.join((title or '').split())
+    
+    def collect_faq_urls_from_page(self, page_number, driver=None):
+        """페이지에서 모든 FAQ의 제목과 URL을 미리 수집 (스크립트 한 번으로 목록 전체 조회)"""
         try:
-            faq_elements = self.selenium_find_elements(self.faq_selector)
-            if not faq_elements:
+            entries = self.selenium_collect_list_items(self.faq_selector, self.TITLE_SELECTORS, driver=driver)
+            if not entries:
                 return []
             
             faq_urls = []
-            for i, element in enumerate(faq_elements):
-                try:
-                    title = self.extract_clean_title(element)
-                    url = self.extract_link(element)
-                    
-                    if title and url:
-                        faq_urls.append((title, url))
-                        self.logger.debug(f"FAQ {i+1} URL 수집: {title[:30]}...")
-                    else:
-                        self.logger.warning(f"FAQ {i+1}: 제목 또는 URL 없음")
-                        
-                except Exception as e:
-                    self.logger.warning(f"FAQ {i+1} URL 수집 중 오류: {e}")
-                    continue
+            for i, entry in enumerate(entries):
+                title = self.clean_title(entry['title_attr'], entry['link_text']) or entry['text']
+                url = self.normalize_link(entry['href'])
+                
+                if title and url:
+                    faq_urls.append((title, url))
+                    self.logger.debug(f"FAQ {i+1} (no={entry['no']}) URL 수집: {title[:30]}...")
+                else:
+                    self.logger.warning(f"FAQ {i+1}: 제목 또는 URL 없음")
             
             return faq_urls
             
@@ -269,14 +819,7 @@ class KnrecFaqSpider(BaseFAQSpider):
         """링크 추출 (베이스 클래스 메소드 오버라이드)"""
         try:
             link_element = element.find_element(By.CSS_SELECTOR, 'a')
-            href = link_element.get_attribute('href')
-            if href:
-                # KNREC 전용 URL 처리
-                if href.startswith('/'):
-                    return f"https://www.knrec.or.kr{href}"
-                elif not href.startswith('http'):
-                    return f"https://www.knrec.or.kr/{href}"
-                return href
+            return self.normalize_link(link_element.get_attribute('href'))
         except NoSuchElementException:
             pass
         except Exception as e:
@@ -284,56 +827,75 @@ class KnrecFaqSpider(BaseFAQSpider):
         
         return ""
     
+    def normalize_link(self, href):
+        """KNREC 전용 URL 처리 (상대 경로를 절대 URL로)"""
+        if not href:
+            return ""
+        if href.startswith('/'):
+            return f"{self.base_url}{href}"
+        elif not href.startswith('http'):
+            return f"{self.base_url}/{href}"
+        return href
+    
     def extract_clean_title(self, element):
         """깔끔한 제목만 추출 (질문 부분만)"""
         try:
-            # a 태그에서 title 속성 우선 시도
             link_element = element.find_element(By.CSS_SELECTOR, 'a')
-            title_attr = link_element.get_attribute('title')
-            if title_attr and title_attr.strip():
-                return title_attr.strip()
-            
-            # a 태그의 텍스트에서 질문 부분만 추출
-            link_text = link_element.text.strip()
-            if link_text:
-                # '?' 까지만 추출 (질문 부분)
-                if '?' in link_text:
-                    question_part = link_text.split('?')[0] + '?'
-                    return question_part.strip()
-                # '?' 가 없으면 첫 번째 줄만 추출
-                elif '\n' in link_text:
-                    return link_text.split('\n')[0].strip()
-                else:
-                    return link_text
+            title = self.clean_title(link_element.get_attribute('title'), link_element.text)
+            if title:
+                return title
             
         except Exception as e:
             self.logger.warning(f"제목 추출 중 오류: {e}")
         
         # 베이스 클래스 메소드 fallback
-        return self.extract_text(element, 'a, .title, h3, h4, strong, .result_tit')
+        return self.extract_text(element, ', '.join(self.TITLE_SELECTORS))
     
-    def extract_detail_content(self, url, content_selector):
+    def clean_title(self, title_attr, link_text):
+        """링크의 title 속성과 텍스트에서 질문 부분만 추출"""
+        # a 태그에서 title 속성 우선 시도
+        if title_attr and title_attr.strip():
+            return title_attr.strip()
+        
+        # a 태그의 텍스트에서 질문 부분만 추출
+        link_text = (link_text or '').strip()
+        if link_text:
+            # '?' 까지만 추출 (질문 부분)
+            if '?' in link_text:
+                question_part = link_text.split('?')[0] + '?'
+                return question_part.strip()
+            # '?' 가 없으면 첫 번째 줄만 추출
+            elif '\n' in link_text:
+                return link_text.split('\n')[0].strip()
+            else:
+                return link_text
+        
+        return ""
+    
+    def extract_detail_content(self, url, content_selector, driver=None):
         """상세 페이지에서 전체 내용 추출 (베이스 클래스 메소드 오버라이드)"""
         if not url:
             return ""
         
         try:
             # 상세 페이지로 이동
-            if not self.selenium_get(url, wait_for_element=content_selector):
+            if not self.selenium_get(url, wait_for_element=content_selector, driver=driver):
                 self.logger.warning(f"상세 페이지 로드 실패: {url}")
                 return ""
             
-            # 내용 요소들 찾기
-            content_elements = self.selenium_find_elements(content_selector)
+            self.save_rendered_page(url, driver=driver)
+            
+            # 내용 요소들의 텍스트를 한 번에 수집
+            content_texts = self.selenium_element_texts(content_selector, driver=driver)
             
-            if not content_elements:
+            if not content_texts:
                 self.logger.warning(f"내용 요소 없음: {url}")
                 return ""
             
             # 모든 텍스트 수집 및 중복 제거
             all_texts = []
-            for element in content_elements:
-                text = element.text.strip()
+            for text in content_texts:
+                text = (text or '').strip()
                 if text and text not in all_texts:
                     all_texts.append(text)
             
@@ -353,7 +915,9 @@ class KnrecFaqSpider(BaseFAQSpider):
         self.logger.info(f"처리된 페이지: {self.processed_pages}")
         self.logger.info(f"추출된 FAQ: {self.extracted_faqs}")
         self.logger.info(f"중복 제거: {self.duplicate_faqs}")
-        self.logger.info(f"최종 고유 FAQ: {len(self.seen_urls)}")
+        if self.incremental:
+            self.logger.info(f"변경 없음(생략): {self.unchanged_faqs}")
+        self.logger.info(f"최종 고유 FAQ: {self.unique_faqs}")
         
         # 성공률 계산
         if self.total_pages > 0:
@@ -364,6 +928,38 @@ class KnrecFaqSpider(BaseFAQSpider):
         """스파이더 종료 시 호출"""
         super().closed(reason)
         
+        # 크롤링 완료 요약
+        self.log_crawling_summary()
+        
+        if self.crawl_state:
+            try:
+                self.crawl_state.close()
+            except Exception as e:
+                self.logger.error(f"크롤 상태 저장 실패: {e}")
+        
+        if self.work_queue:
+            try:
+                self.logger.info(f"샤드 워커 {self.worker_id} 종료 - 작업 큐 상태: {self.work_queue.counts()}")
+                self.work_queue.close()
+            except Exception as e:
+                self.logger.error(f"작업 큐 닫기 실패: {e}")
+        
+        # 모든 페이지와 상세 문서를 수집했으면 체크포인트 삭제, 아니면 다음 실행에서 재개할 수 있도록 보관
+        # (샤드 워커는 작업 큐가 재시도를 맡음)
+        if self.checkpoint and not self.work_queue:
+            if self.checkpoint.failed:
+                self.logger.warning(
+                    f"상세 수집 실패 문서 {len(self.checkpoint.failed)}개 - "
+                    f"-a resume=1 로 실패한 문서만 다시 요청할 수 있습니다 ({self.checkpoint.path})"
+                )
+            if reason == 'finished' and not self.checkpoint.pending and not self.checkpoint.failed:
+                self.checkpoint.remove()
+            elif self.checkpoint.pending or reason != 'finished':
+                self.logger.info(
+                    f"미완료 페이지 {len(self.checkpoint.pending)}개 - "
+                    f"-a resume=1 로 이어서 크롤링할 수 있습니다 ({self.checkpoint.path})"
+                )
+        
         # 최종 요약 저장
         try:
             summary = {
@@ -373,7 +969,8 @@ class KnrecFaqSpider(BaseFAQSpider):
                 'processed_pages': self.processed_pages,
                 'extracted_faqs': self.extracted_faqs,
                 'duplicate_faqs': self.duplicate_faqs,
-                'unique_faqs': len(self.seen_urls),
+                'unchanged_faqs': self.unchanged_faqs,
+                'unique_faqs': self.unique_faqs,
                 'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S')
             }
             
@@ -0,0 +1,185 @@
+"""
+여러 크롤러 프로세스가 공유하는 SQLite 작업 큐
+목록 페이지 단위 작업을 워커들이 필요할 때마다 가져가고(먼저 끝난 워커가 남은 페이지를 가져감),
+호스트별 요청 간격을 모든 워커가 함께 지키도록 다음 요청 가능 시각을 예약합니다.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+from common.waits import PolitenessDelay
+
+
+class ShardWorkQueue:
+    """
+    목록 페이지 작업 큐
+
+    상태: pending(대기) -> claimed(처리 중) -> done(완료) / failed(재시도 초과)
+    처리 중인 페이지도 lease_secs가 지나면 다른 워커가 다시 가져갈 수 있어,
+    멈추거나 종료된 워커의 페이지가 남지 않습니다.
+    """
+
+    def __init__(self, db_path, lease_secs=300, max_attempts=3):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_secs = lease_secs
+        self.max_attempts = max_attempts
+
+        # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE로 프로세스 간 쓰기 직렬화)
+        # 드라이버 풀 스레드에서도 요청 간격을 예약하므로 연결을 잠금으로 공유
+        self.conn = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.transaction():
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    page INTEGER PRIMARY KEY,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    claimed_at REAL,
+                    finished_at REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    items INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS hosts (
+                    host TEXT PRIMARY KEY,
+                    next_allowed REAL NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+
+    def seed(self, pages):
+        """페이지 작업 등록 (이미 있는 페이지는 그대로 두므로 여러 워커가 호출해도 안전)"""
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO pages (page) VALUES (?)", [(page,) for page in pages])
+            added = conn.total_changes - before
+        if added:
+            self.logger.info(f"작업 큐에 {added}개 페이지 등록: {self.db_path}")
+        return added
+
+    def claim(self, worker, count=1):
+        """
+        처리할 페이지를 가져옴 (대기 중이거나 lease가 만료된 페이지, 번호순)
+
+        Returns:
+            list: 페이지 번호 목록 (남은 작업이 없으면 빈 목록)
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            # lease가 만료됐지만 재시도 횟수를 다 쓴 페이지는 실패로 기록 (더 기다려도 가져갈 워커가 없음)
+            conn.execute(
+                "UPDATE pages SET status = 'failed', worker = NULL, claimed_at = NULL "
+                "WHERE status = 'claimed' AND claimed_at < ? AND attempts >= ?",
+                (now - self.lease_secs, self.max_attempts)
+            )
+            rows = conn.execute(
+                "SELECT page FROM pages "
+                "WHERE (status = 'pending' OR (status = 'claimed' AND claimed_at < ?)) AND attempts < ? "
+                "ORDER BY page LIMIT ?",
+                (now - self.lease_secs, self.max_attempts, count)
+            ).fetchall()
+            pages = [row[0] for row in rows]
+            conn.executemany(
+                "UPDATE pages SET status = 'claimed', worker = ?, claimed_at = ?, attempts = attempts + 1 "
+                "WHERE page = ?",
+                [(worker, now, page) for page in pages]
+            )
+        return pages
+
+    def complete(self, page, items=0):
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE pages SET status = 'done', finished_at = ?, items = ? WHERE page = ?",
+                (time.time(), items, page)
+            )
+
+    def fail(self, page):
+        """처리 실패 - 재시도 횟수가 남았으면 대기 상태로 되돌림"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE pages SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "worker = NULL, claimed_at = NULL WHERE page = ?",
+                (self.max_attempts, page)
+            )
+
+    def in_progress(self):
+        """
+        다른 워커가 처리 중인 페이지 수와 가장 빠른 lease 만료까지 남은 시간(초)
+
+        Returns:
+            tuple: (처리 중 페이지 수, 남은 시간 또는 None)
+        """
+        with self.lock:
+            count, oldest = self.conn.execute(
+                "SELECT COUNT(*), MIN(claimed_at) FROM pages WHERE status = 'claimed'"
+            ).fetchone()
+        if not count:
+            return 0, None
+        return count, max(0.0, oldest + self.lease_secs - time.time())
+
+    def max_page(self):
+        """등록된 가장 큰 페이지 번호 (아직 등록된 페이지가 없으면 None)"""
+        with self.lock:
+            return self.conn.execute("SELECT MAX(page) FROM pages").fetchone()[0]
+
+    def counts(self):
+        """상태별 페이지 수"""
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM pages GROUP BY status").fetchall()
+        return dict(rows)
+
+    def reserve_slot(self, host, delay):
+        """
+        호스트의 다음 요청 시각을 예약하고 대기해야 할 시간(초)을 반환
+        모든 워커 프로세스가 같은 예약을 사용하므로 전체 요청 간격이 delay 이상으로 유지됨
+        """
+        if delay <= 0:
+            return 0.0
+
+        with self.transaction() as conn:
+            now = time.time()
+            row = conn.execute("SELECT next_allowed FROM hosts WHERE host = ?", (host,)).fetchone()
+            ready_at = max(now, row[0] if row else 0.0)
+            conn.execute(
+                "INSERT OR REPLACE INTO hosts (host, next_allowed) VALUES (?, ?)",
+                (host, ready_at + delay)
+            )
+        return ready_at - now
+
+    def close(self):
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+
+class SharedPolitenessDelay(PolitenessDelay):
+    """작업 큐를 통해 모든 워커 프로세스가 공유하는 사이트별 요청 간격"""
+
+    def __init__(self, work_queue, delays=None, default_delay=0.0):
+        super().__init__(delays, default_delay)
+        self.work_queue = work_queue
+
+    def reserve(self, url):
+        host = urlparse(url).hostname or ''
+        return self.work_queue.reserve_slot(host, self.delay_for(host))
@@ -0,0 +1,10 @@
+"""
+크롤러 단위 테스트 설정
+common, crawler 패키지를 scrapy 실행 때와 같은 경로(crawler/)에서 import 합니다.
+"""
+import os
+import sys
+
+CRAWLER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if CRAWLER_DIR not in sys.path:
+    sys.path.insert(0, CRAWLER_DIR)
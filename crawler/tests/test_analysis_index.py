@@ -0,0 +1,109 @@
+"""분석 결과 인덱스 테스트"""
+import json
+import os
+
+from common import analysis_index as analysis_index_module
+from common.analysis_index import INDEX_FILENAME, AnalysisIndex, parse_analysis_timestamp
+
+
+def write_analysis(directory, name, timestamp, mtime, **extra):
+    path = directory / name
+    path.write_text(json.dumps({'timestamp': timestamp, **extra}), encoding='utf-8')
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_parse_analysis_timestamp():
+    assert parse_analysis_timestamp('2025-06-11T18:16:12+00:00') == 1749665772.0
+    assert parse_analysis_timestamp('2025-06-11T18:16:12Z') == 1749665772.0
+    assert parse_analysis_timestamp('') is None
+    assert parse_analysis_timestamp('어제') is None
+
+
+def test_rebuild_picks_latest_file_per_target(tmp_path):
+    write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100)
+    write_analysis(tmp_path, 'knrec_faq_analysis_2.json', '2025-02-01T00:00:00', 200, fingerprint='abc')
+    write_analysis(tmp_path, 'other_analysis_1.json', '2025-01-01T00:00:00', 100)
+
+    index = AnalysisIndex(tmp_path)
+    entry = index.latest('knrec_faq')
+    assert entry['path'] == 'knrec_faq_analysis_2.json'
+    assert entry['site'] == tmp_path.name
+    assert entry['fingerprint'] == 'abc'
+    assert index.latest('other')['path'] == 'other_analysis_1.json'
+    assert index.latest('missing') is None
+
+    manifest = json.loads((tmp_path / INDEX_FILENAME).read_text(encoding='utf-8'))
+    assert set(manifest['entries']) == {'knrec_faq', 'other'}
+
+
+def test_manifest_used_without_scanning(tmp_path):
+    write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100)
+    AnalysisIndex(tmp_path).latest('knrec_faq')
+
+    # 인덱스 파일이 있으면 디렉토리를 다시 훑지 않음 (새 파일은 record()로 등록)
+    write_analysis(tmp_path, 'knrec_faq_analysis_2.json', '2025-02-01T00:00:00', 200)
+    index = AnalysisIndex(tmp_path)
+    assert index.latest('knrec_faq')['path'] == 'knrec_faq_analysis_1.json'
+
+    path = tmp_path / 'knrec_faq_analysis_2.json'
+    index.record('knrec_faq', path, json.loads(path.read_text(encoding='utf-8')))
+    assert AnalysisIndex(tmp_path).latest('knrec_faq')['path'] == 'knrec_faq_analysis_2.json'
+
+
+def test_rebuild_when_indexed_file_removed(tmp_path):
+    write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100)
+    write_analysis(tmp_path, 'knrec_faq_analysis_2.json', '2025-02-01T00:00:00', 200)
+    index = AnalysisIndex(tmp_path)
+    assert index.latest('knrec_faq')['path'] == 'knrec_faq_analysis_2.json'
+
+    (tmp_path / 'knrec_faq_analysis_2.json').unlink()
+    assert index.latest('knrec_faq')['path'] == 'knrec_faq_analysis_1.json'
+
+
+def test_corrupt_manifest_is_rebuilt(tmp_path):
+    write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100)
+    (tmp_path / INDEX_FILENAME).write_text('{', encoding='utf-8')
+    assert AnalysisIndex(tmp_path).latest('knrec_faq')['path'] == 'knrec_faq_analysis_1.json'
+
+
+def test_record_keeps_newer_entry(tmp_path):
+    newer = write_analysis(tmp_path, 'knrec_faq_analysis_2.json', '2025-02-01T00:00:00', 200)
+    older = write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100)
+    index = AnalysisIndex(tmp_path)
+    index.record('knrec_faq', newer)
+    assert index.record('knrec_faq', older)['path'] == newer.name
+
+
+def test_load_returns_isolated_copies(tmp_path):
+    write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100,
+                   best_selectors={'faq_selector': 'ul li'})
+    index = AnalysisIndex(tmp_path)
+
+    result, entry = index.load('knrec_faq')
+    assert entry['path'] == 'knrec_faq_analysis_1.json'
+    result['best_selectors']['faq_selector'] = 'changed'
+
+    again, _ = index.load('knrec_faq')
+    assert again['best_selectors']['faq_selector'] == 'ul li'
+    assert index.load('missing') == (None, None)
+
+
+def test_manifest_rechecked_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(analysis_index_module.time, 'monotonic', lambda: now[0])
+    write_analysis(tmp_path, 'knrec_faq_analysis_1.json', '2025-01-01T00:00:00', 100)
+    index = AnalysisIndex(tmp_path, cache_ttl=60)
+    assert index.latest('knrec_faq')['path'] == 'knrec_faq_analysis_1.json'
+
+    # 다른 프로세스가 새 분석을 등록
+    path = write_analysis(tmp_path, 'knrec_faq_analysis_2.json', '2025-02-01T00:00:00', 200)
+    other = AnalysisIndex(tmp_path)
+    other.record('knrec_faq', path)
+    manifest_mtime = (tmp_path / INDEX_FILENAME).stat().st_mtime + 10
+    os.utime(tmp_path / INDEX_FILENAME, (manifest_mtime, manifest_mtime))  # 파일 시스템 시각 해상도와 무관하게
+
+    now[0] += 30
+    assert index.latest('knrec_faq')['path'] == 'knrec_faq_analysis_1.json'  # TTL 동안은 캐시 사용
+    now[0] += 31
+    assert index.latest('knrec_faq')['path'] == 'knrec_faq_analysis_2.json'
@@ -0,0 +1,60 @@
+"""Bloom filter / KeySet 테스트"""
+import pytest
+
+from common.bloom_filter import BloomFilter, KeySet
+
+
+def test_add_and_contains():
+    bloom = BloomFilter(capacity=1000, error_rate=0.001)
+    assert bloom.add('knrec_faq:1')
+    assert not bloom.add('knrec_faq:1')
+    assert 'knrec_faq:1' in bloom
+    assert 'knrec_faq:2' not in bloom
+    assert len(bloom) == 1
+    bloom.close()
+
+
+def test_no_false_negatives_and_error_rate():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    keys = [f'knrec_faq:{i}' for i in range(2000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+
+    false_positives = sum(f'other:{i}' in bloom for i in range(10000))
+    assert false_positives / 10000 < 0.03
+    bloom.close()
+
+
+def test_persist_and_reopen(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    bloom = BloomFilter(path, capacity=500, error_rate=0.001)
+    for i in range(10):
+        bloom.add(f'key{i}')
+    bloom.close()
+
+    # 다른 용량으로 열어도 파일 헤더의 크기/해시 수를 사용
+    reopened = BloomFilter(path, capacity=10, error_rate=0.5)
+    assert (reopened.capacity, reopened.count) == (500, 10)
+    assert (reopened.bit_count, reopened.hash_count) == BloomFilter.optimal_size(500, 0.001)
+    assert all(f'key{i}' in reopened for i in range(10))
+    assert not reopened.add('key3')
+    reopened.close()
+
+
+def test_reopen_rejects_other_file(tmp_path):
+    path = tmp_path / 'not_a_filter.bloom'
+    path.write_bytes(b'x' * BloomFilter.HEADER.size)
+    with pytest.raises(ValueError):
+        BloomFilter(path)
+
+
+def test_key_set_matches_filter_interface():
+    keys = KeySet()
+    assert keys.path is None
+    assert keys.add('a')
+    assert not keys.add('a')
+    assert 'a' in keys and 'b' not in keys
+    assert len(keys) == 1
+    keys.close()
+    assert len(keys) == 0
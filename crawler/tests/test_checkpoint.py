@@ -0,0 +1,131 @@
+"""크롤링 체크포인트 테스트"""
+from crawler.checkpoint import CrawlCheckpoint
+
+
+def test_page_completes_when_all_items_recorded(tmp_path):
+    checkpoint = CrawlCheckpoint(tmp_path / 'checkpoint.json')
+    checkpoint.start_page(1, ['knrec_faq:1', 'knrec_faq:2'])
+    assert not checkpoint.is_completed(1)
+
+    checkpoint.record_item('knrec_faq:1', 1)
+    assert checkpoint.pending == {1: {'knrec_faq:2'}}
+
+    checkpoint.record_item('knrec_faq:2', 1)
+    assert checkpoint.is_completed(1)
+    assert checkpoint.pending == {}
+    assert checkpoint.is_emitted('knrec_faq:2')
+
+
+def test_page_without_new_items_completes_immediately(tmp_path):
+    checkpoint = CrawlCheckpoint(tmp_path / 'checkpoint.json')
+    checkpoint.record_item('knrec_faq:1', 1)
+    checkpoint.start_page(2, ['knrec_faq:1'])  # 이미 저장한 문서만 있는 페이지
+    checkpoint.start_page(3, [])
+    assert checkpoint.is_completed(2) and checkpoint.is_completed(3)
+
+
+def test_failed_item_completes_page_without_emitting(tmp_path):
+    checkpoint = CrawlCheckpoint(tmp_path / 'checkpoint.json')
+    checkpoint.start_page(1, ['knrec_faq:1', 'knrec_faq:2'])
+    checkpoint.record_item('knrec_faq:1', 1)
+    checkpoint.fail_item('knrec_faq:2', 1, url='https://example.com/view?no=2', title='제목')
+
+    assert checkpoint.is_completed(1)
+    assert not checkpoint.is_emitted('knrec_faq:2')
+    assert checkpoint.failed == {'knrec_faq:2': {'url': 'https://example.com/view?no=2', 'title': '제목', 'page': 1}}
+
+
+def test_failed_item_kept_until_saved(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.start_page(1, ['knrec_faq:1'])
+    checkpoint.fail_item('knrec_faq:1', 1, url='u1', title='제목')
+    checkpoint.save('out.jsonl', 0, 0)
+
+    loaded = CrawlCheckpoint.load(path)
+    assert loaded.failed['knrec_faq:1']['url'] == 'u1'
+
+    # 재개 후 다시 요청해 저장하면 실패 목록에서 제외
+    loaded.record_item('knrec_faq:1', 1)
+    assert loaded.failed == {}
+    assert loaded.is_emitted('knrec_faq:1')
+
+
+def test_item_for_other_page_does_not_complete_page(tmp_path):
+    checkpoint = CrawlCheckpoint(tmp_path / 'checkpoint.json')
+    checkpoint.start_page(1, ['knrec_faq:1'])
+    checkpoint.record_item('knrec_faq:1', 2)
+    assert not checkpoint.is_completed(1)
+    assert checkpoint.is_emitted('knrec_faq:1')
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / 'knrec_faq' / 'checkpoint.json'
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.start_page(1, ['knrec_faq:1'])
+    checkpoint.start_page(2, ['knrec_faq:2', 'knrec_faq:3'])
+    checkpoint.record_item('knrec_faq:1', 1)
+    checkpoint.record_item('knrec_faq:2', 2)
+    checkpoint.save(tmp_path / 'out.jsonl', 1234, 2)
+
+    loaded = CrawlCheckpoint.load(path)
+    assert loaded.output_path == str(tmp_path / 'out.jsonl')
+    assert (loaded.output_offset, loaded.items_written) == (1234, 2)
+    assert loaded.completed_pages == {1}
+    assert loaded.emitted == {'knrec_faq:1', 'knrec_faq:2'}
+    # 처리 중이던 페이지는 저장하지 않음 (재개 시 다시 수집, 저장한 문서는 제외)
+    assert loaded.pending == {}
+    loaded.start_page(2, ['knrec_faq:2', 'knrec_faq:3'])
+    assert loaded.pending == {2: {'knrec_faq:3'}}
+
+
+def test_load_missing_or_corrupt(tmp_path):
+    assert CrawlCheckpoint.load(tmp_path / 'missing.json') is None
+    path = tmp_path / 'broken.json'
+    path.write_text('{"emitted": [', encoding='utf-8')
+    assert CrawlCheckpoint.load(path) is None
+
+
+def test_remove(tmp_path):
+    checkpoint = CrawlCheckpoint(tmp_path / 'checkpoint.json')
+    checkpoint.save(tmp_path / 'out.jsonl', 0, 0)
+    assert checkpoint.path.exists()
+    checkpoint.remove()
+    assert not checkpoint.path.exists()
+    checkpoint.remove()  # 없어도 오류 없음
+
+
+def test_pages_reported_only_after_output_saved(tmp_path):
+    saved = []
+    checkpoint = CrawlCheckpoint(tmp_path / 'w1_checkpoint.json', on_pages_saved=saved.append)
+    flushes = []
+    checkpoint.save_output = lambda: flushes.append(dict(checkpoint.unsaved_pages))
+
+    checkpoint.start_page(1, ['knrec_faq:1', 'knrec_faq:2'])
+    checkpoint.record_item('knrec_faq:1', 1)
+    assert flushes == [] and saved == []
+
+    checkpoint.fail_item('knrec_faq:2', 1)
+    assert flushes == [{1: 1}]  # 결과 파일 반영 요청
+    assert saved == []  # 저장 전에는 완료를 알리지 않음
+
+    checkpoint.save(tmp_path / 'out.jsonl', 100, 1)
+    assert saved == [{1: 1}]
+    checkpoint.save(tmp_path / 'out.jsonl', 100, 1)
+    assert saved == [{1: 1}]
+
+
+def test_pages_reported_directly_without_output(tmp_path):
+    saved = []
+    checkpoint = CrawlCheckpoint(tmp_path / 'w1_checkpoint.json', on_pages_saved=saved.append)
+    checkpoint.start_page(3, [])
+    assert saved == [{3: 0}]
+
+
+def test_discarded_page_is_not_reported(tmp_path):
+    saved = []
+    checkpoint = CrawlCheckpoint(tmp_path / 'w1_checkpoint.json', on_pages_saved=saved.append)
+    checkpoint.start_page(1, ['knrec_faq:1'])
+    checkpoint.discard_page(1)
+    checkpoint.record_item('knrec_faq:1', 1)
+    assert saved == [] and not checkpoint.is_completed(1)
@@ -0,0 +1,49 @@
+"""증분 크롤링 상태 저장소 테스트"""
+from crawler.crawl_state import CrawlStateStore
+
+
+def test_unknown_document_is_changed(tmp_path):
+    store = CrawlStateStore(tmp_path / 'crawl_state.sqlite3')
+    assert store.get('1') is None
+    assert not store.is_unchanged('1', '제목')
+    store.close()
+
+
+def test_record_and_list_signature(tmp_path):
+    store = CrawlStateStore(tmp_path / 'crawl_state.sqlite3')
+    assert store.record('1', 'https://example.com/view?no=1', ['제목'], '본문')
+    assert store.is_unchanged('1', '제목')
+    assert store.is_unchanged('1', '  제목 ')  # 앞뒤 공백은 무시
+    assert not store.is_unchanged('1', '바뀐 제목')
+    store.close()
+
+
+def test_record_reports_content_change(tmp_path):
+    store = CrawlStateStore(tmp_path / 'crawl_state.sqlite3')
+    store.record('1', 'u', ['제목'], '본문')
+    first = store.get('1')
+
+    assert not store.record('1', 'u', ['제목'], '본문')
+    assert store.get('1')['last_changed'] == first['last_changed']
+
+    assert store.record('1', 'u', ['제목'], '새 본문')
+    state = store.get('1')
+    assert state['first_seen'] == first['first_seen']
+    assert state['content_hash'] == CrawlStateStore.hash_text('새 본문')
+    store.close()
+
+
+def test_hash_text_separates_parts():
+    assert CrawlStateStore.hash_text('ab', 'c') != CrawlStateStore.hash_text('a', 'bc')
+
+
+def test_state_persists_after_close(tmp_path):
+    path = tmp_path / 'crawl_state.sqlite3'
+    store = CrawlStateStore(path)
+    store.record('1', 'u', ['제목'], '본문')
+    store.touch('1')
+    store.close()
+
+    reopened = CrawlStateStore(path)
+    assert reopened.is_unchanged('1', '제목')
+    reopened.close()
@@ -0,0 +1,118 @@
+"""첨부 파일 다운로드 파이프라인 테스트 (fixture 서버의 /files/ 사용)"""
+import logging
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+from scrapy.utils.test import get_crawler
+
+from benchmarks.fixture_server import FixtureSite, load_records, make_handler
+from crawler.pipelines import FileDownloadPipeline
+
+DATA = bytes(range(256)) * 1024  # 256KB
+
+
+class Spider:
+    name = 'test'
+    logger = logging.getLogger('test_file_download')
+
+
+@pytest.fixture
+def site():
+    site = FixtureSite(load_records(), total_pages=1)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(site))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    site.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    pipeline = FileDownloadPipeline(tmp_path / 'files', retries=0, stats=get_crawler().stats)
+    pipeline.open_spider(Spider)
+    yield pipeline
+    pipeline.close_spider(Spider)
+
+
+def add_file(site, data, name='report.pdf'):
+    return site.base_url + site.add_file(name, data)
+
+
+def interrupted(pipeline, site, url, sent):
+    """sent 바이트만 보내고 끊긴 다운로드 (부분 파일에는 받은 청크까지 남음)"""
+    site.abort_after = sent
+    with pytest.raises(Exception):
+        pipeline._download(url, Spider)
+    site.abort_after = None
+    partial, = pipeline.partial_dir.glob('*.part')
+    assert 0 < partial.stat().st_size < len(DATA)
+    return partial
+
+
+def saved(pipeline, result):
+    return (pipeline.files_dir / result['path']).read_bytes()
+
+
+def test_fresh_download(pipeline, site):
+    url = add_file(site, DATA)
+    result = pipeline.download(url, Spider)
+
+    assert result['status'] == 'downloaded'
+    assert result['size'] == len(DATA)
+    assert saved(pipeline, result) == DATA
+    assert list(pipeline.partial_dir.iterdir()) == []
+
+    # 같은 내용의 다른 URL은 저장하지 않음
+    other = pipeline.download(add_file(site, DATA, 'copy.pdf'), Spider)
+    assert other['status'] == 'duplicate' and other['path'] == result['path']
+
+
+def test_resumed_download(pipeline, site):
+    url = add_file(site, DATA)
+    interrupted(pipeline, site, url, 100_000)
+
+    result = pipeline._download(url, Spider)
+
+    assert result['status'] == 'resumed'
+    assert saved(pipeline, result) == DATA
+    assert pipeline.stats.get_value('file_download/restarted') is None
+
+
+def test_complete_partial_file_answered_with_416(pipeline, site):
+    url = add_file(site, DATA)
+    partial = interrupted(pipeline, site, url, 100_000)
+    with open(partial, 'ab') as f:
+        f.write(DATA[partial.stat().st_size:])  # 전체를 받은 뒤 이동 전에 중단된 경우
+
+    result = pipeline._download(url, Spider)
+    assert result['status'] == 'resumed'
+    assert saved(pipeline, result) == DATA
+
+
+def test_server_without_range_support(pipeline, site):
+    url = add_file(site, DATA)
+    interrupted(pipeline, site, url, 100_000)
+    site.range_requests = False
+
+    result = pipeline._download(url, Spider)
+
+    assert result['status'] == 'downloaded'
+    assert saved(pipeline, result) == DATA
+
+
+@pytest.mark.parametrize('new_size', [len(DATA) * 2, 50_000])
+def test_changed_remote_file_restarts(pipeline, site, new_size):
+    url = add_file(site, DATA)
+    interrupted(pipeline, site, url, 100_000)
+    changed = bytes(reversed(DATA)) * 2
+    add_file(site, changed[:new_size])  # 같은 URL의 내용 변경 (부분 파일보다 작아지는 경우 포함)
+
+    result = pipeline._download(url, Spider)
+
+    assert result['status'] == 'downloaded'
+    assert saved(pipeline, result) == changed[:new_size]
+    assert pipeline.stats.get_value('file_download/restarted') == 1
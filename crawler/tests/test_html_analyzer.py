@@ -0,0 +1,98 @@
+"""브라우저 없는 HTML 구조 분석 테스트"""
+import pytest
+from selenium.webdriver.common.by import By
+
+from analysis.html_analyzer import HTMLAnalyzer, StaticPage, analyze_static_batch
+
+BASE_URL = 'https://www.knrec.or.kr/biz/faq/faq_list01.do'
+
+HTML = '''
+<html>
+<head><title>  FAQ
+ 목록 </title></head>
+<body>
+  <form id="search" action="faq_list01.do"><input name="q"></form>
+  <ul class="result_list">
+    <li><a href="faq_view.do?no=1">질문  1</a></li>
+    <li><a href="/biz/faq/faq_view.do?no=2">질문 2</a></li>
+  </ul>
+  <table><tr><th>구분</th></tr><tr><td>태양광</td></tr></table>
+  <div class="paging"><a href="?page=2">2</a><a href="?page=3">3</a></div>
+</body>
+</html>
+'''
+
+
+@pytest.fixture
+def page():
+    return StaticPage(HTML, BASE_URL)
+
+
+def test_page_title_and_tag(page):
+    assert page.title == 'FAQ 목록'
+    assert page.tag_name == 'html'
+
+
+def test_find_elements_by_css_xpath_and_tag(page):
+    assert [li.text for li in page.find_elements(By.CSS_SELECTOR, 'ul.result_list li')] == ['질문 1', '질문 2']
+    assert len(page.find_elements(By.XPATH, '//a[contains(@href, "faq_view")]')) == 2
+    assert [td.text for td in page.find_elements(By.TAG_NAME, 'td')] == ['태양광']
+
+    with pytest.raises(ValueError):
+        page.find_elements(By.LINK_TEXT, '질문 1')
+
+
+def test_find_elements_returns_descendants_only(page):
+    ul, = page.find_elements(By.CSS_SELECTOR, 'ul')
+
+    assert ul.find_elements(By.CSS_SELECTOR, 'ul') == []
+    assert len(ul.find_elements(By.CSS_SELECTOR, 'li')) == 2
+    assert len(ul.find_elements(By.TAG_NAME, 'a')) == 2
+
+
+def test_get_attribute_matches_webelement(page):
+    link = page.find_elements(By.CSS_SELECTOR, 'li a')[0]
+    form, = page.find_elements(By.CSS_SELECTOR, 'form')
+    li = page.find_elements(By.CSS_SELECTOR, 'li')[0]
+
+    # href/action은 절대 URL, 없는 class/id는 빈 문자열, 그 외 없는 속성은 None
+    assert link.get_attribute('href') == 'https://www.knrec.or.kr/biz/faq/faq_view.do?no=1'
+    assert form.get_attribute('action') == BASE_URL
+    assert form.get_attribute('id') == 'search'
+    assert li.get_attribute('class') == ''
+    assert li.get_attribute('title') is None
+
+
+@pytest.mark.parametrize('body, content_type', [
+    ('<html><head><title>목록</title></head></html>'.encode('utf-8'), None),
+    ('<html><head><meta charset="euc-kr"><title>목록</title></head></html>'.encode('cp949'), None),
+    ('<html><head><title>목록</title></head></html>'.encode('cp949'), 'text/html; charset=EUC-KR'),
+    (b'\xef\xbb\xbf' + '<html><head><title>목록</title></head></html>'.encode('utf-8'), 'text/html; charset=EUC-KR'),
+])
+def test_page_bytes_decoded_with_declared_encoding(body, content_type):
+    assert StaticPage(body, content_type=content_type).title == '목록'
+
+
+def test_analyze_static_file(tmp_path):
+    path = tmp_path / 'faq.html'
+    path.write_text(HTML, encoding='utf-8')
+
+    result = HTMLAnalyzer(offline=True).analyze_static(str(path), base_url=BASE_URL, save=False)
+
+    assert result['mode'] == 'static'
+    assert result['title'] == 'FAQ 목록'
+    elements = result['elements']
+    assert elements['forms']['count'] == 1
+    assert elements['lists']['count'] == 1
+    assert elements['tables']['count'] == 1
+    assert elements['pagination']['count'] == 1
+
+
+def test_batch_reports_failures_without_stopping(tmp_path):
+    path = tmp_path / 'faq.html'
+    path.write_text(HTML, encoding='utf-8')
+
+    summaries = analyze_static_batch([str(path), str(tmp_path / 'missing.html')], workers=1, save=False)
+
+    assert summaries[0]['title'] == 'FAQ 목록' and summaries[0]['lists'] == 1
+    assert summaries[1]['source'].endswith('missing.html') and 'error' in summaries[1]
@@ -0,0 +1,160 @@
+"""KNREC 사이트 분석기 테스트 (가짜 드라이버 사용, 브라우저를 띄우지 않음)"""
+import asyncio
+import threading
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from analysis import knrec_faq_analyzer
+from analysis.knrec_faq_analyzer import FAQ_ITEM_SELECTORS, ITEM_DETAILS_SCRIPT, PROBE_SELECTORS_SCRIPT, KnrecAnalyzer
+
+
+class Element:
+    def __init__(self, text, css_class=None):
+        self.text = text
+        self.css_class = css_class
+
+    def get_attribute(self, name):
+        return self.css_class if name == 'class' else None
+
+
+class Driver:
+    """execute_script 결과를 스크립트별로 정하고 find_elements는 선택자별 요소를 반환"""
+
+    def __init__(self, scripts=None, elements=None):
+        self.scripts = scripts or {}
+        self.elements = elements or {}
+        self.script_calls = []
+        self.find_calls = []
+
+    def execute_script(self, script, *args):
+        self.script_calls.append(script)
+        result = self.scripts[script]
+        if isinstance(result, Exception):
+            raise result
+        return result(*args) if callable(result) else result
+
+    def find_elements(self, by, selector):
+        self.find_calls.append((by, selector))
+        result = self.elements.get(selector, [])
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def probe(selector, count):
+    return {'selector': selector, 'count': count, 'text_length': 0, 'preview': '', 'class': None, 'samples': []}
+
+
+def test_probe_selectors_uses_one_script_call():
+    driver = Driver(scripts={PROBE_SELECTORS_SCRIPT: lambda selectors, *_: [probe(s, 1) for s in selectors]})
+
+    probes = KnrecAnalyzer()._probe_selectors(driver, ['ul li', '//li'])
+
+    assert [p['selector'] for p in probes] == ['ul li', '//li']
+    assert driver.script_calls == [PROBE_SELECTORS_SCRIPT]
+    assert driver.find_calls == []
+
+
+def test_probe_selectors_falls_back_to_find_elements():
+    driver = Driver(
+        scripts={PROBE_SELECTORS_SCRIPT: RuntimeError('javascript error')},
+        elements={
+            'ul li': [Element(' 첫 질문 ', 'item'), Element('둘째 질문')],
+            '//li[@class]': [Element('첫 질문', 'item')],
+            'ul >> li': ValueError('invalid selector'),
+        },
+    )
+
+    probes = KnrecAnalyzer()._probe_selectors(driver, ['ul li', '//li[@class]', 'ul >> li'], preview_length=2, sample_count=1)
+
+    assert probes[0] == {
+        'selector': 'ul li', 'count': 2, 'text_length': 4, 'preview': '첫 ', 'class': 'item',
+        'samples': [{'text': '첫 질문', 'class': 'item'}],
+    }
+    assert driver.find_calls[1] == (By.XPATH, '//li[@class]')
+    assert probes[2]['count'] == 0 and 'invalid selector' in probes[2]['error']
+
+
+def test_find_faq_items_uses_first_matching_candidate():
+    counts = {FAQ_ITEM_SELECTORS[2]: 10, FAQ_ITEM_SELECTORS[3]: 5}
+    items = [{'index': 0, 'text': '질문', 'link': 'https://www.knrec.or.kr/biz/faq/faq_view.do?no=1'}]
+    driver = Driver(scripts={
+        PROBE_SELECTORS_SCRIPT: lambda selectors, *_: [probe(s, counts.get(s, 0)) for s in selectors],
+        ITEM_DETAILS_SCRIPT: lambda selector, limit, *_: items if selector == FAQ_ITEM_SELECTORS[2] else [],
+    })
+    result = {}
+
+    KnrecAnalyzer()._find_faq_items(driver, result)
+
+    assert result == {'faq_items': items, 'faq_count': 10, 'faq_selector_used': FAQ_ITEM_SELECTORS[2]}
+    assert driver.script_calls == [PROBE_SELECTORS_SCRIPT, ITEM_DETAILS_SCRIPT]
+
+
+class Browser:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    analyzer = KnrecAnalyzer()
+    analyzer.browsers = []
+    analyzer.saved = []
+    analyzer.detail_started = threading.Event()
+
+    def create_driver():
+        browser = Browser()
+        analyzer.browsers.append(browser)
+        return browser
+
+    def analyze_detail_page(driver, detail_result):
+        if not detail_result['faq_items']:
+            return  # 실제 분석과 같이 링크가 없으면 건너뜀
+        analyzer.detail_started.set()
+        detail_result['detail_page_analysis'] = {'url': detail_result['faq_items'][0]['link'], 'driver': driver}
+
+    monkeypatch.setattr(knrec_faq_analyzer, 'fetch_structural_fingerprint', lambda url: 'fingerprint')
+    monkeypatch.setattr(analyzer, 'create_driver', create_driver)
+    monkeypatch.setattr(analyzer, '_analyze_detail_page', analyze_detail_page)
+    monkeypatch.setattr(analyzer, '_analyze_page11_pagination', lambda driver, url: [{'text': '11', 'url': url}])
+    monkeypatch.setattr(analyzer, '_save_result', analyzer.saved.append)
+    return analyzer
+
+
+def test_detail_analysis_starts_while_list_analysis_runs(analyzer, monkeypatch):
+    def analyze_list_page(driver, url, wait_time, result, on_faq_items=None):
+        result['title'] = 'FAQ'
+        result['list_driver'] = driver
+        on_faq_items([{'link': 'https://www.knrec.or.kr/biz/faq/faq_view.do?no=1'}])
+        # 목록 분석의 나머지 단계가 끝나기 전에 상세 분석이 다른 브라우저에서 시작되어야 함
+        result['detail_overlapped'] = analyzer.detail_started.wait(timeout=5)
+
+    monkeypatch.setattr(analyzer, '_analyze_list_page', analyze_list_page)
+
+    result = asyncio.run(analyzer.analyze_faq_page('https://www.knrec.or.kr/biz/faq/faq_list01.do'))
+
+    assert result['detail_overlapped']
+    assert result['detail_page_analysis']['url'] == 'https://www.knrec.or.kr/biz/faq/faq_view.do?no=1'
+    assert result['detail_page_analysis']['driver'] is not result['list_driver']
+    assert result['page11_pagination'] == [{'text': '11', 'url': 'https://www.knrec.or.kr/biz/faq/faq_list01.do?page=11&'}]
+    assert result['fingerprint'] == 'fingerprint'
+    assert 'faq_items' in result and analyzer.saved == [result]
+    assert len(analyzer.browsers) == 3 and all(browser.quit_called for browser in analyzer.browsers)
+
+
+def test_list_failure_skips_detail_and_quits_browsers(analyzer, monkeypatch):
+    def analyze_list_page(driver, url, wait_time, result, on_faq_items=None):
+        raise RuntimeError('list page failed')
+
+    monkeypatch.setattr(analyzer, '_analyze_list_page', analyze_list_page)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(analyzer.analyze_faq_page('https://www.knrec.or.kr/biz/faq/faq_list01.do'))
+
+    assert not analyzer.detail_started.is_set()
+    assert analyzer.saved == []
+    assert len(analyzer.browsers) == 3 and all(browser.quit_called for browser in analyzer.browsers)
@@ -0,0 +1,354 @@
+"""KNREC FAQ 스파이더 테스트 (브라우저/네트워크 없이 목록 처리와 상태 기록 확인)"""
+import asyncio
+import json
+
+import pytest
+import scrapy
+from scrapy.http import HtmlResponse
+from scrapy.utils.test import get_crawler
+from twisted.internet import defer
+from twisted.python.failure import Failure
+
+from crawler.checkpoint import CrawlCheckpoint
+from crawler.crawl_state import CrawlStateStore
+from crawler.render_cache import RenderCache
+from crawler.spiders.knrec_faq import KnrecFaqSpider
+from crawler.work_queue import ShardWorkQueue
+
+BASE_URL = 'http://fixture.test'
+
+
+@pytest.fixture
+def make_spider(tmp_path):
+    def make(settings=None, analysis='0', **kwargs):
+        crawler = get_crawler(KnrecFaqSpider, {
+            'RENDER_CACHE_DIR': str(tmp_path / 'render_cache'),
+            'CHECKPOINT_ENABLED': False,
+            **(settings or {}),
+        })
+        spider = KnrecFaqSpider.from_crawler(crawler, base_url=BASE_URL, analysis=analysis, **kwargs)
+        spider.load_crawling_config()
+        return spider
+    return make
+
+
+def collect(agen):
+    async def run():
+        return [result async for result in agen]
+    return asyncio.run(run())
+
+
+def faq(no, title=None):
+    return (title or f'질문 {no}?', f'{BASE_URL}/biz/faq/faq_view01.do?no={no}')
+
+
+def detail_requests(results):
+    return [result for result in results if isinstance(result, scrapy.Request)]
+
+
+def test_crawl_state_recorded_only_for_saved_items(make_spider, tmp_path):
+    spider = make_spider(incremental='1')
+    spider.crawl_state = CrawlStateStore(tmp_path / 'crawl_state.sqlite3')
+
+    saved = spider.build_item(1, *faq(1), '본문 1')
+    unsaved = spider.build_item(1, *faq(2), '본문 2')
+    empty = spider.build_item(1, *faq(3), '')
+    spider.record_crawl_state(saved, None, spider)
+    spider.record_crawl_state(empty, None, spider)
+    spider.crawl_state.close()
+
+    # 다음 실행: 저장된 문서만 생략하고, 저장되지 않았거나 본문이 비었던 문서는 다시 요청
+    spider = make_spider(incremental='1')
+    spider.crawl_state = CrawlStateStore(tmp_path / 'crawl_state.sqlite3')
+    requests = detail_requests(collect(spider.extract_page_items(1, [faq(1), faq(2), faq(3)])))
+    spider.crawl_state.close()
+
+    assert [r.cb_kwargs['url'] for r in requests] == [unsaved['url'], empty['url']]
+    assert spider.unchanged_faqs == 1
+
+
+def test_crawl_state_signature_matches_cleaned_title(make_spider, tmp_path):
+    spider = make_spider(incremental='1')
+    spider.crawl_state = CrawlStateStore(tmp_path / 'crawl_state.sqlite3')
+    title, url = faq(1, '태양광   설비\n질문?')
+
+    item = spider.build_item(1, title, url, '본문')
+    item['title'] = '태양광 설비 질문?'  # 파이프라인의 공백 정리
+    spider.record_crawl_state(item, None, spider)
+
+    assert detail_requests(collect(spider.extract_page_items(1, [(title, url)]))) == []
+    spider.crawl_state.close()
+
+
+def detail_response(url, body):
+    return HtmlResponse(url=url, body=f'<html><body>{body}</body></html>', encoding='utf-8')
+
+
+def cache_page(spider, url, body):
+    """replay 모드 스파이더가 읽을 렌더링 결과 저장"""
+    cache = RenderCache(spider.render_cache.cache_dir, canonicalizer=spider.url_canonicalizer)
+    assert cache.put(url, f'<html><body>{body}</body></html>')
+
+
+def test_parse_detail_builds_item_from_static_content(make_spider):
+    spider = make_spider()
+    title, url = faq(1)
+    response = detail_response(url, '<div class="album_view_txt"><p class="p_txt">답변</p></div>')
+
+    items = collect(spider.parse_detail(response, 1, 1, title, url))
+
+    assert [item['content'] for item in items] == ['답변']
+
+
+@pytest.mark.parametrize('cached_body', [
+    None,  # 캐시 없음 (replay 모드는 예외)
+    '<div class="album_view_txt"><p class="p_txt"> </p></div>',  # 캐시에 본문 없음
+])
+def test_parse_detail_without_content_is_failure(make_spider, tmp_path, cached_body):
+    spider = make_spider(render_cache='replay')
+    spider.checkpoint = CrawlCheckpoint(tmp_path / 'checkpoint.json')
+    title, url = faq(1)
+    spider.checkpoint.start_page(1, [spider.document_key(url)])
+    if cached_body is not None:
+        cache_page(spider, url, cached_body)
+
+    items = collect(spider.parse_detail(detail_response(url, ''), 1, 1, title, url))
+
+    assert items == []
+    assert spider.extracted_faqs == 0
+    assert spider.crawler.stats.get_value('knrec_faq/detail_failed') == 1
+    assert spider.checkpoint.is_completed(1) and not spider.checkpoint.emitted
+
+
+def test_selenium_detail_mode_skips_empty_content(make_spider):
+    spider = make_spider(render_cache='replay', detail_mode='selenium')
+    with_content, empty = faq(1), faq(2)
+    cache_page(spider, with_content[1], '<div class="album_view_txt"><p class="p_txt">답변</p></div>')
+    cache_page(spider, empty[1], '<div class="album_view_txt"><p class="p_txt"></p></div>')
+
+    items = collect(spider.extract_page_items(1, [with_content, empty]))
+
+    assert [item['url'] for item in items] == [with_content[1]]
+    assert spider.crawler.stats.get_value('knrec_faq/detail_failed') == 1
+
+
+def list_response(page_number, entries, last_page=None):
+    items = ''.join(f'<li><a href="{url}" title="{title}">{title}</a></li>' for title, url in entries)
+    paging = ''
+    if last_page is not None:
+        paging = f'<div class="paging"><a href="?page={last_page}&" class="last">마지막</a></div>'
+    return HtmlResponse(
+        url=f'{BASE_URL}/biz/faq/faq_list01.do?page={page_number}&',
+        body=f'<html><body><ul class="result_list">{items}</ul>{paging}</body></html>',
+        encoding='utf-8'
+    )
+
+
+def list_requests(results):
+    return [r.cb_kwargs['page_number'] for r in detail_requests(results) if 'url' not in r.cb_kwargs]
+
+
+def open_checkpoint(spider, tmp_path, resume=False):
+    spider.output_dir = tmp_path
+    spider.resume = resume
+    spider.open_checkpoint()
+    return spider.checkpoint
+
+
+def request_failure(request):
+    failure = Failure(IOError('connection lost'))
+    failure.request = request
+    return failure
+
+
+def test_resume_retries_failed_detail(make_spider, tmp_path):
+    saved, failed = faq(1), faq(2)
+
+    spider = make_spider()
+    checkpoint = open_checkpoint(spider, tmp_path)
+    requests = detail_requests(collect(spider.parse(list_response(1, [saved, failed], last_page=1))))
+    assert len(requests) == 2
+
+    # 하나는 저장되고 하나는 상세 요청이 실패한 채로 종료
+    checkpoint.record_item(spider.document_key(saved[1]), 1)
+    spider.detail_failed(request_failure(requests[1]))
+    checkpoint.save(tmp_path / 'out.jsonl', 0, 1)
+    assert checkpoint.is_completed(1)
+
+    # 재개: 완료한 목록 페이지는 건너뛰고 실패한 상세 문서만 다시 요청
+    spider = make_spider()
+    checkpoint = open_checkpoint(spider, tmp_path, resume=True)
+    requests = detail_requests(collect(spider.parse(list_response(1, [saved, failed], last_page=1))))
+
+    assert [(r.url, r.cb_kwargs['title'], r.cb_kwargs['page_number']) for r in requests] == [(failed[1], failed[0], 1)]
+
+    response = detail_response(failed[1], '<div class="album_view_txt"><p class="p_txt">답변</p></div>')
+    items = collect(requests[0].callback(response, **requests[0].cb_kwargs))
+    checkpoint.record_item(spider.document_key(items[0]['url']), items[0]['page'])
+    assert checkpoint.failed == {}
+
+
+def test_shard_worker_starts_from_seeded_queue(make_spider, tmp_path):
+    queue = ShardWorkQueue(tmp_path / 'work_queue.sqlite3')
+    queue.seed(range(1, 6))
+    queue.claim('w1', 1)  # 첫 워커가 처리 중인 페이지
+
+    spider = make_spider(work_queue=str(queue.db_path), worker_id='w2')
+    requests = list(spider.start_requests())
+
+    # 첫 페이지를 다시 받지 않고 등록된 페이지를 바로 가져감
+    assert [r.cb_kwargs['page_number'] for r in requests] == [2, 3]
+    assert spider.total_pages == 5
+    spider.work_queue.close()
+    queue.close()
+
+
+def test_analysis_file_is_used_without_analysis_service(make_spider, tmp_path):
+    path = tmp_path / 'analysis.json'
+    path.write_text(json.dumps({'best_selectors': {'faq_selector': 'ul.faq li'}}), encoding='utf-8')
+
+    spider = make_spider(analysis='1', analysis_file=str(path))
+
+    assert spider.faq_selector == 'ul.faq li'
+
+
+def test_non_seed_worker_fetches_first_page_after_seed_timeout(make_spider, tmp_path):
+    spider = make_spider(
+        settings={'SHARD_SEED_TIMEOUT': 0},
+        work_queue=str(tmp_path / 'work_queue.sqlite3'), worker_id='w2', seed_worker='w1'
+    )
+    requests = collect(spider.start())
+
+    # 첫 워커가 등록하지 못한 경우에만 직접 첫 페이지를 받아 등록
+    assert [r.url for r in requests] == spider.start_urls
+    spider.work_queue.close()
+
+
+def test_parse_schedules_pages_from_pagination(make_spider):
+    spider = make_spider()
+    results = collect(spider.parse(list_response(1, [faq(1)], last_page=3)))
+
+    assert list_requests(results) == [2, 3]
+    assert spider.pagination_total == 3
+
+
+def test_seen_items_within_pagination_do_not_stop_crawl(make_spider):
+    spider = make_spider()
+    collect(spider.parse(list_response(1, [faq(1), faq(2)], last_page=3)))
+
+    # 크롤링 중 목록이 밀려 이미 본 FAQ만 보이는 페이지
+    collect(spider.parse_list_page(list_response(2, [faq(2)], last_page=3), 2))
+
+    assert spider.last_page is None
+    assert not spider.beyond_last_page(3)
+
+
+def test_empty_static_page_alone_does_not_stop_crawl(make_spider):
+    spider = make_spider(render_cache='replay')
+    collect(spider.parse(list_response(1, [faq(1)], last_page=3)))
+
+    # 정적 응답이 비어 있고 렌더링 결과로 확인하지 못한 페이지
+    collect(spider.parse_list_page(list_response(2, []), 2))
+
+    assert spider.last_page is None
+
+
+def test_empty_page_confirmed_by_render_cache_stops_crawl(make_spider):
+    spider = make_spider(render_cache='replay')
+    collect(spider.parse(list_response(1, [faq(1)], last_page=3)))
+    cache = RenderCache(spider.render_cache.cache_dir, canonicalizer=spider.url_canonicalizer)
+    cache.put(spider.list_page_url(2), '<html><body><ul class="result_list"></ul></body></html>', spider.list_render_state())
+
+    collect(spider.parse_list_page(list_response(2, []), 2))
+
+    assert spider.last_page == 2
+    assert spider.beyond_last_page(3)
+
+
+def test_empty_page_confirmed_by_selenium_stops_crawl(make_spider, monkeypatch):
+    spider = make_spider()
+    collect(spider.parse(list_response(1, [faq(1)], last_page=3)))
+    monkeypatch.setattr(spider, 'defer_to_driver_pool', lambda func, *args: defer.succeed([]))
+
+    collect(spider.parse_list_page(list_response(2, []), 2))
+
+    assert spider.last_page == 2
+
+
+def test_pages_without_pagination_are_probed_one_at_a_time(make_spider):
+    spider = make_spider()
+
+    assert list_requests(collect(spider.parse(list_response(1, [faq(1)])))) == [2]
+    assert list_requests(collect(spider.parse_list_page(list_response(2, [faq(2)]), 2))) == [3]
+
+    # 새 FAQ가 없는 페이지에서 중단하고 다음 페이지는 요청하지 않음
+    assert list_requests(collect(spider.parse_list_page(list_response(3, [faq(2)]), 3))) == []
+    assert spider.last_page == 3
+    assert spider.total_pages == 3
+
+
+class ScriptDriver:
+    """execute_script 호출을 기록하고 정해진 결과를 돌려주는 가짜 드라이버"""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return self.result
+
+
+def test_selenium_list_collected_with_one_script_call(make_spider):
+    spider = make_spider()
+    driver = ScriptDriver([
+        {'title_attr': ' 제목 속성 ', 'link_text': '링크', 'text': '', 'href': '/biz/faq/faq_view.do?no=1', 'no': '1'},
+        {'title_attr': None, 'link_text': '태양광 질문?\n답변 미리보기', 'text': '', 'href': 'biz/faq/faq_view.do?no=2', 'no': '2'},
+        {'title_attr': '', 'link_text': '', 'text': '요소 텍스트', 'href': f'{BASE_URL}/biz/faq/faq_view.do?no=3', 'no': '3'},
+        {'title_attr': None, 'link_text': '', 'text': '', 'href': '', 'no': None},  # 제목/링크 없음
+    ])
+
+    faq_urls = spider.collect_faq_urls_from_page(1, driver=driver)
+
+    assert faq_urls == [
+        ('제목 속성', f'{BASE_URL}/biz/faq/faq_view.do?no=1'),
+        ('태양광 질문?', f'{BASE_URL}/biz/faq/faq_view.do?no=2'),
+        ('요소 텍스트', f'{BASE_URL}/biz/faq/faq_view.do?no=3'),
+    ]
+    assert driver.calls == [(spider.faq_selector, list(spider.TITLE_SELECTORS))]
+
+
+def test_selenium_list_script_failure_returns_empty(make_spider):
+    class FailingDriver:
+        def execute_script(self, script, *args):
+            raise RuntimeError('javascript error')
+
+    assert make_spider().collect_faq_urls_from_page(1, driver=FailingDriver()) == []
+
+
+def test_selenium_detail_texts_joined_without_duplicates(make_spider, monkeypatch):
+    spider = make_spider()
+    monkeypatch.setattr(spider, 'selenium_get', lambda url, wait_for_element=None, driver=None: True)
+    driver = ScriptDriver([' 첫 문단 ', '', '둘째 문단', '첫 문단'])
+
+    content = spider.extract_detail_content(faq(1)[1], spider.content_selector, driver=driver)
+
+    assert content == '첫 문단\n\n둘째 문단'
+    assert driver.calls == [(spider.content_selector,)]
+
+
+def test_list_pages_scheduled_as_individual_requests(make_spider, tmp_path):
+    spider = make_spider()
+    checkpoint = open_checkpoint(spider, tmp_path)
+    checkpoint.start_page(3, [])  # 이전 실행에서 완료한 페이지
+
+    results = collect(spider.parse(list_response(1, [faq(1), faq(2)], last_page=4)))
+    requests = detail_requests(results)
+
+    list_pages = [r for r in requests if 'url' not in r.cb_kwargs]
+    assert [r.cb_kwargs['page_number'] for r in list_pages] == [2, 4]
+    assert all(r.callback == spider.parse_list_page for r in list_pages)
+    assert [r.url for r in list_pages] == [spider.list_page_url(2), spider.list_page_url(4)]
+    # 첫 페이지는 받은 응답으로 바로 처리하여 상세 요청 생성
+    assert [r.cb_kwargs['url'] for r in requests if 'url' in r.cb_kwargs] == [faq(1)[1], faq(2)[1]]
+    assert spider.processed_pages == 1
@@ -0,0 +1,98 @@
+"""지연 시간 히스토그램 테스트"""
+import threading
+
+import pytest
+
+from crawler.latency import LatencyHistogram, LatencyStats
+
+
+class Stats:
+    def __init__(self):
+        self.values = {}
+
+    def set_value(self, key, value):
+        self.values[key] = value
+
+
+def test_percentiles_within_bucket_ratio():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.add(ms)
+
+    summary = histogram.summary()
+    assert summary['count'] == 100
+    assert summary['mean_ms'] == 50.5
+    assert summary['max_ms'] == 100
+    for pct, exact in ((50, 50), (95, 95), (99, 99)):
+        assert exact <= summary[f'p{pct}_ms'] <= exact * LatencyHistogram.GROWTH
+
+
+def test_percentile_capped_at_max():
+    histogram = LatencyHistogram()
+    histogram.add(3.3)
+
+    assert histogram.percentile(99) == 3.3
+
+
+def test_empty_and_tiny_values():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    assert histogram.summary()['mean_ms'] == 0.0
+
+    histogram.add(0.0)
+    assert histogram.bucket_index(0.0) == 0
+    assert histogram.percentile(50) == 0.0
+
+
+def test_timer_records_even_when_block_raises():
+    latency = LatencyStats()
+    with latency.timer('selenium/navigate'):
+        pass
+    with pytest.raises(RuntimeError):
+        with latency.timer('selenium/navigate'):
+            raise RuntimeError('timeout')
+
+    assert latency.summaries()['selenium/navigate']['count'] == 2
+
+
+def test_record_from_threads():
+    latency = LatencyStats()
+
+    def work():
+        for _ in range(500):
+            latency.record('parse/detail', 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert latency.summaries()['parse/detail']['count'] == 2000
+
+
+def test_export_to_stats():
+    stats = Stats()
+    latency = LatencyStats(stats=stats)
+    latency.record('selenium/wait', 0.25)
+
+    summaries = latency.export()
+
+    assert summaries['selenium/wait']['max_ms'] == 250
+    assert stats.values['latency/selenium/wait/count'] == 1
+    assert stats.values['latency/selenium/wait/p95_ms'] == 250
+
+
+def test_for_crawler_shares_instance_and_reads_stats_lazily():
+    class Crawler:
+        pass
+
+    crawler = Crawler()
+    latency = LatencyStats.for_crawler(crawler)
+    assert LatencyStats.for_crawler(crawler) is latency
+
+    latency.record('selenium/click', 0.01)
+    crawler.stats = Stats()  # 스파이더 생성 이후에 만들어지는 stats
+    latency.export()
+
+    assert crawler.stats.values['latency/selenium/click/count'] == 1
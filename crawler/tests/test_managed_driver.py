@@ -0,0 +1,193 @@
+"""재시작 관리 웹드라이버 테스트 (가짜 드라이버 팩토리 사용)"""
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+
+from common import managed_driver
+from common.managed_driver import ManagedDriver, is_dead_session_error
+
+
+class FakeDriver:
+    def __init__(self, number, cdp_cookies=True):
+        self.number = number
+        self.cdp_cookies = cdp_cookies
+        self.visited = []
+        self.cookies = []
+        self.fail_next = None
+        self.quit_called = False
+
+    def get(self, url):
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        self.visited.append(url)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_cdp_cmd(self, command, params):
+        if not self.cdp_cookies:
+            raise WebDriverException('CDP not supported')
+        assert command == 'Network.setCookies'
+        self.cookies.extend(params['cookies'])
+
+    @property
+    def title(self):
+        return f'driver {self.number}'
+
+    def find_element(self, *args):
+        raise InvalidSessionIdException('invalid session id')
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Factory:
+    def __init__(self, **driver_kwargs):
+        self.drivers = []
+        self.driver_kwargs = driver_kwargs
+
+    def __call__(self):
+        driver = FakeDriver(len(self.drivers) + 1, **self.driver_kwargs)
+        self.drivers.append(driver)
+        return driver
+
+
+def test_passes_through_to_current_driver():
+    factory = Factory()
+    driver = ManagedDriver(factory)
+    driver.get('http://a/1')
+    assert driver.title == 'driver 1'
+    assert factory.drivers[0].visited == ['http://a/1']
+
+
+def test_recycles_after_max_pages():
+    factory = Factory()
+    driver = ManagedDriver(factory, max_pages=2)
+    for i in range(5):
+        driver.get(f'http://a/{i}')
+
+    assert [d.visited for d in factory.drivers] == [['http://a/0', 'http://a/1'], ['http://a/2', 'http://a/3'], ['http://a/4']]
+    assert factory.drivers[0].quit_called and factory.drivers[1].quit_called
+    assert driver.recycle_count == 2
+
+
+def test_recycles_on_browser_memory(monkeypatch):
+    monkeypatch.setattr(managed_driver, 'psutil', object())
+    rss = iter([100, 600])
+    monkeypatch.setattr(managed_driver, 'browser_rss_mb', lambda driver: next(rss))
+    factory = Factory()
+    driver = ManagedDriver(factory, max_rss_mb=500, check_every=2)
+
+    for i in range(5):
+        driver.get(f'http://a/{i}')
+
+    # 2페이지째 확인은 100MB (유지), 4페이지째 확인은 600MB (다음 get 전에 교체)
+    assert len(factory.drivers[0].visited) == 4
+    assert factory.drivers[1].visited == ['http://a/4']
+
+
+def test_memory_threshold_disabled_without_psutil(monkeypatch):
+    monkeypatch.setattr(managed_driver, 'psutil', None)
+    driver = ManagedDriver(Factory(), max_rss_mb=500)
+    assert driver.max_rss_mb == 0
+
+
+def test_recycles_after_consecutive_timeouts():
+    factory = Factory()
+    driver = ManagedDriver(factory, max_timeouts=2)
+
+    for _ in range(2):
+        factory.drivers[0].fail_next = TimeoutException('page load')
+        with pytest.raises(TimeoutException):
+            driver.get('http://a/slow')
+    driver.get('http://a/next')
+
+    assert len(factory.drivers) == 2
+    assert factory.drivers[1].visited == ['http://a/next']
+    assert driver.consecutive_timeouts == 0
+
+
+def test_successful_load_resets_timeouts():
+    factory = Factory()
+    driver = ManagedDriver(factory, max_timeouts=2)
+    factory.drivers[0].fail_next = TimeoutException('page load')
+    with pytest.raises(TimeoutException):
+        driver.get('http://a/slow')
+    driver.get('http://a/ok')
+    driver.record_timeout()
+    driver.get('http://a/ok2')
+
+    assert len(factory.drivers) == 1
+
+
+def test_crash_during_get_recycles_and_retries():
+    factory = Factory()
+    driver = ManagedDriver(factory)
+    factory.drivers[0].fail_next = WebDriverException('chrome not reachable')
+
+    driver.get('http://a/1')
+
+    assert len(factory.drivers) == 2
+    assert factory.drivers[1].visited == ['http://a/1']
+    assert driver.recycle_count == 1
+
+
+def test_crash_in_other_call_recycles_on_next_get():
+    factory = Factory()
+    driver = ManagedDriver(factory)
+    with pytest.raises(InvalidSessionIdException):
+        driver.find_element('css selector', 'a')
+    assert driver.crashed
+
+    driver.get('http://a/1')
+    assert factory.drivers[1].visited == ['http://a/1']
+    assert not driver.crashed
+
+
+def test_other_errors_do_not_recycle():
+    factory = Factory()
+    driver = ManagedDriver(factory)
+    factory.drivers[0].fail_next = WebDriverException('unknown error: net::ERR_NAME_NOT_RESOLVED')
+    with pytest.raises(WebDriverException):
+        driver.get('http://a/1')
+    assert len(factory.drivers) == 1
+
+
+def test_cookies_restored_after_recycle():
+    factory = Factory()
+    driver = ManagedDriver(factory, max_pages=1)
+    factory.drivers[0].cookies = [{'name': 'JSESSIONID', 'value': 'abc', 'domain': 'a', 'path': '/', 'expiry': 10}]
+    driver.get('http://a/1')
+    driver.get('http://a/2')
+
+    assert factory.drivers[1].cookies == [
+        {'name': 'JSESSIONID', 'value': 'abc', 'domain': 'a', 'path': '/', 'expires': 10}
+    ]
+    # 이전 페이지는 다시 열지 않고 요청한 페이지로 바로 이동
+    assert factory.drivers[1].visited == ['http://a/2']
+
+
+def test_cookies_saved_before_crash_are_restored_without_cdp():
+    factory = Factory(cdp_cookies=False)
+    driver = ManagedDriver(factory)
+    cookie = {'name': 'sid', 'value': '1', 'domain': '.example.com', 'path': '/', 'secure': True}
+    factory.drivers[0].cookies = [cookie]
+    driver.get('https://example.com/1')  # 첫 페이지에서 쿠키 저장
+
+    factory.drivers[0].fail_next = InvalidSessionIdException('invalid session id')
+    driver.get('https://example.com/2')
+
+    new_driver = factory.drivers[1]
+    assert new_driver.cookies == [cookie]
+    assert new_driver.visited == ['https://example.com/', 'https://example.com/2']
+
+
+def test_is_dead_session_error():
+    assert is_dead_session_error(InvalidSessionIdException())
+    assert is_dead_session_error(WebDriverException('disconnected: not connected to DevTools'))
+    assert is_dead_session_error(ConnectionRefusedError())
+    assert not is_dead_session_error(TimeoutException())
+    assert not is_dead_session_error(ValueError('x'))
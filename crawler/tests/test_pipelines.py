@@ -0,0 +1,171 @@
+"""결과 저장 파이프라인 테스트"""
+import gzip
+import json
+import logging
+
+import pytest
+from scrapy.exceptions import DropItem, NotConfigured
+from scrapy.utils.test import get_crawler
+
+from common.utils import iter_output_items
+from crawler.checkpoint import CrawlCheckpoint
+from crawler import pipelines
+from crawler.pipelines import ParquetExportPipeline, RenewableEnergyPipeline
+
+
+class Spider:
+    name = 'test'
+    logger = logging.getLogger('test_pipelines')
+
+
+def item(no, content='답변'):
+    return {
+        'page': 1,
+        'title': f' 질문   {no} ',
+        'content': content,
+        'url': f'https://www.knrec.or.kr/biz/faq/faq_view.do?no={no}',
+    }
+
+
+def write_items(pipeline, items, spider=Spider):
+    pipeline.open_spider(spider)
+    for entry in items:
+        pipeline.process_item(entry, spider)
+    pipeline.close_spider(spider)
+    return pipeline.filepath
+
+
+@pytest.mark.parametrize('output_format, compression, suffix', [
+    ('jsonl', None, '.jsonl'),
+    ('jsonl', 'gzip', '.jsonl.gz'),
+    ('json', None, '.json'),
+    ('json', 'gzip', '.json.gz'),
+])
+def test_output_round_trip(tmp_path, output_format, compression, suffix):
+    pipeline = RenewableEnergyPipeline(output_format=output_format, compression=compression, data_dir=str(tmp_path))
+    path = write_items(pipeline, [item(1), item(2)])
+
+    assert path.endswith(suffix)
+    if suffix == '.json.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            records = json.load(f)
+    else:
+        records = list(iter_output_items(path))
+    assert [r['title'] for r in records] == ['질문 1', '질문 2']
+    assert all(r['crawled_at'] for r in records)
+
+
+def test_duplicate_document_dropped(tmp_path):
+    pipeline = RenewableEnergyPipeline(data_dir=str(tmp_path))
+    pipeline.open_spider(Spider)
+    pipeline.process_item(item(1), Spider)
+    with pytest.raises(DropItem):
+        pipeline.process_item(item(1, content='다른 본문'), Spider)
+    pipeline.close_spider(Spider)
+
+    assert len(list(iter_output_items(pipeline.filepath))) == 1
+
+
+def test_zstd_falls_back_to_gzip_without_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipelines, 'zstandard', None)
+
+    pipeline = RenewableEnergyPipeline(compression='zstd', data_dir=str(tmp_path))
+    path = write_items(pipeline, [item(1)])
+
+    assert path.endswith('.jsonl.gz')
+    assert len(list(iter_output_items(path))) == 1
+
+
+def test_zstd_output_round_trip(tmp_path):
+    pytest.importorskip('zstandard')
+
+    pipeline = RenewableEnergyPipeline(compression='zstd', data_dir=str(tmp_path))
+    path = write_items(pipeline, [item(1), item(2)])
+
+    assert path.endswith('.jsonl.zst')
+    assert [r['url'] for r in iter_output_items(path)] == [item(1)['url'], item(2)['url']]
+
+
+
+class ResumableSpider(Spider):
+    def __init__(self, checkpoint, resume=False):
+        self.checkpoint = checkpoint
+        self.resume = resume
+
+
+def crash(pipeline):
+    """close_spider 없이 중단 (체크포인트 이후 기록한 내용은 파일에 남고 압축 스트림은 끝맺지 않음)"""
+    pipeline.flush(sync=True)
+    pipeline.raw_file.close()
+
+
+@pytest.mark.parametrize('output_format, compression', [
+    ('jsonl', None),
+    ('jsonl', 'gzip'),
+    ('json', None),
+])
+def test_resume_truncates_output_to_checkpoint(tmp_path, output_format, compression):
+    checkpoint_path = tmp_path / 'checkpoint.json'
+    pipeline = RenewableEnergyPipeline(
+        output_format=output_format, compression=compression, data_dir=str(tmp_path), checkpoint_every=2
+    )
+    pipeline.open_spider(ResumableSpider(CrawlCheckpoint(checkpoint_path)))
+    for no in (1, 2, 3):
+        pipeline.process_item(item(no), Spider)
+    crash(pipeline)
+
+    # 체크포인트(2개 기록) 이후의 3번째 아이템은 잘라내고, 재개한 실행이 다시 기록
+    checkpoint = CrawlCheckpoint.load(checkpoint_path)
+    assert checkpoint.items_written == 2
+    pipeline = RenewableEnergyPipeline(output_format=output_format, compression=compression, data_dir=str(tmp_path))
+    spider = ResumableSpider(checkpoint, resume=True)
+    path = write_items(pipeline, [item(3), item(4)], spider)
+
+    assert path == checkpoint.output_path
+    assert len(list(tmp_path.glob('test_*'))) == 1
+    assert [r['title'] for r in iter_output_items(path)] == ['질문 1', '질문 2', '질문 3', '질문 4']
+    assert pipeline.items_written == 4
+
+
+def test_resume_with_other_format_starts_new_file(tmp_path):
+    checkpoint_path = tmp_path / 'checkpoint.json'
+    pipeline = RenewableEnergyPipeline(data_dir=str(tmp_path))
+    write_items(pipeline, [item(1)], ResumableSpider(CrawlCheckpoint(checkpoint_path)))
+
+    pipeline = RenewableEnergyPipeline(compression='gzip', data_dir=str(tmp_path))
+    path = write_items(pipeline, [item(2)], ResumableSpider(CrawlCheckpoint.load(checkpoint_path), resume=True))
+
+    assert path.endswith('.jsonl.gz')
+    assert [r['title'] for r in iter_output_items(path)] == ['질문 2']
+
+
+def test_parquet_export_round_trip(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    pipeline = ParquetExportPipeline(row_group_size=2, data_dir=str(tmp_path))
+    pipeline.open_spider(Spider)
+    for no in range(1, 6):
+        entry = dict(item(no), page=str(no), source='knrec', spider='knrec_faq', file_urls=None)
+        if no == 1:
+            entry['file_urls'] = ['https://www.knrec.or.kr/files/a.pdf']
+            entry['files'] = [{'url': 'https://www.knrec.or.kr/files/a.pdf', 'path': 'ab/abc.pdf'}]
+        pipeline.process_item(entry, Spider)
+    pipeline.close_spider(Spider)
+
+    parquet = pq.ParquetFile(pipeline.filepath)
+    assert parquet.metadata.num_rows == 5
+    assert parquet.metadata.num_row_groups == 3  # 2 + 2 + 종료 시 남은 1
+
+    records = list(iter_output_items(pipeline.filepath))
+    assert [r['page'] for r in records] == [1, 2, 3, 4, 5]
+    assert records[0]['file_urls'] == ['https://www.knrec.or.kr/files/a.pdf']
+    assert json.loads(records[0]['files'])[0]['path'] == 'ab/abc.pdf'
+    assert records[1]['files'] is None and records[1]['date_published'] is None
+
+    # 필요한 컬럼만 읽기
+    assert list(iter_output_items(pipeline.filepath, columns=['url']))[0] == {'url': item(1)['url']}
+
+
+def test_parquet_export_disabled_by_default():
+    with pytest.raises(NotConfigured):
+        ParquetExportPipeline.from_crawler(get_crawler())
@@ -0,0 +1,83 @@
+"""렌더링 캐시 테스트"""
+import os
+import time
+
+import pytest
+
+from common.url_canonicalizer import URLCanonicalizer
+from crawler.render_cache import RenderCache
+
+URL = 'https://www.knrec.or.kr/biz/faq/faq_view.do?no=7&cate=1'
+HTML = '<html><body><p>답변</p></body></html>'
+
+
+def test_use_mode_miss_then_hit(tmp_path):
+    cache = RenderCache(tmp_path, mode='use')
+
+    assert cache.get(URL) is None
+    assert cache.put(URL, HTML)
+    assert cache.get(URL) == HTML
+
+
+def test_state_is_part_of_key(tmp_path):
+    cache = RenderCache(tmp_path, mode='use')
+    cache.put(URL, HTML, state='tab=2')
+
+    assert cache.get(URL) is None
+    assert cache.get(URL, state='tab=2') == HTML
+
+
+def test_same_document_key_shares_entry(tmp_path):
+    cache = RenderCache(tmp_path, mode='use', canonicalizer=URLCanonicalizer.for_site('knrec'))
+    cache.put(URL, HTML)
+
+    assert cache.get('https://www.knrec.or.kr/biz/faq/faq_view.do?cate=3&no=7') == HTML
+
+
+def test_replay_reads_but_does_not_write(tmp_path):
+    RenderCache(tmp_path, mode='use').put(URL, HTML)
+    cache = RenderCache(tmp_path, mode='replay')
+
+    assert cache.get(URL) == HTML
+    assert not cache.put('https://www.knrec.or.kr/other', HTML)
+    assert cache.get('https://www.knrec.or.kr/other') is None
+
+
+def test_refresh_writes_but_does_not_read(tmp_path):
+    cache = RenderCache(tmp_path, mode='refresh')
+
+    assert cache.put(URL, HTML)
+    assert cache.get(URL) is None
+    assert RenderCache(tmp_path, mode='use').get(URL) == HTML
+
+
+def test_expired_entry_is_miss_except_in_replay(tmp_path):
+    RenderCache(tmp_path, mode='use').put(URL, HTML)
+    cache = RenderCache(tmp_path, mode='use', expiration_secs=60)
+    path = cache.path_for(cache.key_for(URL))
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.get(URL) is None
+    assert RenderCache(tmp_path, mode='replay', expiration_secs=60).get(URL) == HTML
+
+
+def test_corrupt_entry_is_miss(tmp_path):
+    cache = RenderCache(tmp_path, mode='use')
+    cache.put(URL, HTML)
+    cache.path_for(cache.key_for(URL)).write_bytes(b'not gzip')
+
+    assert cache.get(URL) is None
+
+
+def test_off_mode_does_nothing(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', mode='off')
+
+    assert not cache.put(URL, HTML)
+    assert cache.get(URL) is None
+    assert not (tmp_path / 'cache').exists()
+
+
+def test_unknown_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        RenderCache(tmp_path, mode='record')
@@ -0,0 +1,161 @@
+"""SeleniumMiddleware 테스트 (가짜 드라이버 사용, 브라우저를 띄우지 않음)"""
+import asyncio
+import logging
+import threading
+
+import pytest
+import scrapy
+from scrapy.exceptions import IgnoreRequest
+from scrapy.utils.test import get_crawler
+
+from crawler.middlewares import SeleniumMiddleware
+from crawler.render_cache import RenderCache
+
+URL = 'https://www.knrec.or.kr/biz/faq/faq_list01.do'
+
+
+class Spider:
+    name = 'test'
+    logger = logging.getLogger('test_selenium_middleware')
+
+
+class Driver:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.visited = []
+        self.threads = []
+
+    def get(self, url):
+        self.threads.append(threading.current_thread())
+        if self.fail:
+            raise RuntimeError('navigation failed')
+        self.visited.append(url)
+
+    def find_element(self, by, selector):
+        return object()
+
+    @property
+    def page_source(self):
+        return f'<html><body><p>{self.visited[-1]}</p></body></html>'
+
+
+@pytest.fixture
+def middleware(tmp_path):
+    def make(pool_size=1, cache_mode='off', **driver_kwargs):
+        middleware = SeleniumMiddleware(
+            pool_size=pool_size,
+            render_cache=RenderCache(tmp_path / 'render_cache', mode=cache_mode),
+            stats=get_crawler().stats
+        )
+        middleware.created = []
+
+        def create_driver():
+            driver = Driver(**driver_kwargs)
+            middleware.created.append(driver)
+            return driver
+        middleware.create_driver = create_driver
+        return middleware
+    return make
+
+
+def selenium_request(**meta):
+    return scrapy.Request(URL, meta={'selenium': True, 'wait_for': 'ul.result_list', **meta})
+
+
+def test_non_selenium_request_passes_through(middleware):
+    assert asyncio.run(middleware().process_request(scrapy.Request(URL), Spider)) is None
+
+
+def test_render_returns_response_and_releases_driver(middleware):
+    middleware = middleware(cache_mode='use')
+
+    response = middleware.render(selenium_request(render_state='tab=2'), Spider)
+
+    assert response.status == 200 and URL in response.text
+    assert middleware.idle_drivers.get_nowait() is middleware.created[0]
+    # 캐시에 저장된 결과는 같은 탭 상태의 다음 요청이 브라우저 없이 사용
+    cached = asyncio.run(middleware.process_request(selenium_request(render_state='tab=2'), Spider))
+    assert 'render_cache' in cached.flags and cached.text == response.text
+    assert middleware.stats.get_value('render_cache/stored') == 1
+    assert middleware.stats.get_value('render_cache/hit') == 1
+
+
+def test_driver_released_when_render_fails(middleware):
+    middleware = middleware(fail=True)
+
+    with pytest.raises(RuntimeError):
+        middleware.render(selenium_request(), Spider)
+
+    assert middleware.idle_drivers.qsize() == 1
+
+
+def test_replay_miss_is_ignored_without_browser(middleware):
+    middleware = middleware(cache_mode='replay')
+
+    with pytest.raises(IgnoreRequest):
+        asyncio.run(middleware.process_request(selenium_request(), Spider))
+    assert middleware.created == []
+
+
+def test_pool_limits_drivers_and_reuses_idle_ones(middleware):
+    middleware = middleware(pool_size=2)
+    first = middleware.acquire_driver(Spider)
+    second = middleware.acquire_driver(Spider)
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(middleware.acquire_driver(Spider)))
+    waiter.start()
+    waiter.join(timeout=0.2)
+    assert waiter.is_alive()  # 풀이 가득 차면 반환될 때까지 대기
+
+    middleware.release_driver(second)
+    waiter.join(timeout=5)
+    assert acquired == [second]
+    assert len(middleware.created) == 2 and middleware.drivers == [first, second]
+
+
+def test_failed_driver_creation_frees_slot(middleware):
+    middleware = middleware()
+    create_driver = middleware.create_driver
+
+    def failing():
+        raise RuntimeError('chrome not found')
+    middleware.create_driver = failing
+    with pytest.raises(RuntimeError):
+        middleware.acquire_driver(Spider)
+
+    middleware.create_driver = create_driver
+    assert middleware.acquire_driver(Spider) is middleware.created[0]
+
+
+def test_renders_run_concurrently_on_worker_threads(middleware):
+    middleware = middleware(pool_size=2)
+    barrier = threading.Barrier(2, timeout=5)
+    middleware.politeness.wait = lambda url: barrier.wait()  # 두 렌더링이 동시에 진행 중이어야 통과
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(middleware.render(selenium_request(), Spider)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert len(results) == 2
+    assert len(middleware.created) == 2
+    assert threading.main_thread() not in [t for driver in middleware.created for t in driver.threads]
+
+
+def test_spider_close_stops_pool_and_quits_drivers(middleware):
+    middleware = middleware()
+    middleware.spider_opened(Spider)
+    driver = middleware.acquire_driver(Spider)
+    driver.quit_called = False
+    driver.quit = lambda: setattr(driver, 'quit_called', True)
+
+    middleware.spider_closed(Spider)
+
+    assert middleware.threadpool is None
+    assert driver.quit_called and middleware.drivers == []
@@ -0,0 +1,83 @@
+"""샤드 실행기 테스트 (결과 병합, 분석/첫 페이지 공유)"""
+import gzip
+import json
+
+from scrapy.settings import Settings
+
+from common.utils import iter_output_items
+from crawler.shard_launcher import (
+    max_browsers, merge_outputs, prepare_analysis, spider_site, worker_command,
+)
+
+VIEW = 'https://www.knrec.or.kr/biz/faq/faq_view.do'
+
+
+def write_jsonl(path, items, opener=open):
+    with opener(path, 'wt', encoding='utf-8') as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+
+
+def test_merge_deduplicates_by_document_key(tmp_path):
+    write_jsonl(tmp_path / 'knrec_faq_1_w1.jsonl', [
+        {'url': f'{VIEW}?no=1&page=1', 'title': 'a'},
+        {'url': f'{VIEW}?no=2', 'title': 'b'},
+    ])
+    write_jsonl(tmp_path / 'knrec_faq_1_w2.jsonl.gz', [
+        {'url': f'{VIEW}?page=3&no=1', 'title': 'a (재수집)'},
+        {'url': f'{VIEW}?no=3', 'title': 'c'},
+        {'title': 'URL 없음'},
+    ], opener=gzip.open)
+    write_jsonl(tmp_path / 'other_spider_w1.jsonl', [{'url': f'{VIEW}?no=9'}])
+
+    output = tmp_path / 'merged.jsonl'
+    assert merge_outputs(tmp_path, 'knrec_faq', output) == (4, 1)
+    assert [item['title'] for item in iter_output_items(output)] == ['a', 'b', 'c', 'URL 없음']
+
+
+def test_merge_site_controls_document_key(tmp_path):
+    write_jsonl(tmp_path / 'knrec_faq_1_w1.jsonl', [
+        {'url': f'{VIEW}?no=1&page=1'},
+        {'url': f'{VIEW}?no=1&page=2'},
+    ])
+    # 규칙이 없는 사이트는 URL 전체로 비교
+    assert merge_outputs(tmp_path, 'knrec_faq', tmp_path / 'a.jsonl', site='unknown') == (2, 0)
+    assert merge_outputs(tmp_path, 'knrec_faq', tmp_path / 'b.jsonl') == (1, 1)
+
+
+def test_spider_site():
+    assert spider_site('knrec_faq') == 'knrec'
+
+
+def test_max_browsers_counts_both_pools_per_worker():
+    project = Settings({'SELENIUM_DRIVER_POOL_SIZE': 4, 'SELENIUM_MIDDLEWARE_POOL_SIZE': 1})
+    assert max_browsers(3, {}, project) == 15
+    assert max_browsers(3, {'SELENIUM_DRIVER_POOL_SIZE': '1'}, project) == 6
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = 0
+
+    def get_or_create_analysis(self, spider):
+        self.calls += 1
+        return {'spider_name': spider, 'total_pages': 7}
+
+
+def test_prepare_analysis_runs_once_for_all_workers(tmp_path, monkeypatch):
+    service = FakeService()
+    monkeypatch.setattr('common.analysis_service.get_analysis_service', lambda: service)
+
+    path = prepare_analysis('knrec_faq', ['mode=full'], tmp_path)
+    command = worker_command('knrec_faq', 'w1', tmp_path / 'q.sqlite3', tmp_path, analysis_file=path)
+
+    assert service.calls == 1
+    assert json.loads(path.read_text(encoding='utf-8'))['total_pages'] == 7
+    assert f'analysis_file={path}' in command
+
+
+def test_prepare_analysis_skipped_when_disabled(tmp_path, monkeypatch):
+    service = FakeService()
+    monkeypatch.setattr('common.analysis_service.get_analysis_service', lambda: service)
+    assert prepare_analysis('knrec_faq', ['analysis=0'], tmp_path) is None
+    assert service.calls == 0
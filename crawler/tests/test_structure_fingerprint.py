@@ -0,0 +1,50 @@
+"""페이지 구조 지문 테스트"""
+from common.structure_fingerprint import structural_fingerprint
+
+
+def faq_list(items, current_page=1, extra=''):
+    rows = ''.join(
+        f'<li><a href="/biz/faq/faq_view.do?no={no}" title="질문 {no}">질문 {no}</a></li>'
+        for no in items
+    )
+    pages = ''.join(
+        f'<a class="{"on" if page == current_page else ""}" href="?page={page}">{page}</a>'
+        for page in range(1, 4)
+    )
+    return (
+        '<html><head><script>var t = 1;</script></head><body>'
+        f'<div id="contents"><ul class="result_list">{rows}</ul>'
+        f'<div class="pagination">{pages}</div>{extra}</div></body></html>'
+    )
+
+
+def test_same_template_same_fingerprint():
+    first = structural_fingerprint(faq_list(range(1, 11), current_page=1))
+    # 목록 항목 수, 글 내용, 현재 페이지 표시(class="on")가 달라도 같은 지문
+    second = structural_fingerprint(faq_list(range(11, 14), current_page=2))
+    assert first == second
+    assert len(first) == 32
+
+
+def test_ignored_tags_and_comments():
+    base = structural_fingerprint(faq_list([1, 2]))
+    noisy = structural_fingerprint(faq_list([1, 2], extra='<!-- 광고 --><script>x()</script><br><noscript>n</noscript>'))
+    assert base == noisy
+
+
+def test_class_order_and_state_classes():
+    a = structural_fingerprint('<body><div class="box wide active"><p>1</p></div></body>')
+    b = structural_fingerprint('<body><div class="wide box"><p>2</p></div></body>')
+    assert a == b
+
+
+def test_template_change_changes_fingerprint():
+    base = structural_fingerprint(faq_list([1, 2]))
+    assert structural_fingerprint(faq_list([1, 2]).replace('result_list', 'faq_list')) != base
+    assert structural_fingerprint(faq_list([1, 2], extra='<div class="notice"></div>')) != base
+    assert structural_fingerprint(faq_list([1, 2]).replace('id="contents"', 'id="container"')) != base
+
+
+def test_empty_html():
+    assert structural_fingerprint('') is None
+    assert structural_fingerprint(None) is None
@@ -0,0 +1,35 @@
+"""URL 정규화 / 문서 키 테스트"""
+from common.url_canonicalizer import URLCanonicalizer
+
+BASE = 'https://www.knrec.or.kr/biz/faq/faq_view.do'
+
+
+def test_knrec_document_key_ignores_other_parameters():
+    canonicalizer = URLCanonicalizer.for_site('knrec')
+    urls = [
+        f'{BASE}?no=123',
+        f'{BASE}?no=123&page=4&category=solar',
+        f'{BASE}?category=wind&no=123#top',
+        'http://127.0.0.1:8000/biz/faq/faq_view.do?no=123',  # 같은 구조의 fixture 서버
+    ]
+    assert {canonicalizer.document_key(url) for url in urls} == {'knrec_faq:123'}
+    assert canonicalizer.document_id(urls[1]) == '123'
+
+
+def test_knrec_rule_without_document_number_falls_back_to_url():
+    canonicalizer = URLCanonicalizer.for_site('knrec')
+    assert canonicalizer.document_id(f'{BASE}?no=') is None
+    assert canonicalizer.document_key(f'{BASE}?page=2') == f'{BASE}?page=2'
+
+
+def test_canonical_url_normalizes_parameter_order():
+    canonicalizer = URLCanonicalizer()
+    a = canonicalizer.document_key('https://example.com/view?b=2&a=1&empty=#frag')
+    b = canonicalizer.document_key('https://example.com/view?a=1&b=2')
+    assert a == b == 'https://example.com/view?a=1&b=2'
+
+
+def test_unknown_site_has_no_rules():
+    canonicalizer = URLCanonicalizer.for_site('unknown')
+    assert canonicalizer.document_id(f'{BASE}?no=1') is None
+    assert canonicalizer.document_key(f'{BASE}?no=1') == f'{BASE}?no=1'
@@ -0,0 +1,94 @@
+"""공통 유틸리티 테스트"""
+import gzip
+import json
+
+import pytest
+
+from common.utils import find_max_page, iter_output_items
+
+
+def test_find_max_page_from_numbers_and_page_links():
+    links = [
+        ('1', '?page=1&'),
+        (' 2 ', '?page=2&'),
+        ('다음', '/biz/faq/faq_list01.do?page=11&'),
+        ('마지막', '/biz/faq/faq_list01.do?cate=1&page=35'),
+    ]
+    assert find_max_page(links) == 35
+
+
+def test_find_max_page_ignores_non_page_links():
+    links = [('이전', 'javascript:void(0)'), ('10', None), (None, '?pageSize=50')]
+    assert find_max_page(links) == 10
+
+
+def test_find_max_page_without_pagination():
+    assert find_max_page([]) is None
+    assert find_max_page([('처음', '#')]) is None
+
+
+def write_lines(path, records, opener):
+    with opener(path, 'wb') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+
+
+def truncate(path, size):
+    with open(path, 'r+b') as f:
+        f.truncate(size)
+
+
+def test_iter_output_items_skips_truncated_last_line(tmp_path):
+    path = tmp_path / 'out.jsonl'
+    path.write_text('{"no": 1}\n{"no": 2}\n{"no": 3, "con', encoding='utf-8')
+
+    assert list(iter_output_items(path)) == [{'no': 1}, {'no': 2}]
+
+
+def test_iter_output_items_reads_truncated_gzip(tmp_path):
+    path = tmp_path / 'out.jsonl.gz'
+    records = [{'no': i, 'content': f'답변 {i} ' * 50} for i in range(200)]
+    write_lines(path, records, gzip.open)
+    truncate(path, path.stat().st_size // 2)
+
+    items = list(iter_output_items(path))
+
+    # 잘린 지점 이전의 온전한 줄만 순서대로 반환
+    assert 0 < len(items) < len(records)
+    assert items == records[:len(items)]
+
+
+def test_iter_output_items_reads_truncated_zstd(tmp_path):
+    zstandard = pytest.importorskip('zstandard')
+    path = tmp_path / 'out.jsonl.zst'
+    records = [{'no': i, 'content': f'답변 {i} ' * 50} for i in range(200)]
+    with open(path, 'wb') as raw:
+        writer = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        for i, record in enumerate(records):
+            writer.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+            if i % 20 == 19:
+                writer.flush(zstandard.FLUSH_BLOCK)
+        writer.flush(zstandard.FLUSH_FRAME)
+    truncate(path, path.stat().st_size // 2)
+
+    items = list(iter_output_items(path))
+
+    assert 0 < len(items) < len(records)
+    assert items == records[:len(items)]
+
+
+def test_iter_output_items_reads_concatenated_gzip_members(tmp_path):
+    # 체크포인트마다 gzip 멤버를 끝맺고 이어 붙인 파일
+    path = tmp_path / 'out.jsonl.gz'
+    write_lines(path, [{'no': 1}], gzip.open)
+    with open(path, 'ab') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+        f.write(b'{"no": 2}\n')
+
+    assert list(iter_output_items(path)) == [{'no': 1}, {'no': 2}]
+
+
+def test_iter_output_items_reads_json_array(tmp_path):
+    path = tmp_path / 'out.json'
+    path.write_text('[\n{"no": 1},\n{"no": 2}\n]', encoding='utf-8')
+
+    assert [r['no'] for r in iter_output_items(path)] == [1, 2]
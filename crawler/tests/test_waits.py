@@ -0,0 +1,153 @@
+"""Selenium 대기 유틸리티 테스트 (가짜 드라이버와 시계 사용)"""
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from common import waits
+from common.waits import ListRerendered, NetworkIdle, PolitenessDelay
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(waits.time, 'monotonic', clock.monotonic)
+    return clock
+
+
+def test_reserve_spaces_requests_per_host(clock):
+    politeness = PolitenessDelay({'knrec.or.kr': 1.0})
+
+    assert politeness.reserve('https://www.knrec.or.kr/a') == 0.0
+    assert politeness.reserve('https://www.knrec.or.kr/b') == 1.0
+    assert politeness.reserve('https://www.knrec.or.kr/c') == 2.0
+
+    # 시간이 지나면 남은 예약만큼만 대기
+    clock.now += 2.5
+    assert politeness.reserve('https://www.knrec.or.kr/d') == 0.5
+
+
+def test_reserve_after_idle_period_does_not_wait(clock):
+    politeness = PolitenessDelay({'knrec.or.kr': 1.0})
+    politeness.reserve('https://www.knrec.or.kr/a')
+
+    clock.now += 10
+    assert politeness.reserve('https://www.knrec.or.kr/b') == 0.0
+    assert politeness.reserve('https://www.knrec.or.kr/c') == 1.0
+
+
+def test_hosts_are_independent_and_default_applies(clock):
+    politeness = PolitenessDelay({'knrec.or.kr': 1.0}, default_delay=0.2)
+
+    politeness.reserve('https://www.knrec.or.kr/a')
+    assert politeness.reserve('https://other.example/a') == 0.0
+    assert politeness.reserve('https://other.example/b') == pytest.approx(0.2)
+    assert politeness.delay_for('knrec.or.kr') == 1.0
+    assert politeness.delay_for('notknrec.or.kr') == 0.2
+
+
+def test_no_delay_does_not_record(clock):
+    politeness = PolitenessDelay()
+
+    assert politeness.reserve('https://www.knrec.or.kr/a') == 0.0
+    assert politeness.reserve('https://www.knrec.or.kr/b') == 0.0
+    assert politeness.next_allowed == {}
+
+
+def test_reserve_from_threads_gives_distinct_slots(clock):
+    politeness = PolitenessDelay({'knrec.or.kr': 0.5})
+    waits_seen = []
+    lock = threading.Lock()
+
+    def work():
+        for _ in range(25):
+            remaining = politeness.reserve('https://www.knrec.or.kr/')
+            with lock:
+                waits_seen.append(remaining)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits_seen) == [i * 0.5 for i in range(100)]
+
+
+def test_wait_sleeps_for_reserved_time(clock, monkeypatch):
+    slept = []
+    monkeypatch.setattr(waits.time, 'sleep', slept.append)
+    politeness = PolitenessDelay({'knrec.or.kr': 1.0})
+
+    politeness.wait('https://www.knrec.or.kr/a')
+    politeness.wait('https://www.knrec.or.kr/b')
+
+    assert slept == [1.0]
+
+
+class Driver:
+    def __init__(self, states, elements=()):
+        self.states = list(states)
+        self.elements = list(elements)
+
+    def execute_script(self, script):
+        state = self.states.pop(0)
+        if isinstance(state, Exception):
+            raise state
+        return state
+
+    def find_elements(self, by, selector):
+        return self.elements
+
+
+def test_network_idle_needs_stable_resources(clock):
+    driver = Driver([
+        ['loading', 3, 0],
+        ['complete', 5, 0],
+        ['complete', 5, 0],
+        ['complete', 5, 1],  # 진행 중인 jQuery 요청
+        ['complete', 5, 0],
+        ['complete', 5, 0],
+    ])
+    idle = NetworkIdle(idle_time=0.5)
+
+    assert not idle(driver)
+    assert not idle(driver)  # 리소스 수 변화
+    clock.now += 0.3
+    assert not idle(driver)
+    assert not idle(driver)
+    assert not idle(driver)
+    clock.now += 0.5
+    assert idle(driver)
+
+
+def test_network_idle_script_error_resets(clock):
+    idle = NetworkIdle(idle_time=0)
+    driver = Driver([['complete', 2, 0], WebDriverException('navigating'), ['complete', 2, 0], ['complete', 2, 0]])
+
+    assert not idle(driver)
+    assert not idle(driver)
+    assert not idle(driver)
+    assert idle(driver)
+
+
+def test_list_rerendered_without_previous_element():
+    assert ListRerendered('ul li')(Driver([], elements=['li']))
+    assert not ListRerendered('ul li')(Driver([], elements=[]))
+
+
+def test_list_rerendered_waits_for_network_when_element_not_replaced(clock, monkeypatch):
+    monkeypatch.setattr(waits.EC, 'staleness_of', lambda element: lambda driver: False)
+    condition = ListRerendered('ul li', previous_element=object(), idle_time=0)
+    driver = Driver([['complete', 4, 0], ['complete', 4, 0]], elements=['li'])
+
+    assert not condition(driver)
+    assert condition(driver)
@@ -0,0 +1,78 @@
+"""Chrome 드라이버 생성 옵션 테스트 (브라우저를 띄우지 않음)"""
+import pytest
+
+from common import webdriver_factory
+from common.webdriver_factory import apply_resource_blocking, build_chrome_options, create_chrome_driver
+
+
+def test_text_profile_blocks_images_and_returns_early():
+    options = build_chrome_options(block_profile='text')
+
+    assert '--headless' in options.arguments
+    assert '--blink-settings=imagesEnabled=false' in options.arguments
+    assert options.experimental_options['prefs'] == {'profile.managed_default_content_settings.images': 2}
+    assert options.page_load_strategy == 'eager'
+
+
+def test_none_and_unknown_profiles_block_nothing():
+    for profile in ('none', 'unknown'):
+        options = build_chrome_options(headless=False, block_profile=profile, user_agent=None)
+        assert '--headless' not in options.arguments
+        assert '--blink-settings=imagesEnabled=false' not in options.arguments
+        assert not any(argument.startswith('--user-agent') for argument in options.arguments)
+        assert options.page_load_strategy == 'normal'
+
+
+def test_extra_arguments_appended():
+    options = build_chrome_options(extra_arguments=['--lang=ko-KR'], window_size='800,600')
+
+    assert '--lang=ko-KR' in options.arguments
+    assert '--window-size=800,600' in options.arguments
+
+
+class Driver:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.commands = []
+        self.timeout = None
+
+    def execute_cdp_cmd(self, command, params):
+        if self.fail:
+            raise Exception('CDP not supported')
+        self.commands.append((command, params))
+
+    def set_page_load_timeout(self, timeout):
+        self.timeout = timeout
+
+
+def test_apply_resource_blocking():
+    driver = Driver()
+
+    assert apply_resource_blocking(driver, ['*.png'])
+    assert driver.commands == [('Network.enable', {}), ('Network.setBlockedURLs', {'urls': ['*.png']})]
+    assert not apply_resource_blocking(Driver(), [])
+    assert not apply_resource_blocking(Driver(fail=True), ['*.png'])
+
+
+@pytest.mark.parametrize('profile, blocked, expected', [
+    ('text', ['*ads*'], webdriver_factory.IMAGE_PATTERNS + webdriver_factory.FONT_PATTERNS
+     + webdriver_factory.STYLESHEET_PATTERNS + webdriver_factory.THIRD_PARTY_PATTERNS + ['*ads*']),
+    ('layout', None, webdriver_factory.IMAGE_PATTERNS + webdriver_factory.FONT_PATTERNS
+     + webdriver_factory.THIRD_PARTY_PATTERNS),
+])
+def test_create_chrome_driver_applies_profile_patterns(monkeypatch, profile, blocked, expected):
+    driver = Driver()
+    monkeypatch.setattr(webdriver_factory.webdriver, 'Chrome', lambda options: driver)
+
+    assert create_chrome_driver(block_profile=profile, blocked_url_patterns=blocked, page_load_timeout=30) is driver
+    assert driver.commands[-1] == ('Network.setBlockedURLs', {'urls': expected})
+    assert driver.timeout == 30
+
+
+def test_create_chrome_driver_without_blocking(monkeypatch):
+    driver = Driver()
+    monkeypatch.setattr(webdriver_factory.webdriver, 'Chrome', lambda options: driver)
+
+    create_chrome_driver(block_profile='none')
+
+    assert driver.commands == []
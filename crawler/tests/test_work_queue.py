@@ -0,0 +1,121 @@
+"""샤드 작업 큐 테스트"""
+import pytest
+
+from crawler import work_queue as work_queue_module
+from crawler.work_queue import SharedPolitenessDelay, ShardWorkQueue
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(work_queue_module.time, 'time', fake.time)
+    return fake
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    queue = ShardWorkQueue(tmp_path / 'work_queue.sqlite3', lease_secs=60, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_seed_is_idempotent(queue):
+    assert queue.seed(range(1, 4)) == 3
+    assert queue.seed(range(1, 6)) == 2
+    assert queue.counts() == {'pending': 5}
+
+
+def test_max_page(queue):
+    assert queue.max_page() is None
+    queue.seed([3, 1, 2])
+    assert queue.max_page() == 3
+
+
+def test_claim_in_page_order_without_overlap(queue):
+    queue.seed(range(1, 6))
+    assert queue.claim('w1', 2) == [1, 2]
+    assert queue.claim('w2', 2) == [3, 4]
+    assert queue.claim('w1', 5) == [5]
+    assert queue.claim('w2') == []
+    assert queue.counts() == {'claimed': 5}
+
+
+def test_complete_records_items(queue):
+    queue.seed([1])
+    queue.claim('w1')
+    queue.complete(1, 10)
+    assert queue.counts() == {'done': 1}
+    assert queue.conn.execute("SELECT items FROM pages WHERE page = 1").fetchone() == (10,)
+    assert queue.claim('w2') == []
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    queue.seed([1])
+    assert queue.claim('dead') == [1]
+    assert queue.in_progress() == (1, 60)
+
+    clock.now += 30
+    assert queue.claim('w2') == []
+    assert queue.in_progress() == (1, 30)
+
+    clock.now += 31
+    assert queue.in_progress() == (1, 0)
+    assert queue.claim('w2') == [1]
+    assert queue.conn.execute("SELECT worker, attempts FROM pages").fetchone() == ('w2', 2)
+
+
+def test_fail_returns_page_until_max_attempts(queue):
+    queue.seed([1])
+    queue.claim('w1')
+    queue.fail(1)
+    assert queue.counts() == {'pending': 1}
+
+    assert queue.claim('w2') == [1]
+    queue.fail(1)
+    assert queue.counts() == {'failed': 1}
+    assert queue.claim('w3') == []
+    assert queue.in_progress() == (0, None)
+
+
+def test_expired_lease_without_attempts_left_is_failed(queue, clock):
+    queue.seed([1])
+    queue.claim('w1')
+    queue.fail(1)
+    queue.claim('dead')  # 마지막 시도 중 종료된 워커
+
+    clock.now += 61
+    assert queue.claim('w2') == []
+    assert queue.counts() == {'failed': 1}
+    assert queue.in_progress() == (0, None)
+
+
+def test_reserve_slot_spaces_requests_per_host(queue, clock):
+    assert queue.reserve_slot('a.example', 1.0) == 0
+    assert queue.reserve_slot('a.example', 1.0) == 1.0
+    assert queue.reserve_slot('a.example', 1.0) == 2.0
+    assert queue.reserve_slot('b.example', 1.0) == 0  # 호스트별로 따로 예약
+
+    clock.now += 5
+    assert queue.reserve_slot('a.example', 1.0) == 0
+    assert queue.reserve_slot('a.example', 0) == 0
+
+
+def test_reservations_shared_between_connections(tmp_path, clock):
+    path = tmp_path / 'work_queue.sqlite3'
+    first, second = ShardWorkQueue(path), ShardWorkQueue(path)
+    try:
+        politeness = SharedPolitenessDelay(first, {'knrec.or.kr': 0.5})
+        assert politeness.reserve('https://www.knrec.or.kr/biz/faq/faq_list01.do') == 0
+        other = SharedPolitenessDelay(second, {'knrec.or.kr': 0.5})
+        assert other.reserve('https://www.knrec.or.kr/biz/faq/faq_view.do?no=1') == 0.5
+    finally:
+        first.close()
+        second.close()
@@ -3,14 +3,23 @@ RAG 시스템을 위한 텍스트 전처리 모듈
 한국어 FAQ 데이터를 정제하고 구조화합니다.
 """
 
+import os
 import re
+import sys
 import json
 import pandas as pd
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator, Iterable
 from pathlib import Path
 import html
 from datetime import datetime
 
+# 크롤링 결과 파일 읽기는 크롤러의 common.utils를 그대로 사용
+CRAWLER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'crawler')
+if CRAWLER_DIR not in sys.path:
+    sys.path.append(CRAWLER_DIR)
+
+from common.utils import iter_output_items
+
 class KoreanTextPreprocessor:
     """한국어 텍스트 전처리 클래스"""
     
@@ -181,58 +190,74 @@ class FAQPreprocessor:
         self.text_processor = KoreanTextPreprocessor()
         self.stats = {}
     
-    def load_data(self, file_path: str) -> List[Dict]:
-        """FAQ 데이터 로드"""
+    def load_data(self, file_path: str, columns: List[str] = None) -> List[Dict]:
+        """
+        FAQ 데이터 전체를 리스트로 로드 (JSON 배열, JSON Lines 또는 Parquet)
+        큰 파일은 iter_data 결과를 preprocess_dataset에 바로 넘겨 한 건씩 처리
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = list(self.iter_data(file_path, columns))
             print(f"✅ 데이터 로드 완료: {len(data)}개 FAQ")
             return data
         except Exception as e:
             print(f"❌ 데이터 로드 실패: {e}")
             return []
     
-    def preprocess_dataset(self, data: List[Dict]) -> List[Dict]:
-        """전체 데이터셋 전처리"""
+    def iter_data(self, file_path: str, columns: List[str] = None) -> Iterator[Dict]:
+        """
+        FAQ 데이터를 하나씩 반환 (common.utils.iter_output_items 사용)
+        .jsonl / .jsonl.gz / .jsonl.zst는 한 줄씩 읽어 전체 파일을 메모리에 올리지 않음
+        .parquet은 메모리 맵으로 필요한 컬럼(columns)만 배치 단위로 읽음 (pyarrow 필요)
+        """
+        return iter_output_items(file_path, columns=columns)
+    
+    def preprocess_dataset(self, data: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        데이터셋 전처리 (한 건씩 처리하여 반환)
+        iter_data 결과를 넘기면 파일 전체를 메모리에 올리지 않으며, 통계는 모두 처리한 뒤 self.stats에 기록
+        """
         print("🔄 텍스트 전처리 시작...")
         
-        processed_data = []
-        original_lengths = []
-        processed_lengths = []
+        count = 0
+        original_total = 0
+        processed_total = 0
+        total_chunks = 0
         
-        for i, faq in enumerate(data):
-            if i % 50 == 0:
-                print(f"진행률: {i}/{len(data)} ({i/len(data)*100:.1f}%)")
+        for faq in data:
+            if count % 50 == 0:
+                print(f"진행률: {count}개 처리")
             
             # 원본 길이 기록
             original_text = (faq.get('title', '') + ' ' + faq.get('content', '')).strip()
-            original_lengths.append(len(original_text))
+            original_total += len(original_text)
             
             # 전처리 수행
             processed_faq = self.text_processor.process_faq(faq)
-            processed_data.append(processed_faq)
             
             # 처리 후 길이 기록
-            processed_lengths.append(processed_faq.get('text_length', 0))
+            processed_total += processed_faq.get('text_length', 0)
+            total_chunks += processed_faq.get('chunk_count', 0)
+            count += 1
+            
+            yield processed_faq
         
         # 통계 계산
         self.stats = {
-            'total_count': len(processed_data),
-            'original_avg_length': sum(original_lengths) / len(original_lengths) if original_lengths else 0,
-            'processed_avg_length': sum(processed_lengths) / len(processed_lengths) if processed_lengths else 0,
-            'total_chunks': sum(faq.get('chunk_count', 0) for faq in processed_data),
-            'avg_chunks_per_faq': sum(faq.get('chunk_count', 0) for faq in processed_data) / len(processed_data) if processed_data else 0
+            'total_count': count,
+            'original_avg_length': original_total / count if count else 0,
+            'processed_avg_length': processed_total / count if count else 0,
+            'total_chunks': total_chunks,
+            'avg_chunks_per_faq': total_chunks / count if count else 0
         }
         
-        print("✅ 텍스트 전처리 완료!")
-        return processed_data
+        print(f"✅ 텍스트 전처리 완료! ({count}개 FAQ)")
     
-    def remove_duplicates(self, data: List[Dict]) -> List[Dict]:
-        """중복 제거"""
+    def remove_duplicates(self, data: Iterable[Dict]) -> Iterator[Dict]:
+        """중복 제거 (처음 나온 FAQ만 반환, 비교용 서명만 보관)"""
         print("🔄 중복 제거 시작...")
         
         seen_texts = set()
-        unique_data = []
+        unique_count = 0
         duplicate_count = 0
         
         for faq in data:
@@ -243,18 +268,22 @@ class FAQPreprocessor:
             
             if text_signature not in seen_texts:
                 seen_texts.add(text_signature)
-                unique_data.append(faq)
+                unique_count += 1
+                yield faq
             else:
                 duplicate_count += 1
         
-        print(f"✅ 중복 제거 완료: {duplicate_count}개 중복 제거, {len(unique_data)}개 유지")
-        return unique_data
+        print(f"✅ 중복 제거 완료: {duplicate_count}개 중복 제거, {unique_count}개 유지")
     
-    def save_processed_data(self, data: List[Dict], output_path: str) -> str:
-        """전처리된 데이터 저장"""
+    def save_processed_data(self, data: Iterable[Dict], output_path: str) -> str:
+        """전처리된 데이터를 JSON 배열로 저장 (한 건씩 기록)"""
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write('[')
+                for i, faq in enumerate(data):
+                    f.write(',\n' if i else '\n')
+                    f.write(json.dumps(faq, ensure_ascii=False, indent=2))
+                f.write('\n]')
             
             print(f"✅ 전처리된 데이터 저장: {output_path}")
             return output_path
@@ -307,10 +336,8 @@ def main():
     # 전처리기 초기화
     preprocessor = FAQPreprocessor()
     
-    # 데이터 로드
-    data = preprocessor.load_data(input_file)
-    if not data:
-        return
+    # 데이터를 한 건씩 읽어 전처리 → 중복 제거 → 저장 (전체 파일을 메모리에 올리지 않음)
+    data = preprocessor.iter_data(input_file)
     
     # 전처리 수행
     processed_data = preprocessor.preprocess_dataset(data)
@@ -319,7 +346,11 @@ def main():
     unique_data = preprocessor.remove_duplicates(processed_data)
     
     # 저장
-    preprocessor.save_processed_data(unique_data, output_file)
+    if not preprocessor.save_processed_data(unique_data, output_file):
+        return
+    if not preprocessor.stats.get('total_count'):
+        print("❌ 전처리할 FAQ 데이터가 없습니다")
+        return
     
     # 보고서 생성
     report = preprocessor.generate_preprocessing_report()